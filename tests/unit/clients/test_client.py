@@ -0,0 +1,83 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from xrpl.asyncio.clients.client import REQUEST_TIMEOUT, Client
+from xrpl.models.requests import AccountInfo, Fee, ServerInfo
+from xrpl.models.requests.request import RequestMethod
+from xrpl.models.response import Response, ResponseStatus
+
+
+class _Client(Client):
+    def __init__(self):
+        super().__init__("node")
+        self.requests = []
+        self.error = None
+
+    async def _request_impl(self, request, *, timeout=REQUEST_TIMEOUT):
+        return await self._coalesce(request, timeout, lambda: self._send(request))
+
+    async def _send(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return Response(status=ResponseStatus.SUCCESS, result={"n": len(self.requests)})
+
+
+class TestCoalescing(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = _Client()
+        self.client.coalesce_methods = {RequestMethod.FEE, RequestMethod.ACCOUNT_INFO}
+
+    async def test_identical_requests_share_a_response(self):
+        responses = await asyncio.gather(
+            *(self.client._request_impl(Fee(id=i)) for i in range(5)),
+            self.client._request_impl(AccountInfo(account="r1")),
+            self.client._request_impl(AccountInfo(account="r2")),
+        )
+        self.assertEqual(len(self.client.requests), 3)
+        self.assertEqual(self.client.coalesced_requests, {RequestMethod.FEE: 4})
+        # each caller gets its own copy of the response, with its own id
+        self.assertEqual([response.id for response in responses[:5]], list(range(5)))
+        result = responses[1].result
+        self.assertTrue(all(response.result == result for response in responses[:5]))
+        responses[0].result["n"] = 100
+        self.assertEqual(responses[1].result, result)
+
+        # a request that is no longer in flight is sent again
+        await self.client._request_impl(Fee())
+        self.assertEqual(len(self.client.requests), 4)
+        self.assertEqual(self.client._in_flight, {})
+
+    async def test_different_timeouts_are_not_coalesced(self):
+        await asyncio.gather(
+            self.client._request_impl(Fee(), timeout=1),
+            self.client._request_impl(Fee(), timeout=30),
+            self.client._request_impl(Fee(), timeout=30),
+        )
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertEqual(self.client.coalesced_requests, {RequestMethod.FEE: 1})
+
+    async def test_methods_are_opt_in(self):
+        await asyncio.gather(
+            *(self.client._request_impl(ServerInfo()) for _ in range(3))
+        )
+        self.assertEqual(len(self.client.requests), 3)
+        self.assertEqual(sum(self.client.coalesced_requests.values()), 0)
+
+    async def test_errors_are_shared(self):
+        self.client.error = ConnectionError("the node is down")
+        results = await asyncio.gather(
+            *(self.client._request_impl(Fee()) for _ in range(3)),
+            return_exceptions=True,
+        )
+        self.assertEqual(len(self.client.requests), 1)
+        self.assertTrue(all(result is self.client.error for result in results))
+
+    async def test_cancelling_a_caller(self):
+        first = asyncio.ensure_future(self.client._request_impl(Fee()))
+        second = asyncio.ensure_future(self.client._request_impl(Fee()))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertTrue((await second).is_successful())
+        self.assertEqual(len(self.client.requests), 1)
@@ -0,0 +1,181 @@
+import asyncio
+import random
+from collections import deque
+from time import monotonic
+from unittest import IsolatedAsyncioTestCase
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient, ClientPool, PoolPolicy
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.client import REQUEST_TIMEOUT
+from xrpl.asyncio.ledger import get_latest_validated_ledger_sequence
+from xrpl.clients import JsonRpcClient
+from xrpl.models.requests import Fee, ServerInfo
+from xrpl.models.requests.request import RequestMethod
+from xrpl.models.response import Response, ResponseStatus
+
+_HEALTHY_INFO = {
+    "server_state": "full",
+    "validated_ledger": {"age": 2, "seq": 5},
+    "load_factor": 1,
+}
+
+
+class _Client(AsyncClient):
+    def __init__(self, url, latency=0.0, info=_HEALTHY_INFO):
+        super().__init__(url)
+        self.latency = latency
+        self.info = info
+        self.requests = []
+
+    async def _request_impl(self, request, *, timeout=REQUEST_TIMEOUT):
+        await asyncio.sleep(self.latency)
+        if request.method == RequestMethod.SERVER_INFO:
+            if self.info is None:
+                raise ConnectionError("the node is down")
+            if self.info == "malformed":
+                return Response(status=ResponseStatus.SUCCESS, result={})
+            return Response(status=ResponseStatus.SUCCESS, result={"info": self.info})
+        self.requests.append(request.method)
+        return Response(
+            status=ResponseStatus.SUCCESS, result={"ledger_index": 5, "url": self.url}
+        )
+
+
+class _HeavyTailClient(_Client):
+    def __init__(self, url, rng):
+        super().__init__(url)
+        self.rng = rng
+
+    async def _request_impl(self, request, *, timeout=REQUEST_TIMEOUT):
+        # Pareto distributed latencies from 5ms, capped at 100ms
+        self.latency = min(0.005 * self.rng.paretovariate(0.8), 0.1)
+        return await super()._request_impl(request, timeout=timeout)
+
+
+class TestClientPool(IsolatedAsyncioTestCase):
+    async def test_round_robin(self):
+        clients = [_Client(f"node{i}") for i in range(3)]
+        pool = ClientPool(clients)
+        for _ in range(6):
+            await pool.request(Fee())
+        self.assertEqual([len(client.requests) for client in clients], [2, 2, 2])
+
+    async def test_least_outstanding(self):
+        clients = [_Client("slow", latency=0.05), _Client("fast", latency=0.001)]
+        pool = ClientPool(clients, policy=PoolPolicy.LEAST_OUTSTANDING)
+        await pool.request_many([Fee()] * 20, max_in_flight=4)
+        self.assertGreater(len(clients[1].requests), len(clients[0].requests))
+        self.assertEqual(sum(endpoint.outstanding for endpoint in pool.endpoints), 0)
+
+    async def test_latency_ewma(self):
+        clients = [_Client("slow", latency=0.02), _Client("fast", latency=0.001)]
+        pool = ClientPool(clients, policy=PoolPolicy.LATENCY_EWMA)
+        for _ in range(10):
+            await pool.request(Fee())
+        # each endpoint is measured once, then the fast one is preferred
+        self.assertEqual(len(clients[0].requests), 1)
+        self.assertEqual(len(clients[1].requests), 9)
+        self.assertLess(pool.endpoints[1].latency_ewma, pool.endpoints[0].latency_ewma)
+
+    async def test_custom_policy(self):
+        clients = [_Client("first"), _Client("last")]
+        pool = ClientPool(clients, policy=lambda endpoints: endpoints[-1])
+        await pool.request(Fee())
+        self.assertEqual(clients[1].requests, [RequestMethod.FEE])
+
+    async def test_health_checks_eject_nodes(self):
+        clients = [
+            _Client("syncing", info={**_HEALTHY_INFO, "server_state": "syncing"}),
+            _Client("lagging", info={**_HEALTHY_INFO, "validated_ledger": {"age": 60}}),
+            _Client("loaded", info={**_HEALTHY_INFO, "load_factor": 1000}),
+            _Client("down", info=None),
+            _Client("malformed", info="malformed"),
+            _Client("unvalidated", info={**_HEALTHY_INFO, "validated_ledger": None}),
+            _Client("healthy"),
+        ]
+        async with ClientPool(clients, max_load_factor=100) as pool:
+            self.assertEqual(
+                [endpoint.healthy for endpoint in pool.endpoints],
+                [False, False, False, False, False, False, True],
+            )
+            self.assertEqual(pool.endpoints[1].ledger_age, 60)
+            # the helper functions run against the pool unchanged
+            for _ in range(5):
+                self.assertEqual(await get_latest_validated_ledger_sequence(pool), 5)
+            self.assertEqual(len(clients[6].requests), 5)
+
+            # a node that caught up gets requests again
+            clients[1].info = _HEALTHY_INFO
+            await pool.check_health()
+            self.assertTrue(pool.endpoints[1].healthy)
+        self.assertFalse(pool.is_open())
+
+    async def test_periodic_health_checks(self):
+        client = _Client("node")
+        async with ClientPool([client], health_check_interval=0.01) as pool:
+            client.info = {**_HEALTHY_INFO, "server_state": "connected"}
+            await asyncio.sleep(0.05)
+            self.assertFalse(pool.endpoints[0].healthy)
+            # the checks go on after an unexpected result
+            client.info = "malformed"
+            await asyncio.sleep(0.05)
+            client.info = _HEALTHY_INFO
+            await asyncio.sleep(0.05)
+            self.assertTrue(pool.endpoints[0].healthy)
+            health_check_task = pool._health_check_task
+            client.info = {**_HEALTHY_INFO, "server_state": "connected"}
+            await asyncio.sleep(0.05)
+            # with no healthy nodes, requests go to all of them
+            await pool.request(Fee())
+            self.assertEqual(client.requests, [RequestMethod.FEE])
+        self.assertTrue(health_check_task.done())
+
+    async def test_hedged_requests(self):
+        clients = [_Client("slow", latency=0.5), _Client("fast", latency=0.001)]
+        pool = ClientPool(clients, hedge_methods=[RequestMethod.FEE])
+        # requests are hedged once there are enough latencies to compare with
+        pool._latencies[RequestMethod.FEE] = deque([0.01] * 20)
+        start = monotonic()
+        response = await pool.request(Fee())
+        self.assertLess(monotonic() - start, 0.25)
+        self.assertEqual(response.result["url"], "fast")
+        self.assertEqual((pool.hedged_requests, pool.hedge_wins), (1, 1))
+        # the slow request was cancelled
+        await asyncio.sleep(0)
+        self.assertEqual(clients[0].requests, [])
+        self.assertEqual(pool.endpoints[0].outstanding, 0)
+
+        # methods that are not hedged wait for the slow node
+        await pool.request(ServerInfo())
+        self.assertEqual(pool.hedged_requests, 1)
+
+    async def test_hedge_rate_with_heavy_tail(self):
+        rng = random.Random(7)
+        clients = [_HeavyTailClient(f"node{i}", rng) for i in range(3)]
+        pool = ClientPool(
+            clients, hedge_methods=[RequestMethod.FEE], hedge_percentile=80
+        )
+        await pool.request_many([Fee()] * 100, max_in_flight=10)
+        hedged_requests = pool.hedged_requests
+        await pool.request_many([Fee()] * 400, max_in_flight=10)
+        # about 20% of requests are slower than the 80th percentile. the fast answers
+        # of hedges and the cancelled slow requests must not lower the hedging delay
+        self.assertLess(abs((pool.hedged_requests - hedged_requests) / 400 - 0.2), 0.06)
+
+    async def test_submit_is_never_hedged(self):
+        for method in [RequestMethod.SUBMIT, RequestMethod.SUBMIT_MULTISIGNED]:
+            with self.assertRaises(ValueError):
+                ClientPool([_Client("node")] * 2, hedge_methods=[method])
+
+    async def test_sync_clients_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ClientPool([_Client("node"), JsonRpcClient("http://127.0.0.1:1")])
+
+    async def test_nested_clients_are_opened_and_closed(self):
+        json_rpc_client = AsyncJsonRpcClient("http://127.0.0.1:1")
+        inner = ClientPool([_Client("node"), json_rpc_client])
+        async with ClientPool([inner, _Client("other")]):
+            self.assertTrue(inner.is_open())
+            self.assertTrue(json_rpc_client.is_open())
+        self.assertFalse(inner.is_open())
+        self.assertFalse(json_rpc_client.is_open())
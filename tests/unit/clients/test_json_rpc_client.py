@@ -0,0 +1,176 @@
+import asyncio
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.clients import JsonRpcClient
+from xrpl.models.requests import AccountInfo, Fee, Ping
+from xrpl.models.requests.request import RequestMethod
+
+_ACCOUNTS = [f"r{i}" for i in range(40)]
+
+
+def _result(request):
+    # pings fail as a whole, to check that other requests are not affected
+    if request["method"] == "ping":
+        return {"error": "unknownCmd"}
+    account = request["params"][0].get("account")
+    return {
+        "result": {"status": "success", "method": request["method"], "account": account}
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # called once per connection
+        self.server.connections += 1
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+            self.server.posts += 1
+        time.sleep(0.01)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        if request["method"] == "batch":
+            body = json.dumps([_result(r) for r in request["params"]]).encode()
+        elif request["method"] == "ping":
+            body = b"Internal Server Error"
+        else:
+            body = json.dumps(_result(request)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ServerTestCase:
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.connections = 0
+        self.server.posts = 0
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.lock = Lock()
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestJsonRpcClient(_ServerTestCase, TestCase):
+    def test_closed_client_connects_per_request(self):
+        client = JsonRpcClient(self.url)
+        self.assertFalse(client.is_open())
+        for _ in range(3):
+            self.assertTrue(client.request(Fee()).is_successful())
+        self.assertEqual(self.server.connections, 3)
+
+    def test_open_client_reuses_connection(self):
+        with JsonRpcClient(self.url, max_connections=1) as client:
+            self.assertTrue(client.is_open())
+            for _ in range(3):
+                self.assertEqual(client.request(Fee()).result["method"], "fee")
+        self.assertFalse(client.is_open())
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reopen(self):
+        client = JsonRpcClient(self.url)
+        client.open()
+        client.open()
+        client.request(Fee())
+        client.close()
+        client.close()
+        client.open()
+        client.request(Fee())
+        client.close()
+        self.assertEqual(self.server.connections, 2)
+
+    def _check_responses(self, responses):
+        self.assertEqual(len(responses), len(_ACCOUNTS) + 1)
+        for account, response in zip(_ACCOUNTS[:10], responses[:10]):
+            self.assertEqual(response.result["account"], account)
+        self.assertIsInstance(responses[10], XRPLRequestFailureException)
+        for account, response in zip(_ACCOUNTS[10:], responses[11:]):
+            self.assertEqual(response.result["account"], account)
+
+    def _requests(self):
+        requests = [AccountInfo(account=account) for account in _ACCOUNTS]
+        requests.insert(10, Ping())
+        return requests
+
+    def _check_request_many(self, client):
+        responses = client.request_many(self._requests(), max_in_flight=4)
+        self._check_responses(responses)
+        self.assertEqual(self.server.posts, len(_ACCOUNTS) + 1)
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        # the requests share the connections of the window
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_request_many(self):
+        self._check_request_many(JsonRpcClient(self.url))
+
+    def test_request_many_open_client(self):
+        with JsonRpcClient(self.url) as client:
+            self._check_request_many(client)
+
+    def test_request_many_in_batches(self):
+        with JsonRpcClient(self.url, max_batch_size=10) as client:
+            responses = client.request_many(self._requests())
+        # the batch with the ping gets an error result for it
+        self.assertEqual(self.server.posts, 5)
+        self.assertEqual(len(responses), len(_ACCOUNTS) + 1)
+        self.assertIsInstance(responses[10], XRPLRequestFailureException)
+        for account, response in zip(_ACCOUNTS, responses[:10] + responses[11:]):
+            self.assertEqual(response.result["account"], account)
+
+
+class TestAsyncJsonRpcClient(_ServerTestCase, IsolatedAsyncioTestCase):
+    async def test_open_client_reuses_connection(self):
+        async with AsyncJsonRpcClient(self.url, max_connections=1) as client:
+            self.assertTrue(client.is_open())
+            for _ in range(3):
+                self.assertTrue((await client.request(Fee())).is_successful())
+        self.assertFalse(client.is_open())
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_closed_client_connects_per_request(self):
+        client = AsyncJsonRpcClient(self.url)
+        for _ in range(2):
+            await client.request(Fee())
+        self.assertEqual(self.server.connections, 2)
+
+    async def test_request_many(self):
+        requests = [AccountInfo(account=account) for account in _ACCOUNTS]
+        async with AsyncJsonRpcClient(self.url) as client:
+            responses = await client.request_many(requests, max_in_flight=8)
+            self.assertEqual(await client.request_many([]), [])
+        self.assertEqual(
+            [response.result["account"] for response in responses], _ACCOUNTS
+        )
+        self.assertLessEqual(self.server.max_in_flight, 8)
+
+    async def test_coalescing(self):
+        client = AsyncJsonRpcClient(self.url)
+        client.coalesce_methods.add(RequestMethod.FEE)
+        responses = await asyncio.gather(*(client.request(Fee()) for _ in range(5)))
+        self.assertTrue(all(response.is_successful() for response in responses))
+        self.assertEqual(self.server.posts, 1)
+        self.assertEqual(client.coalesced_requests[RequestMethod.FEE], 4)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from websockets import serve
+
+from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.clients import WebsocketClient
+from xrpl.models.requests import AccountInfo
+
+_ACCOUNTS = [f"r{i}" for i in range(40)]
+
+
+class _Server:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _respond(self, websocket, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # answer later requests first, as rippled may
+        await asyncio.sleep(0.01 * (1 + int(request["account"][1:]) % 3))
+        self.in_flight -= 1
+        if request["account"] == "r13":
+            response = {"id": request["id"], "status": "error", "error": "actNotFound"}
+        else:
+            response = {
+                "id": request["id"],
+                "status": "success",
+                "type": "response",
+                "result": {"account": request["account"]},
+            }
+        await websocket.send(json.dumps(response))
+
+    async def handler(self, websocket):
+        tasks = set()
+        async for message in websocket:
+            task = asyncio.create_task(self._respond(websocket, json.loads(message)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+
+class _ServerTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = _Server()
+        self.websocket_server = await serve(self.server.handler, "127.0.0.1", 0)
+        port = next(iter(self.websocket_server.sockets)).getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+
+    async def asyncTearDown(self):
+        self.websocket_server.close()
+        await self.websocket_server.wait_closed()
+
+    def _check_responses(self, responses):
+        self.assertEqual(len(responses), len(_ACCOUNTS))
+        for account, response in zip(_ACCOUNTS, responses):
+            if account == "r13":
+                self.assertFalse(response.is_successful())
+            else:
+                self.assertEqual(response.result["account"], account)
+
+
+class TestAsyncWebsocketClient(_ServerTestCase):
+    async def test_request_many(self):
+        requests = [AccountInfo(account=account) for account in _ACCOUNTS]
+        async with AsyncWebsocketClient(self.url) as client:
+            responses = await client.request_many(requests, max_in_flight=8)
+        self._check_responses(responses)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 8)
+
+    async def test_request_many_duplicate_id(self):
+        requests = [
+            AccountInfo(account=account, id="same") for account in _ACCOUNTS[:2]
+        ]
+        async with AsyncWebsocketClient(self.url) as client:
+            responses = await client.request_many(requests)
+        self.assertEqual(responses[0].result["account"], _ACCOUNTS[0])
+        self.assertIsInstance(responses[1], XRPLWebsocketException)
+
+    async def test_request_many_closed(self):
+        with self.assertRaises(XRPLWebsocketException):
+            await AsyncWebsocketClient(self.url).request_many([])
+
+
+class TestWebsocketClient(_ServerTestCase):
+    async def test_request_many(self):
+        requests = [AccountInfo(account=account) for account in _ACCOUNTS]
+
+        def request_many():
+            with WebsocketClient(self.url) as client:
+                return client.request_many(requests, max_in_flight=8)
+
+        # the sync client blocks, so it runs beside the event loop of the server
+        responses = await asyncio.get_running_loop().run_in_executor(None, request_many)
+        self._check_responses(responses)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 8)
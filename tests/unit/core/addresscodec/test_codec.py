@@ -157,6 +157,75 @@ class TestCodec(TestCase):
             hex_string_bytes,
         )
 
+    def test_classic_address_encode_decode_many(self):
+        hex_strings = [
+            "BA8E78626EE42C41B46D46C3048DF3A1C3C87072",
+            "0000000000000000000000000000000000000000",
+            "BA8E78626EE42C41B46D46C3048DF3A1C3C87072",
+        ]
+        encoded_strings = [
+            "rJrRMgiRgrU6hDF4pgu5DXQdWyPbY35ErN",
+            "rrrrrrrrrrrrrrrrrrrrrhoLvTp",
+            "rJrRMgiRgrU6hDF4pgu5DXQdWyPbY35ErN",
+        ]
+        hex_strings_bytes = [bytes.fromhex(hex_string) for hex_string in hex_strings]
+
+        encode_result = addresscodec.encode_classic_addresses(hex_strings_bytes)
+        self.assertEqual(encode_result, encoded_strings)
+
+        decode_result = addresscodec.decode_classic_addresses(encoded_strings)
+        self.assertEqual(decode_result, hex_strings_bytes)
+
+    def test_classic_address_cache(self):
+        hex_string_bytes = bytes.fromhex("BA8E78626EE42C41B46D46C3048DF3A1C3C87072")
+        encoded_string = "rJrRMgiRgrU6hDF4pgu5DXQdWyPbY35ErN"
+        self.addCleanup(
+            addresscodec.set_classic_address_cache_size,
+            addresscodec.DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE,
+        )
+        addresscodec.set_classic_address_cache_size(1)
+
+        for _ in range(3):
+            addresscodec.encode_classic_address(bytearray(hex_string_bytes))
+            addresscodec.decode_classic_address(encoded_string)
+        self.assertEqual(
+            addresscodec.get_classic_address_cache_info(),
+            addresscodec.ClassicAddressCacheInfo(
+                hits=4, misses=2, maxsize=1, currsize=2
+            ),
+        )
+
+        # invalid addresses are not cached
+        self.assertFalse(addresscodec.is_valid_classic_address("rInvalid"))
+        self.assertEqual(addresscodec.get_classic_address_cache_info().currsize, 2)
+
+        addresscodec.clear_classic_address_cache()
+        self.assertEqual(
+            addresscodec.get_classic_address_cache_info(),
+            addresscodec.ClassicAddressCacheInfo(
+                hits=0, misses=0, maxsize=1, currsize=0
+            ),
+        )
+
+    def test_classic_address_cache_disabled(self):
+        self.addCleanup(
+            addresscodec.set_classic_address_cache_size,
+            addresscodec.DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE,
+        )
+        addresscodec.set_classic_address_cache_size(0)
+        encoded_string = "rJrRMgiRgrU6hDF4pgu5DXQdWyPbY35ErN"
+
+        for _ in range(2):
+            addresscodec.decode_classic_address(encoded_string)
+        info = addresscodec.get_classic_address_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 2, 0))
+
+        self.assertRaises(
+            addresscodec.XRPLAddressCodecException,
+            addresscodec.set_classic_address_cache_size,
+            -1,
+        )
+
     # node_public_key test
 
     def test_node_public_key_encode_decode(self):
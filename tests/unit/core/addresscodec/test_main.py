@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 from tests.unit.core.addresscodec.test_main_test_cases import test_cases
 from xrpl.core import addresscodec
@@ -168,3 +169,18 @@ class TestMain(TestCase):
 
         result = addresscodec.is_valid_xaddress(xaddress)
         self.assertFalse(result)
+
+    def test_is_valid_xaddress_skips_decoding_other_strings(self):
+        with patch(
+            "xrpl.core.addresscodec.main.xaddress_to_classic_address"
+        ) as mock_decode:
+            for value in [
+                "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+                "X7AcgcsBL6XDcUb289X4mJ8djcdyKaB5hJDWMArnXr61cq",
+                "A7AcgcsBL6XDcUb289X4mJ8djcdyKaB5hJDWMArnXr61cqZ",
+                "X7AcgcsBL6XDcUb289X4mJ8djcdyKaB5hJDWMArnXr61cq0",
+                "ABCDEF0123456789ABCDEF0123456789ABCDEF0123456",
+            ]:
+                with self.subTest(value=value):
+                    self.assertFalse(addresscodec.is_valid_xaddress(value))
+            mock_decode.assert_not_called()
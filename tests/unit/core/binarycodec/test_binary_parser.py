@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from xrpl.core.binarycodec.binary_wrappers import BinaryParser, BinarySerializer
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.blob import Blob
 
 # Note that core field-reading logic will be tested by the implementation of
@@ -46,3 +47,33 @@ class TestBinaryParser(TestCase):
             binary_parser = BinaryParser(encoded_length)
             decoded_length = binary_parser._read_length_prefix()
             self.assertEqual(case, decoded_length)
+
+    def test_from_bytes_and_bytearray(self):
+        test_bytes = bytes.fromhex("01000200000003")
+        for buffer in [test_bytes, bytearray(test_bytes)]:
+            binary_parser = BinaryParser.from_bytes(buffer)
+            self.assertEqual(len(binary_parser), 7)
+            self.assertEqual(binary_parser.read_uint8(), 1)
+            self.assertEqual(binary_parser.read_uint16(), 2)
+            self.assertEqual(binary_parser.read_uint32(), 3)
+            self.assertTrue(binary_parser.is_end())
+            self.assertIsNone(binary_parser.peek())
+
+    def test_read_does_not_consume_past_end(self):
+        binary_parser = BinaryParser("0011")
+        binary_parser.skip(1)
+        self.assertEqual(len(binary_parser), 1)
+        with self.assertRaises(XRPLBinaryCodecException):
+            binary_parser.read(2)
+        with self.assertRaises(XRPLBinaryCodecException):
+            binary_parser.skip(2)
+        self.assertEqual(binary_parser.read_uint8(), 0x11)
+        with self.assertRaises(XRPLBinaryCodecException):
+            binary_parser.read_uint8()
+
+    def test_bytearray_buffer_is_not_copied(self):
+        buffer = bytearray(b"\x00\x01\x02\x03")
+        binary_parser = BinaryParser.from_bytes(buffer)
+        binary_parser.skip(1)
+        buffer[2] = 0xFF
+        self.assertEqual(binary_parser.read(2), b"\x01\xff")
@@ -2,7 +2,9 @@ from unittest import TestCase
 
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
 from xrpl.core.binarycodec.binary_wrappers.binary_serializer import BinarySerializer
+from xrpl.core.binarycodec.definitions import get_field_instance
 from xrpl.core.binarycodec.types.blob import Blob
+from xrpl.core.binarycodec.types.st_object import STObject
 
 
 class TestBinarySerializer(TestCase):
@@ -20,3 +22,33 @@ class TestBinarySerializer(TestCase):
             binary_parser = BinaryParser(bytes(binary_serializer).hex())
             decoded_length = binary_parser._read_length_prefix()
             self.assertEqual(case, decoded_length)
+
+    def test_write_into_existing_bytesink(self):
+        bytesink = bytearray(b"\x01\x02")
+        binary_serializer = BinarySerializer(bytesink)
+        binary_serializer.append(b"\x03")
+        self.assertIs(binary_serializer.bytesink, bytesink)
+        self.assertEqual(bytes(binary_serializer), b"\x01\x02\x03")
+        self.assertEqual(len(binary_serializer), 3)
+
+    def test_write_field_from_value_matches_write_field_and_value(self):
+        for field_name, value in [
+            ("Fee", "10"),
+            ("MemoData", "A2" * 20_000),
+            ("Amendments", ["42" * 32] * 10),
+        ]:
+            field = get_field_instance(field_name)
+            expected = BinarySerializer()
+            expected.write_field_and_value(
+                field, field.associated_type.from_value(value)
+            )
+            actual = BinarySerializer()
+            actual.write_field_from_value(field, value)
+            self.assertEqual(bytes(expected), bytes(actual))
+
+    def test_nested_objects_write_into_parent_bytesink(self):
+        value = {"Memo": {"MemoType": "74657874", "MemoData": "AB" * 300}}
+        bytesink = bytearray(b"\xff")
+        STObject.write_from_value(bytesink, value)
+        self.assertEqual(bytesink[0], 0xFF)
+        self.assertEqual(bytes(bytesink[1:]), bytes(STObject.from_value(value)))
@@ -0,0 +1,165 @@
+import json
+import os
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+from xrpl.core.addresscodec import decode_classic_address
+from xrpl.core.binarycodec import XRPLBinaryCodecException, decode_columns, encode
+from xrpl.core.binarycodec.types import Currency
+
+_PAGE_SIZE = 50
+
+
+def _load_account_state():
+    dirname = os.path.dirname(__file__)
+    absolute_path = os.path.join(dirname, "fixtures/data/codec-fixtures.json")
+    with open(absolute_path) as fixtures_file:
+        return json.load(fixtures_file)["accountState"]
+
+
+def _ledger_data_pages(entries):
+    for start in range(0, len(entries), _PAGE_SIZE):
+        yield {
+            "state": [
+                {"data": entry["binary"], "index": f"{i:064X}"}
+                for i, entry in enumerate(entries[start : start + _PAGE_SIZE], start)
+            ]
+        }
+
+
+def _raw(column, row):
+    # indexing a fixed-width bytes array drops trailing zero bytes
+    return column[row : row + 1].tobytes()
+
+
+def _amount(columns, row):
+    value = Decimal(int(columns.mantissa[row])).scaleb(int(columns.exponent[row]))
+    currency = _raw(columns.currency, row)
+    if currency == bytes(20):
+        return str(value)
+    return {
+        "currency": Currency(currency).to_json(),
+        "issuer": _raw(columns.issuer, row),
+        "value": value,
+    }
+
+
+def _expected_amount(amount):
+    if isinstance(amount, str):
+        return amount
+    return {
+        "currency": amount["currency"],
+        "issuer": decode_classic_address(amount["issuer"]),
+        "value": Decimal(amount["value"]),
+    }
+
+
+@skipUnless(find_spec("numpy"), "NumPy is not installed")
+class TestDecodeColumns(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.account_state = _load_account_state()
+
+    def _entries_of_type(self, ledger_entry_type):
+        return [
+            (i, entry["json"])
+            for i, entry in enumerate(self.account_state)
+            if entry["json"]["LedgerEntryType"] == ledger_entry_type
+        ]
+
+    def test_account_roots(self):
+        columns = decode_columns(
+            _ledger_data_pages(self.account_state),
+            "AccountRoot",
+            ["index", "Account", "Balance", "Sequence", "OwnerCount", "RegularKey"],
+        )
+        expected = self._entries_of_type("AccountRoot")
+        self.assertEqual(len(columns["Account"]), len(expected))
+        self.assertEqual(columns["Sequence"].dtype.name, "uint32")
+        self.assertEqual(columns["Balance"].mantissa.dtype.name, "int64")
+        for row, (i, entry) in enumerate(expected):
+            self.assertEqual(_raw(columns["index"], row), i.to_bytes(32, "big"))
+            self.assertEqual(
+                _raw(columns["Account"], row), decode_classic_address(entry["Account"])
+            )
+            self.assertEqual(_amount(columns["Balance"], row), entry["Balance"])
+            self.assertEqual(columns["Sequence"][row], entry["Sequence"])
+            self.assertEqual(columns["OwnerCount"][row], entry["OwnerCount"])
+            # missing fields are zeros
+            self.assertEqual(
+                _raw(columns["RegularKey"], row),
+                (
+                    decode_classic_address(entry["RegularKey"])
+                    if "RegularKey" in entry
+                    else bytes(20)
+                ),
+            )
+
+    def test_ripple_states_and_offers(self):
+        blobs = [entry["binary"] for entry in self.account_state]
+        for ledger_entry_type, amount_fields, hash_field in [
+            ("RippleState", ["Balance", "HighLimit", "LowLimit"], "PreviousTxnID"),
+            ("Offer", ["TakerGets", "TakerPays"], "BookDirectory"),
+        ]:
+            with self.subTest(ledger_entry_type=ledger_entry_type):
+                columns = decode_columns(
+                    blobs, ledger_entry_type, [*amount_fields, hash_field]
+                )
+                expected = self._entries_of_type(ledger_entry_type)
+                self.assertEqual(len(columns[hash_field]), len(expected))
+                for row, (_, entry) in enumerate(expected):
+                    for field in amount_fields:
+                        self.assertEqual(
+                            _amount(columns[field], row), _expected_amount(entry[field])
+                        )
+                    self.assertEqual(
+                        _raw(columns[hash_field], row).hex().upper(), entry[hash_field]
+                    )
+
+    def test_negative_and_zero_amounts(self):
+        ripple_state = {
+            "LedgerEntryType": "RippleState",
+            "Flags": 0,
+            "Balance": {
+                "currency": "USD",
+                "issuer": "rrrrrrrrrrrrrrrrrrrrBZbvji",
+                "value": "-12.5",
+            },
+            "HighLimit": {
+                "currency": "USD",
+                "issuer": "rLNaPoKeeBjZe2qs6x52yVPZpZ8td4dc6w",
+                "value": "0",
+            },
+        }
+        columns = decode_columns(
+            [encode(ripple_state)], "RippleState", ["Balance", "HighLimit"]
+        )
+        self.assertEqual(columns["Balance"].mantissa[0], -1250000000000000)
+        self.assertEqual(columns["Balance"].exponent[0], -14)
+        self.assertEqual(columns["HighLimit"].mantissa[0], 0)
+        self.assertEqual(columns["HighLimit"].exponent[0], 0)
+
+    def test_no_entries(self):
+        columns = decode_columns([], "AccountRoot", ["Account", "Balance"])
+        self.assertEqual(len(columns["Account"]), 0)
+        self.assertEqual(len(columns["Balance"].mantissa), 0)
+
+    def test_fields_missing_from_every_entry(self):
+        account_root = {"LedgerEntryType": "AccountRoot", "Flags": 0}
+        columns = decode_columns(
+            [encode(account_root)] * 2,
+            "AccountRoot",
+            ["Account", "Balance", "Sequence", "RegularKey"],
+        )
+        for field in ["Account", "RegularKey"]:
+            self.assertEqual(columns[field][0:2].tobytes(), bytes(40))
+        self.assertEqual(columns["Sequence"].tolist(), [0, 0])
+        self.assertEqual(columns["Balance"].mantissa.tolist(), [0, 0])
+        self.assertEqual(columns["Balance"].exponent.tolist(), [0, 0])
+
+    def test_unsupported_fields(self):
+        with self.assertRaises(XRPLBinaryCodecException):
+            decode_columns([], "AccountRoot", ["Memos"])
+        with self.assertRaises(XRPLBinaryCodecException):
+            decode_columns([], "NotALedgerEntry", ["Account"])
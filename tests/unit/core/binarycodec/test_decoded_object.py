@@ -0,0 +1,67 @@
+import json
+import os
+from unittest import TestCase
+
+from xrpl.core.binarycodec import DecodedObject, decode, decode_bytes, encode
+
+_FIELDS = {"TransactionType", "Account", "Sequence", "Fee", "TransactionResult"}
+
+
+def _load_fixtures():
+    dirname = os.path.dirname(__file__)
+    absolute_path = os.path.join(dirname, "fixtures/data/codec-fixtures.json")
+    with open(absolute_path) as fixtures_file:
+        fixtures_json = json.load(fixtures_file)
+    return fixtures_json["accountState"] + fixtures_json["transactions"]
+
+
+class TestDecodedObject(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = _load_fixtures()
+
+    def test_decode_with_fields(self):
+        for test in self.fixtures:
+            test_binary = test["binary"]
+            test_json = test["json"]
+            expected = {k: v for k, v in test_json.items() if k in _FIELDS}
+            with self.subTest(test_binary=test_binary):
+                self.assertEqual(decode(test_binary, fields=_FIELDS), expected)
+                self.assertEqual(
+                    decode_bytes(bytes.fromhex(test_binary), fields=_FIELDS),
+                    expected,
+                )
+
+    def test_decode_with_no_fields(self):
+        test_binary = self.fixtures[0]["binary"]
+        self.assertEqual(decode(test_binary, fields=[]), {})
+
+    def test_to_json(self):
+        for test in self.fixtures:
+            test_binary = test["binary"]
+            with self.subTest(test_binary=test_binary):
+                self.assertEqual(DecodedObject(test_binary).to_json(), test["json"])
+
+    def test_lazy_access(self):
+        tx_json = {
+            "TransactionType": "Payment",
+            "Account": "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ",
+            "Destination": "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+            "Amount": "1000",
+            "Fee": "10",
+            "Sequence": 1,
+            "Memos": [{"Memo": {"MemoData": "AB" * 300}}] * 3,
+        }
+        decoded = DecodedObject(bytes.fromhex(encode(tx_json)))
+        self.assertEqual(decoded["TransactionType"], "Payment")
+        self.assertEqual(decoded["Sequence"], 1)
+        self.assertEqual(decoded.get("Memos"), tx_json["Memos"])
+        self.assertIsNone(decoded.get("DestinationTag"))
+        self.assertIn("Account", decoded)
+        self.assertNotIn("TransactionResult", decoded)
+        self.assertEqual(len(decoded), len(tx_json))
+        self.assertEqual(set(decoded), set(tx_json))
+        with self.assertRaises(KeyError):
+            decoded["DestinationTag"]
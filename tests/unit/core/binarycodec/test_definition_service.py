@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 import xrpl.core.binarycodec.definitions.definitions as definitions
+from xrpl.core.binarycodec.binary_wrappers import BinaryParser
 
 
 class TestDefinitionService(TestCase):
@@ -53,3 +54,32 @@ class TestDefinitionService(TestCase):
         field_header = definitions.FieldHeader(2, 4)
         field_name = definitions.get_field_name_from_header(field_header)
         self.assertEqual(expected_field_name, field_name)
+
+    def test_get_field_instance_is_shared_and_immutable(self):
+        field_instance = definitions.get_field_instance(self.test_field_name)
+        self.assertIs(
+            field_instance, definitions.get_field_instance(self.test_field_name)
+        )
+        self.assertEqual(field_instance.header_bytes, bytes.fromhex("24"))
+        self.assertIsNone(field_instance.enum_name_from_code)
+        with self.assertRaises(AttributeError):
+            field_instance.nth = 5
+
+    def test_field_instance_enum_hooks(self):
+        field_instance = definitions.get_field_instance("TransactionType")
+        self.assertEqual(field_instance.enum_code_from_name("OfferCancel"), 8)
+        self.assertEqual(field_instance.enum_name_from_code(8), "OfferCancel")
+
+    def test_read_field_from_header_tables(self):
+        for field_name, header_hex in [
+            ("Sequence", "24"),
+            ("LastLedgerSequence", "201B"),
+            ("TakerPaysCurrency", "0111"),
+            ("TickSize", "001010"),
+        ]:
+            with self.subTest(field_name=field_name):
+                field_instance = definitions.get_field_instance(field_name)
+                self.assertEqual(field_instance.header_bytes.hex().upper(), header_hex)
+                parser = BinaryParser(header_hex)
+                self.assertIs(parser.read_field(), field_instance)
+                self.assertTrue(parser.is_end())
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import xrpl.core.binarycodec.definitions.definitions as definitions
+from xrpl.core.binarycodec import (
+    DecodedObject,
+    DefinitionsRegistry,
+    XRPLBinaryCodecException,
+    decode,
+    encode,
+    use_definitions,
+)
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.transactions import Payment
+
+_HASH = "3F8E1C2B" * 8
+
+
+def _server_definitions_result():
+    # the server_definitions result has the same format as definitions.json
+    with open(
+        os.path.join(os.path.dirname(definitions.__file__), "definitions.json")
+    ) as definitions_file:
+        result = json.load(definitions_file)
+    result["TRANSACTION_TYPES"]["NewTransaction"] = 1000
+    result["FIELDS"].append(
+        [
+            "NewField",
+            {
+                "nth": 200,
+                "isVLEncoded": False,
+                "isSerialized": True,
+                "isSigningField": True,
+                "type": "UInt32",
+            },
+        ]
+    )
+    result["hash"] = _HASH
+    return result
+
+
+class TestDefinitionsRegistry(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.registry = DefinitionsRegistry(self.cache_dir.name)
+        self.tx_json = {"TransactionType": "NewTransaction", "NewField": 5}
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_encode_and_decode_with_definitions(self):
+        server_definitions = self.registry.from_response(_server_definitions_result())
+        self.assertEqual(server_definitions.hash, _HASH)
+
+        encoded = encode(self.tx_json, definitions=server_definitions)
+        self.assertEqual(decode(encoded, definitions=server_definitions), self.tx_json)
+        self.assertEqual(
+            DecodedObject(encoded, server_definitions).to_json(), self.tx_json
+        )
+        with use_definitions(server_definitions):
+            self.assertEqual(decode(encoded), self.tx_json)
+
+        # the bundled definitions are still used by default
+        with self.assertRaises(KeyError):
+            encode(self.tx_json)
+        self.assertIs(definitions.get_definitions(), definitions._DEFAULT_DEFINITIONS)
+
+    def test_transaction_blob_with_definitions(self):
+        server_definitions = self.registry.from_response(_server_definitions_result())
+        payment = Payment(
+            account="rMBzp8CgpE441cp5PVyA9rpVV7oT8hP3ys",
+            destination="rLNaPoKeeBjZe2qs6x52yVPZpZ8td4dc6w",
+            amount=IssuedCurrencyAmount(
+                currency="USD",
+                issuer="rMBzp8CgpE441cp5PVyA9rpVV7oT8hP3ys",
+                value="1.5",
+            ),
+            sequence=5,
+            fee="12",
+        )
+        self.assertEqual(payment.blob(definitions=server_definitions), payment.blob())
+
+    def test_definitions_are_compiled_once(self):
+        with ThreadPoolExecutor(8) as executor:
+            compiled = list(
+                executor.map(
+                    lambda _: self.registry.from_response(_server_definitions_result()),
+                    range(16),
+                )
+            )
+        self.assertTrue(all(result is compiled[0] for result in compiled))
+        self.assertIs(self.registry.get(_HASH.lower()), compiled[0])
+
+    def test_definitions_are_cached_on_disk(self):
+        self.registry.from_response(_server_definitions_result())
+        self.assertEqual(os.listdir(self.cache_dir.name), [f"{_HASH}.json"])
+
+        # the server only returns the hash when it was asked about its definitions
+        registry = DefinitionsRegistry(self.cache_dir.name)
+        server_definitions = registry.from_response({"hash": _HASH})
+        self.assertEqual(
+            decode(encode(self.tx_json, server_definitions), None, server_definitions),
+            self.tx_json,
+        )
+
+    def test_unknown_hash(self):
+        self.assertIsNone(self.registry.get(_HASH))
+        with self.assertRaises(XRPLBinaryCodecException):
+            self.registry.from_response({"hash": _HASH})
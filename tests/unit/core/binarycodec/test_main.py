@@ -1,18 +1,35 @@
 import json
 import os
 from unittest import TestCase
+from unittest.mock import patch
 
 from tests.unit.core.binarycodec.fixtures.data_driven_fixtures import (
     get_whole_object_tests,
 )
+from xrpl.core.addresscodec import is_valid_xaddress
+from xrpl.core.binarycodec import (
+    DEFAULT_FIELD_ORDER_CACHE_SIZE,
+    FieldOrderCacheInfo,
+    clear_field_order_cache,
+    get_field_order_cache_info,
+    set_field_order_cache_size,
+)
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.main import (
     decode,
+    decode_bytes,
     encode,
+    encode_bytes,
+    encode_bytes_for_multisigning,
+    encode_bytes_for_multisigning_many,
+    encode_bytes_for_signing,
+    encode_bytes_for_signing_batch,
+    encode_bytes_for_signing_claim,
     encode_for_multisigning,
     encode_for_signing,
     encode_for_signing_batch,
     encode_for_signing_claim,
+    insert_field_bytes,
 )
 
 TX_JSON = {
@@ -330,6 +347,25 @@ class TestXAddress(TestCase):
     def test_xaddress_xaddr_and_matching_source_tag(self):
         self.assertEqual(encode(valid_json_x_and_tags), encode(valid_json_no_x_tags))
 
+    def test_xaddress_only_checked_in_account_fields(self):
+        tx_json = {
+            **json_x1,
+            "InvoiceID": "AB" * 32,
+            "Memos": [{"Memo": {"MemoData": "AB" * 47, "MemoType": "74657874"}}],
+        }
+        with patch(
+            "xrpl.core.binarycodec.types.st_object.is_valid_xaddress",
+            wraps=is_valid_xaddress,
+        ) as mock_is_valid_xaddress:
+            self.assertEqual(
+                decode(encode(tx_json)),
+                {**json_r1, **{k: tx_json[k] for k in ("InvoiceID", "Memos")}},
+            )
+        self.assertCountEqual(
+            [call.args[0] for call in mock_is_valid_xaddress.call_args_list],
+            [json_x1["Account"]],
+        )
+
 
 class TestMainFixtures(TestCase):
     maxDiff = None
@@ -340,6 +376,8 @@ class TestMainFixtures(TestCase):
         with self.subTest(test_binary=test_binary, test_json=test_json):
             self.assertEqual(decode(test_binary), test_json)
             self.assertEqual(encode(test_json), test_binary)
+            self.assertEqual(decode_bytes(bytes.fromhex(test_binary)), test_json)
+            self.assertEqual(encode_bytes(test_json), bytes.fromhex(test_binary))
 
     def _check_xaddress_jsons(self, test):
         x_json = test["xjson"]
@@ -377,6 +415,11 @@ class TestMainFixtures(TestCase):
         for whole_object in whole_object_tests:
             self.assertEqual(encode(whole_object.tx_json), whole_object.expected_hex)
             self.assertEqual(decode(whole_object.expected_hex), whole_object.tx_json)
+            expected_bytes = bytes.fromhex(whole_object.expected_hex)
+            self.assertEqual(encode_bytes(whole_object.tx_json), expected_bytes)
+            self.assertEqual(
+                decode_bytes(bytearray(expected_bytes)), whole_object.tx_json
+            )
 
 
 class TestMainSigning(TestCase):
@@ -390,6 +433,9 @@ class TestMainSigning(TestCase):
             "53D543A014CAF8B297CFF8F2F937E8"
         )
         self.assertEqual(encode_for_signing(signing_json), expected)
+        self.assertEqual(
+            encode_bytes_for_signing(signing_json), bytes.fromhex(expected)
+        )
 
     def test_claim(self):
         channel = "43904CBFCDCEC530B4037871F86EE90BF799DF8D2E0EA564BC8A3F332E4F5FB1"
@@ -401,6 +447,7 @@ class TestMainSigning(TestCase):
             "4F5FB100000000000003E8"
         )
         self.assertEqual(encode_for_signing_claim(json), expected)
+        self.assertEqual(encode_bytes_for_signing_claim(json), bytes.fromhex(expected))
 
     def test_batch(self):
         flags = 1
@@ -411,6 +458,7 @@ class TestMainSigning(TestCase):
 
         json = {"flags": flags, "transaction_ids": transaction_ids}
         actual = encode_for_signing_batch(json)
+        self.assertEqual(encode_bytes_for_signing_batch(json), bytes.fromhex(actual))
         self.assertEqual(
             actual,
             (
@@ -438,3 +486,96 @@ class TestMainSigning(TestCase):
         self.assertEqual(
             encode_for_multisigning(multisig_json, signing_account), expected
         )
+        self.assertEqual(
+            encode_bytes_for_multisigning(multisig_json, signing_account),
+            bytes.fromhex(expected),
+        )
+
+    def test_multisig_many(self):
+        multisig_json = {**signing_json, "SigningPubKey": ""}
+        signing_accounts = [
+            "rJZdUusLDtY9NEsGea7ijqhVrXv98rYBYN",
+            "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+        ]
+        self.assertEqual(
+            encode_bytes_for_multisigning_many(multisig_json, signing_accounts),
+            [
+                encode_bytes_for_multisigning(multisig_json, signing_account)
+                for signing_account in signing_accounts
+            ],
+        )
+        self.assertEqual(encode_bytes_for_multisigning_many(multisig_json, []), [])
+
+    def test_insert_field_bytes(self):
+        unsigned_json = {
+            key: value for key, value in signing_json.items() if key != "TxnSignature"
+        }
+        self.assertEqual(
+            insert_field_bytes(
+                encode_bytes(unsigned_json),
+                "TxnSignature",
+                signing_json["TxnSignature"],
+            ),
+            encode_bytes(signing_json),
+        )
+        # the last field in canonical order is appended
+        no_destination_json = {
+            key: value for key, value in unsigned_json.items() if key != "Destination"
+        }
+        self.assertEqual(
+            insert_field_bytes(
+                memoryview(encode_bytes_for_signing(no_destination_json))[4:],
+                "Destination",
+                signing_json["Destination"],
+            ),
+            encode_bytes_for_signing(unsigned_json)[4:],
+        )
+        self.assertRaises(
+            XRPLBinaryCodecException,
+            insert_field_bytes,
+            encode_bytes(signing_json),
+            "TxnSignature",
+            signing_json["TxnSignature"],
+        )
+
+
+class TestFieldOrderCache(TestCase):
+    def setUp(self):
+        self.addCleanup(set_field_order_cache_size, DEFAULT_FIELD_ORDER_CACHE_SIZE)
+        set_field_order_cache_size(2)
+
+    def test_field_order_cache(self):
+        for _ in range(3):
+            self.assertEqual(encode(TX_JSON), encode(dict(reversed(TX_JSON.items()))))
+            encode_for_signing(TX_JSON)
+        self.assertEqual(
+            get_field_order_cache_info(),
+            FieldOrderCacheInfo(hits=8, misses=1, maxsize=2, currsize=1),
+        )
+
+        # fields set to None are skipped, but are part of the shape
+        self.assertEqual(encode({**TX_JSON, "SourceTag": None}), encode(TX_JSON))
+        self.assertEqual(get_field_order_cache_info().currsize, 2)
+
+        # unknown fields raise and are not cached
+        self.assertRaises(KeyError, encode, {**TX_JSON, "NotAField": 1})
+        self.assertEqual(get_field_order_cache_info().currsize, 2)
+
+        # the cache is bounded
+        encode({**TX_JSON, "SourceTag": 1})
+        self.assertEqual(get_field_order_cache_info().currsize, 2)
+
+        clear_field_order_cache()
+        self.assertEqual(
+            get_field_order_cache_info(),
+            FieldOrderCacheInfo(hits=0, misses=0, maxsize=2, currsize=0),
+        )
+
+    def test_field_order_cache_disabled(self):
+        set_field_order_cache_size(0)
+        for _ in range(2):
+            encode(TX_JSON)
+        info = get_field_order_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 2, 0))
+
+        self.assertRaises(XRPLBinaryCodecException, set_field_order_cache_size, -1)
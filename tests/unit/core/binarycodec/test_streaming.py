@@ -0,0 +1,168 @@
+import json
+import os
+from unittest import TestCase
+
+from xrpl.core.binarycodec import XRPLBinaryCodecException, decode_stream, encode
+from xrpl.models.response import Response, ResponseStatus
+
+_PAGE_SIZE = 50
+
+_META = {
+    "AffectedNodes": [
+        {
+            "ModifiedNode": {
+                "LedgerEntryType": "AccountRoot",
+                "LedgerIndex": (
+                    "13F1A95D7AAB7108D5CE7EEAF504B2894B8C674E6D68499076441C4837282BF8"
+                ),
+                "FinalFields": {
+                    "Account": "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+                    "Balance": "99999990",
+                    "Flags": 0,
+                    "OwnerCount": 0,
+                    "Sequence": 2,
+                },
+                "PreviousFields": {"Balance": "100000000", "Sequence": 1},
+            }
+        }
+    ],
+    "TransactionIndex": 0,
+    "TransactionResult": "tesSUCCESS",
+}
+
+
+def _load_fixtures():
+    dirname = os.path.dirname(__file__)
+    absolute_path = os.path.join(dirname, "fixtures/data/codec-fixtures.json")
+    with open(absolute_path) as fixtures_file:
+        return json.load(fixtures_file)
+
+
+def _ledger_data_pages(entries):
+    for start in range(0, len(entries), _PAGE_SIZE):
+        yield {
+            "state": [
+                {"data": entry["binary"], "index": f"{i:064X}"}
+                for i, entry in enumerate(entries[start : start + _PAGE_SIZE], start)
+            ],
+            "marker": "ABC",
+        }
+
+
+class TestDecodeStream(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        fixtures = _load_fixtures()
+        cls.account_state = fixtures["accountState"]
+        cls.transactions = fixtures["transactions"]
+        cls.expected_state = [
+            {**entry["json"], "index": f"{i:064X}"}
+            for i, entry in enumerate(cls.account_state)
+        ]
+
+    def test_ledger_data_pages(self):
+        decoded = decode_stream(_ledger_data_pages(self.account_state))
+        self.assertEqual(list(decoded), self.expected_state)
+
+    def test_ledger_data_responses(self):
+        responses = (
+            Response(status=ResponseStatus.SUCCESS, result=page)
+            for page in _ledger_data_pages(self.account_state)
+        )
+        self.assertEqual(list(decode_stream(responses)), self.expected_state)
+
+    def test_is_lazy(self):
+        def pages():
+            yield from _ledger_data_pages(self.account_state[:_PAGE_SIZE])
+            raise AssertionError("read past the first page")
+
+        decoded = decode_stream(pages())
+        for expected in self.expected_state[:_PAGE_SIZE]:
+            self.assertEqual(next(decoded), expected)
+
+    def test_ledger_transactions(self):
+        page = {
+            "ledger": {
+                "transactions": [
+                    {"tx_blob": tx["binary"], "hash": str(i)}
+                    for i, tx in enumerate(self.transactions)
+                ]
+            }
+        }
+        self.assertEqual(
+            list(decode_stream([page])),
+            [
+                {"tx_json": tx["json"], "hash": str(i)}
+                for i, tx in enumerate(self.transactions)
+            ],
+        )
+
+    def test_account_tx_pages(self):
+        # API v2 names the metadata blob `meta_blob`, API v1 names it `meta`
+        for meta_key in ["meta_blob", "meta"]:
+            with self.subTest(meta_key=meta_key):
+                page = {
+                    "transactions": [
+                        {
+                            "tx_blob": tx["binary"],
+                            meta_key: encode(_META),
+                            "ledger_index": 5,
+                            "validated": True,
+                        }
+                        for tx in self.transactions
+                    ]
+                }
+                self.assertEqual(
+                    list(decode_stream([page])),
+                    [
+                        {
+                            "tx_json": tx["json"],
+                            "meta": _META,
+                            "ledger_index": 5,
+                            "validated": True,
+                        }
+                        for tx in self.transactions
+                    ],
+                )
+                # fields only apply to the transactions
+                for entry in decode_stream([page], fields=["Account", "Fee"]):
+                    self.assertEqual(set(entry["tx_json"]), {"Account", "Fee"})
+                    self.assertEqual(entry["meta"], _META)
+
+    def test_blobs(self):
+        blobs = [tx["binary"] for tx in self.transactions]
+        blobs[1::3] = [bytes.fromhex(blob) for blob in blobs[1::3]]
+        blobs[2::3] = [memoryview(bytes.fromhex(blob)) for blob in blobs[2::3]]
+        for workers in [0, 1]:
+            with self.subTest(workers=workers):
+                self.assertEqual(
+                    list(decode_stream(blobs, workers=workers)),
+                    [tx["json"] for tx in self.transactions],
+                )
+
+    def test_fields(self):
+        decoded = decode_stream(
+            _ledger_data_pages(self.account_state), fields={"LedgerEntryType"}
+        )
+        for entry, expected in zip(decoded, self.expected_state):
+            self.assertEqual(
+                entry,
+                {
+                    "LedgerEntryType": expected["LedgerEntryType"],
+                    "index": expected["index"],
+                },
+            )
+
+    def test_workers_keep_order(self):
+        decoded = decode_stream(
+            _ledger_data_pages(self.account_state), workers=2, chunk_size=7
+        )
+        self.assertEqual(list(decoded), self.expected_state)
+
+    def test_invalid_page(self):
+        with self.assertRaises(XRPLBinaryCodecException):
+            list(decode_stream([1]))
+        with self.assertRaises(XRPLBinaryCodecException):
+            list(decode_stream([{"foo": "bar"}]))
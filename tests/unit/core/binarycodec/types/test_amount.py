@@ -189,6 +189,48 @@ class TestAmount(TestSerializedType):
             amount_object = amount.Amount.from_parser(parser)
             self.assertEqual(amount_object.to_json(), json)
 
+    def test_to_json_issued_currency_keeps_integer_zeros(self):
+        issuer = "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw"
+        for value, expected in [
+            ("1000000000000000", "1000000000000000"),
+            ("1500000000000000", "1500000000000000"),
+            ("1e-20", "1.000000000000000E-20"),
+            ("1.5e-10", "1.500000000000000E-10"),
+            ("0.00012300", "0.000123"),
+            ("-12.5", "-12.5"),
+        ]:
+            with self.subTest(value=value):
+                amount_object = amount.Amount.from_value(
+                    {"currency": "USD", "issuer": issuer, "value": value}
+                )
+                self.assertEqual(amount_object.to_json()["value"], expected)
+
+    def test_from_value_issued_currency_decimal_fallback(self):
+        # inputs the integer parser doesn't handle are serialized with Decimal
+        issuer = "rDgZZ3wyprx4ZqrGQUkquE9Fs2Xs8XBcdw"
+        for value, equivalent in [
+            (" 2.1 ", "2.1"),
+            ("1_000", "1000"),
+            ("1.0000000000000000000", "1"),
+            ("0.00000000000000000000012", "1.2e-22"),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    amount.Amount.from_value(
+                        {"currency": "USD", "issuer": issuer, "value": value}
+                    ).to_hex(),
+                    amount.Amount.from_value(
+                        {"currency": "USD", "issuer": issuer, "value": equivalent}
+                    ).to_hex(),
+                )
+
+    def test_assert_iou_is_valid_raises(self):
+        for case in ["1e20", "12345678901234567", "1.5e81", "1e-97", "NaN"]:
+            with self.subTest(case=case):
+                self.assertRaises(
+                    XRPLBinaryCodecException, amount.verify_iou_value, case
+                )
+
     def test_fixtures(self):
         for fixture in data_driven_fixtures_for_type("Amount"):
             self.fixture_test(fixture)
@@ -4,6 +4,7 @@ from tests.unit.core.binarycodec.fixtures.data_driven_fixtures import (
     ValueTest,
     get_value_tests,
 )
+from xrpl.core.binarycodec.binary_wrappers import BinaryParser
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.account_id import AccountID
 from xrpl.core.binarycodec.types.amount import Amount
@@ -61,3 +62,21 @@ class TestSerializedType(TestCase):
                 serialized_type.from_value(json_value).to_hex(),
                 fixture.expected_hex,
             )
+
+    def test_instances_have_no_dict(self):
+        for serialized_type in TYPE_MAP.values():
+            with self.subTest(type=serialized_type.__name__):
+                self.assertFalse(hasattr(object.__new__(serialized_type), "__dict__"))
+
+    def test_small_values_are_interned(self):
+        self.assertIs(UInt8.from_value(3), UInt8.from_value(3))
+        self.assertIs(UInt8.from_value(3), UInt8.from_parser(BinaryParser("03")))
+        self.assertIs(UInt16.from_value(12), UInt16.from_parser(BinaryParser("000C")))
+        self.assertIsNot(UInt16.from_value(1000), UInt16.from_value(1000))
+        self.assertIs(
+            Currency.from_value("XRP"), Currency.from_parser(BinaryParser("00" * 20))
+        )
+        self.assertIs(
+            Amount.from_value("0"), Amount.from_parser(BinaryParser("4000000000000000"))
+        )
+        self.assertEqual(Amount.from_value("0").to_json(), "0")
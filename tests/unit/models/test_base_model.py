@@ -1,9 +1,13 @@
 import json
 import os
+from typing import Any, Dict, List, Optional, Union
 from unittest import TestCase
 
+from typing_extensions import Literal
+
 from xrpl.models import XRPLModelException
 from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.base_model import _JSON_KEYS, _compile_type_check, _key_to_json
 from xrpl.models.currencies import XRP, IssuedCurrency
 from xrpl.models.requests import (
     AccountChannels,
@@ -31,7 +35,7 @@ from xrpl.models.transactions import (
     XChainAddAccountCreateAttestation,
     XChainClaim,
 )
-from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions.transaction import Transaction, _key_to_tx_json
 from xrpl.models.xchain_bridge import XChainBridge
 
 currency = "BTC"
@@ -156,6 +160,50 @@ class TestBaseModel(TestCase):
             ),
         )
 
+    def test_construct(self):
+        payment = Payment.construct(account=account, amount=10)
+        self.assertEqual(payment.amount, 10)
+        self.assertIsNone(payment.fee)
+        self.assertEqual(payment.transaction_type, "Payment")
+        self.assertFalse(payment.is_valid())
+
+    def test_compiled_type_checks(self):
+        amount = IssuedCurrencyAmount(**amount_dict)
+        expected_types = [
+            str,
+            Optional[str],
+            Union[IssuedCurrencyAmount, str],
+            Optional[List[Memo]],
+            Union[Dict[str, bool], int, List[int], None],
+            List[List[int]],
+            PathFindSubcommand,
+            Literal["create", 1],
+            Dict[str, Any],
+            Any,
+        ]
+        values = [
+            None,
+            "create",
+            1,
+            True,
+            PathFindSubcommand.CREATE,
+            [],
+            [1],
+            [[1]],
+            [Memo(memo_data="AB")],
+            [{"memo_data": "AB"}],
+            amount_dict,
+            amount,
+        ]
+        for expected_type in expected_types:
+            is_valid = _compile_type_check(expected_type)
+            for value in values:
+                with self.subTest(expected_type=expected_type, value=value):
+                    self.assertEqual(
+                        is_valid(value),
+                        amount._check_type("attr", value, expected_type) == {},
+                    )
+
 
 class TestFromDict(TestCase):
     maxDiff = 2000
@@ -559,6 +607,28 @@ class TestFromXrpl(TestCase):
                     translated_tx = tx.to_xrpl()
                     self.assertEqual(r_json, translated_tx)
 
+    def test_from_xrpl_trusted(self):
+        dirname = os.path.dirname(__file__)
+        absolute_path = os.path.join(
+            dirname, "../core/binarycodec/fixtures/data/codec-fixtures.json"
+        )
+        with open(absolute_path) as fixtures_file:
+            fixtures_json = json.load(fixtures_file)
+        for fixture in fixtures_json["transactions"]:
+            tx_json = fixture["json"]
+            with self.subTest(json=tx_json):
+                trusted_tx = Transaction.from_xrpl(tx_json, trusted=True)
+                if not trusted_tx.is_valid():
+                    # trusted values are not validated
+                    self.assertRaises(
+                        XRPLModelException, Transaction.from_xrpl, tx_json
+                    )
+                    continue
+                tx = Transaction.from_xrpl(tx_json)
+                self.assertIs(type(trusted_tx), type(tx))
+                self.assertEqual(trusted_tx.__dict__, tx.__dict__)
+                self.assertEqual(trusted_tx.to_xrpl(), tx_json)
+
     def test_from_xrpl_signers(self):
         txn_sig1 = (
             "F80E201FE295AA08678F8542D8FC18EA18D582A0BD19BE77B9A24479418ADBCF4CAD28E7BD"
@@ -894,3 +964,11 @@ class TestFromXrpl(TestCase):
 
         with self.assertRaises(XRPLModelException):
             Transaction.from_xrpl(tx_snake_case_keys)
+
+    def test_key_conversions_are_memoized(self):
+        for _ in range(2):
+            self.assertEqual(_key_to_json("NFTokenID"), "nftoken_id")
+            self.assertEqual(_key_to_tx_json("nftoken_id"), "NFTokenID")
+            self.assertRaises(XRPLModelException, _key_to_json, "signing_pub_key")
+        self.assertEqual(_JSON_KEYS["NFTokenID"], "nftoken_id")
+        self.assertNotIn("signing_pub_key", _JSON_KEYS)
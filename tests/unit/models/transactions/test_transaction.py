@@ -1,12 +1,22 @@
 from unittest import TestCase
+from unittest.mock import patch
 
-from xrpl.asyncio.transaction.main import sign
+from xrpl.asyncio.transaction import main
+from xrpl.asyncio.transaction.main import sign, sign_and_encode
 from xrpl.core.addresscodec.main import classic_address_to_xaddress
 from xrpl.models.exceptions import XRPLModelException
-from xrpl.models.transactions import AccountSet, DepositPreauth, OfferCreate, Payment
-from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions import (
+    AccountSet,
+    DepositPreauth,
+    EscrowFinish,
+    OfferCreate,
+    Payment,
+    PaymentFlag,
+    SetRegularKey,
+)
+from xrpl.models.transactions.transaction import Memo, Transaction
 from xrpl.models.transactions.types.transaction_type import TransactionType
-from xrpl.transaction.multisign import multisign
+from xrpl.transaction.multisign import multisign, sign_for_signers
 from xrpl.utils.str_conversions import str_to_hex
 from xrpl.wallet import Wallet
 
@@ -147,6 +157,55 @@ class TestTransaction(TestCase):
         signed_tx = sign(tx, _WALLET)
         self.assertTrue(signed_tx.is_signed())
 
+    def test_sign_and_encode(self):
+        tx = Payment(
+            account=_WALLET.address,
+            amount="1000",
+            destination=_ACCOUNT,
+            fee="10",
+            sequence=_SEQUENCE,
+            flags=[PaymentFlag.TF_PARTIAL_PAYMENT],
+            memos=[Memo(memo_data=EXAMPLE_DOMAIN)],
+        )
+        signed = sign_and_encode(tx, _WALLET)
+        self.assertEqual(signed.transaction, sign(tx, _WALLET))
+        self.assertTrue(signed.transaction.is_valid())
+        self.assertEqual(signed.tx_blob, signed.transaction.blob())
+        self.assertEqual(signed.hash, signed.transaction.get_hash())
+
+    def test_sign_and_encode_xaddress(self):
+        tx = DepositPreauth(
+            account=classic_address_to_xaddress(_WALLET.address, 1, False),
+            authorize=classic_address_to_xaddress(_ACCOUNT, None, False),
+        )
+        signed = sign_and_encode(tx, _WALLET)
+        self.assertEqual(signed.transaction.account, _WALLET.address)
+        self.assertEqual(signed.transaction.source_tag, 1)
+        self.assertEqual(signed.tx_blob, signed.transaction.blob())
+        self.assertEqual(signed.hash, signed.transaction.get_hash())
+
+    def test_sign_and_encode_prepared_fields(self):
+        xaddress = classic_address_to_xaddress(_ACCOUNT, None, False)
+        for tx in [
+            DepositPreauth(account=_WALLET.address, unauthorize=xaddress),
+            EscrowFinish(account=_WALLET.address, owner=xaddress, offer_sequence=1),
+            SetRegularKey(account=_WALLET.address, regular_key=xaddress),
+        ]:
+            with self.subTest(transaction_type=tx.transaction_type):
+                signed = sign_and_encode(tx, _WALLET)
+                self.assertNotIn(xaddress, signed.transaction.to_xrpl().values())
+                self.assertEqual(signed.tx_blob, signed.transaction.blob())
+
+        # any field changed while preparing the transaction is in the signed model
+        with patch.object(
+            main,
+            "_convert_to_classic_address",
+            side_effect=lambda json, field: json.setdefault("SourceTag", 7),
+        ):
+            signed = sign_and_encode(AccountSet(account=_WALLET.address), _WALLET)
+        self.assertEqual(signed.transaction.source_tag, 7)
+        self.assertEqual(signed.tx_blob, signed.transaction.blob())
+
     def test_is_signed_for_unsigned_transaction(self):
         tx = AccountSet(account=_WALLET.address, domain=EXAMPLE_DOMAIN)
         self.assertFalse(tx.is_signed())
@@ -159,6 +218,20 @@ class TestTransaction(TestCase):
         multisigned_tx = multisign(tx, [tx_1, tx_2])
         self.assertTrue(multisigned_tx.is_signed())
 
+    def test_sign_for_signers(self):
+        tx = AccountSet(account=_WALLET.address, domain=EXAMPLE_DOMAIN)
+        tx_1 = sign(tx, _FIRST_SIGNER, multisign=True)
+        tx_2 = sign(tx, _SECOND_SIGNER, multisign=True)
+        expected = multisign(tx, [tx_1, tx_2])
+
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                signers = sign_for_signers(
+                    tx, [_FIRST_SIGNER, _SECOND_SIGNER], workers=workers
+                )
+                self.assertEqual(signers, expected.signers)
+                self.assertEqual(multisign(tx, signers), expected)
+
     def test_multisigned_transaction_xaddress(self):
         tx = DepositPreauth(
             account=classic_address_to_xaddress(_WALLET.address, 1, False),
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+import xrpl.models.requests
+import xrpl.models.transactions
+
+# `import xrpl` took about 0.6s when it imported every model; it now takes a few
+# tens of milliseconds. The threshold leaves plenty of room for slow machines.
+_IMPORT_TIME_THRESHOLD_MICROSECONDS = 250_000
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+class TestImportTime(TestCase):
+    def test_import_time(self):
+        # -X importtime lines are "import time: self | cumulative | module"
+        import_times = {
+            line.split("|")[2].strip(): int(line.split("|")[1])
+            for line in _run("import xrpl").stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        }
+        self.assertLess(import_times["xrpl"], _IMPORT_TIME_THRESHOLD_MICROSECONDS)
+
+    def test_lazy_imports(self):
+        for statement, lazy_modules in [
+            (
+                "import xrpl",
+                [
+                    "xrpl.models",
+                    "xrpl.core.binarycodec",
+                    "xrpl.asyncio.clients",
+                    "httpx",
+                ],
+            ),
+            (
+                "from xrpl.models import Payment",
+                ["xrpl.models.transactions.account_set", "xrpl.models.requests.tx"],
+            ),
+            ("import xrpl.core.keypairs", ["ecpy.curves", "Crypto.Hash.RIPEMD160"]),
+            ("from xrpl.wallet import Wallet", ["xrpl.asyncio.clients"]),
+        ]:
+            with self.subTest(statement=statement):
+                loaded = _run(
+                    f"{statement}\nimport sys\nprint(' '.join(sys.modules))"
+                ).stdout.split()
+                for module in lazy_modules:
+                    self.assertNotIn(module, loaded)
+
+    def test_missing_submodules(self):
+        for package in [xrpl.models.transactions, xrpl.models.requests]:
+            with self.subTest(package=package.__name__):
+                with self.assertRaises(AttributeError):
+                    package.not_a_submodule
+                # a submodule that fails to import reports its own missing module
+                with patch.object(
+                    package,
+                    "import_module",
+                    side_effect=ModuleNotFoundError(name="missing_dependency"),
+                ):
+                    with self.assertRaises(ModuleNotFoundError):
+                        package.broken_submodule
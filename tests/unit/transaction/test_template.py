@@ -0,0 +1,124 @@
+from unittest import TestCase
+
+from xrpl.constants import XRPLException
+from xrpl.core.addresscodec import classic_address_to_xaddress
+from xrpl.core.binarycodec import decode, encode_bytes_for_signing
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.path import PathStep
+from xrpl.models.transactions import Batch, Memo, Payment
+from xrpl.transaction import TransactionTemplate, sign_and_encode
+from xrpl.wallet import Wallet
+
+_WALLET = Wallet.from_seed("sEd7HmQFsoyj5TAm6d98gytM9LJA1MF")
+_DESTINATION = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+_PAYMENT = {
+    "account": _WALLET.address,
+    "amount": "1000",
+    "destination": _DESTINATION,
+    "fee": "12",
+    "sequence": 1,
+    "last_ledger_sequence": 100,
+}
+
+
+class TestTransactionTemplate(TestCase):
+    def test_render(self):
+        template = TransactionTemplate(Payment(**_PAYMENT), _WALLET)
+        for field_values in [
+            {},
+            {"sequence": 77, "amount": "123456789"},
+            # amounts whose encoding has a different length
+            {
+                "amount": IssuedCurrencyAmount(
+                    currency="USD", issuer=_DESTINATION, value="1.5"
+                )
+            },
+            # fields added and removed
+            {"destination_tag": 5, "fee": "10000", "last_ledger_sequence": None},
+            {"source_tag": 3, "invoice_id": "A" * 64, "memos": None},
+            # lists of nested models
+            {"memos": [Memo(memo_data="AB"), Memo(memo_type="CD", memo_data="EF")]},
+            {
+                "amount": IssuedCurrencyAmount(
+                    currency="USD", issuer=_DESTINATION, value="1.5"
+                ),
+                "paths": [[PathStep(account=_DESTINATION)]],
+            },
+        ]:
+            with self.subTest(field_values=field_values):
+                payment = {**_PAYMENT, **field_values}
+                expected = sign_and_encode(
+                    Payment(
+                        **{
+                            key: value
+                            for key, value in payment.items()
+                            if value is not None
+                        }
+                    ),
+                    _WALLET,
+                )
+                rendered = template.render(**field_values)
+                self.assertEqual(rendered.tx_blob, expected.tx_blob)
+                self.assertEqual(rendered.hash, expected.hash)
+                self.assertEqual(
+                    rendered.signing_payload,
+                    encode_bytes_for_signing(decode(expected.tx_blob)),
+                )
+
+    def test_render_fixed_fields(self):
+        template = TransactionTemplate(Payment(**_PAYMENT), _WALLET)
+        for field_values in [
+            {"account": _DESTINATION},
+            {"txn_signature": "ABCD"},
+            {"not_a_field": 1},
+            {"destination": classic_address_to_xaddress(_DESTINATION, 1, False)},
+        ]:
+            with self.subTest(field_values=field_values):
+                with self.assertRaises(XRPLException):
+                    template.render(**field_values)
+
+    def test_non_signing_fields(self):
+        batch = Batch.from_xrpl(
+            {
+                "Account": _WALLET.address,
+                "Flags": 1,
+                "RawTransactions": [
+                    {
+                        "RawTransaction": {
+                            "Account": _WALLET.address,
+                            "Flags": 1073741824,
+                            "Amount": "5000000",
+                            "Destination": _DESTINATION,
+                            "Fee": "0",
+                            "Sequence": 2,
+                            "SigningPubKey": "",
+                            "TransactionType": "Payment",
+                        }
+                    },
+                    {
+                        "RawTransaction": {
+                            "Account": _DESTINATION,
+                            "Flags": 1073741824,
+                            "Amount": "1000000",
+                            "Destination": _WALLET.address,
+                            "Fee": "0",
+                            "Sequence": 3,
+                            "SigningPubKey": "",
+                            "TransactionType": "Payment",
+                        }
+                    },
+                ],
+                "BatchSigners": [
+                    {
+                        "BatchSigner": {
+                            "Account": _DESTINATION,
+                            "SigningPubKey": _WALLET.public_key,
+                            "TxnSignature": "ABCD",
+                        }
+                    }
+                ],
+                "TransactionType": "Batch",
+            }
+        )
+        with self.assertRaises(XRPLException):
+            TransactionTemplate(batch, _WALLET)
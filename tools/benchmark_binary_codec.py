@@ -0,0 +1,174 @@
+"""Script to benchmark the binary codec on large objects.
+
+Usage: python tools/benchmark_binary_codec.py
+"""
+
+import json
+import os
+import timeit
+import tracemalloc
+from itertools import cycle, islice
+from typing import Any, Callable, Dict, List, Tuple
+
+from xrpl.core.binarycodec import decode, encode
+from xrpl.core.binarycodec.binary_wrappers import BinaryParser
+from xrpl.core.binarycodec.types import Amount
+
+_REPEAT = 5
+
+_DATA_DRIVEN_FIXTURES = os.path.join(
+    os.path.dirname(__file__),
+    "../tests/unit/core/binarycodec/fixtures/data/data-driven-tests.json",
+)
+_CODEC_FIXTURES = os.path.join(
+    os.path.dirname(__file__),
+    "../tests/unit/core/binarycodec/fixtures/data/codec-fixtures.json",
+)
+_MEMORY_TRANSACTIONS = 100_000
+
+_BASE_TX: Dict[str, Any] = {
+    "TransactionType": "Payment",
+    "Account": "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ",
+    "Destination": "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+    "Amount": "1000000",
+    "Fee": "12",
+    "Flags": 0,
+    "Sequence": 1,
+}
+
+
+def _memo_heavy_tx(size: int) -> Dict[str, Any]:
+    """Build a Payment carrying enough 128-byte memos to be about `size` bytes."""
+    memo = {"Memo": {"MemoType": "74657874", "MemoData": "AB" * 128}}
+    return {**_BASE_TX, "Memos": [memo] * max(1, size // 136)}
+
+
+def _best_time(func: Callable[[], Any], number: int) -> float:
+    """Return the best per-call time of `func`, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=_REPEAT)) / number
+
+
+def _report(rows: List[Tuple[str, int, float]]) -> None:
+    print(f"{'benchmark':<24}{'bytes':>10}{'ms/op':>12}{'MB/s':>10}")
+    for name, size, seconds in rows:
+        throughput = size / seconds / 1e6
+        print(f"{name:<24}{size:>10}{seconds * 1e3:>12.3f}{throughput:>10.1f}")
+
+
+def bench_large_objects() -> None:
+    """Encode and decode 1 KB, 64 KB and 1 MB objects.
+
+    Linear-time encoding and decoding shows up as a roughly constant MB/s figure
+    across the three sizes.
+    """
+    rows = []
+    for label, size, number in [
+        ("1KB", 1 << 10, 200),
+        ("64KB", 1 << 16, 10),
+        ("1MB", 1 << 20, 1),
+    ]:
+        tx = _memo_heavy_tx(size)
+        encoded = encode(tx)
+        num_bytes = len(encoded) // 2
+        rows.append(
+            (f"encode {label}", num_bytes, _best_time(lambda: encode(tx), number))
+        )
+        rows.append(
+            (f"decode {label}", num_bytes, _best_time(lambda: decode(encoded), number))
+        )
+    _report(rows)
+
+
+def bench_projected_decode() -> None:
+    """Decode a few indexing fields of a memo-heavy Payment, versus all fields."""
+    encoded = encode(_memo_heavy_tx(1 << 12))
+    num_bytes = len(encoded) // 2
+    fields = {"TransactionType", "Account", "Sequence", "Fee"}
+    _report(
+        [
+            ("decode all fields", num_bytes, _best_time(lambda: decode(encoded), 100)),
+            (
+                "decode 4 fields",
+                num_bytes,
+                _best_time(lambda: decode(encoded, fields=fields), 100),
+            ),
+        ]
+    )
+
+
+def bench_amounts() -> None:
+    """Encode and decode the valid XRP, issued currency and MPT amount fixtures."""
+    with open(_DATA_DRIVEN_FIXTURES) as fixtures_file:
+        fixtures = json.load(fixtures_file)["values_tests"]
+    values = [
+        fixture["test_json"]
+        for fixture in fixtures
+        if fixture["type"] == "Amount" and "error" not in fixture
+    ]
+    buffers = [bytes(Amount.from_value(value)) for value in values]
+    num_bytes = sum(len(buffer) for buffer in buffers)
+
+    def encode_amounts() -> None:
+        for value in values:
+            Amount.from_value(value)
+
+    def decode_amounts() -> None:
+        for buffer in buffers:
+            Amount(buffer).to_json()
+
+    print(f"{len(values)} amount fixtures")
+    _report(
+        [
+            ("encode amounts", num_bytes, _best_time(encode_amounts, 200)),
+            ("decode amounts", num_bytes, _best_time(decode_amounts, 200)),
+        ]
+    )
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    """Return the peak memory allocated while running `func`, in bytes."""
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841 (kept alive until the peak is read)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_memory() -> None:
+    """Decode 100k transactions, keeping every result, and report peak memory.
+
+    Transactions are decoded both to JSON and to codec values (the
+    `SerializedType` of each top-level field), so the peak includes every object
+    each kind of decode keeps alive.
+    """
+    with open(_CODEC_FIXTURES) as fixtures_file:
+        fixtures = json.load(fixtures_file)["transactions"]
+    blobs = [
+        bytes.fromhex(fixture["binary"])
+        for fixture in islice(cycle(fixtures), _MEMORY_TRANSACTIONS)
+    ]
+
+    def decode_to_values() -> List[List[Any]]:
+        decoded = []
+        for blob in blobs:
+            parser = BinaryParser.from_bytes(blob)
+            fields = []
+            while not parser.is_end():
+                fields.append(parser.read_field_and_value())
+            decoded.append(fields)
+        return decoded
+
+    print(f"{'peak memory':<24}{'MB':>10}")
+    for name, func in [
+        ("decode to JSON", lambda: [decode(blob.hex()) for blob in blobs]),
+        ("decode to values", decode_to_values),
+    ]:
+        print(f"{name:<24}{_peak_memory(func) / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    bench_large_objects()
+    bench_projected_decode()
+    bench_amounts()
+    bench_memory()
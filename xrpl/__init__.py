@@ -1,11 +1,25 @@
 """High-level XRPL exports."""
 
-from xrpl import account, clients, core, ledger, models, transaction, utils, wallet
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from xrpl.constants import CryptoAlgorithm, XRPLException
 
-__all__ = [
-    "CryptoAlgorithm",
-    "XRPLException",
+if TYPE_CHECKING:
+    from xrpl import (  # noqa: F401
+        account,
+        clients,
+        core,
+        ledger,
+        models,
+        transaction,
+        utils,
+        wallet,
+    )
+
+# Subpackages are imported on first access (PEP 562), so that `import xrpl` only
+# pays for the parts of the library that are used.
+_SUBPACKAGES = (
     "account",
     "clients",
     "core",
@@ -14,4 +28,20 @@ __all__ = [
     "transaction",
     "utils",
     "wallet",
+)
+
+__all__ = [
+    "CryptoAlgorithm",
+    "XRPLException",
+    *_SUBPACKAGES,
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _SUBPACKAGES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
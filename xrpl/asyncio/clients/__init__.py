@@ -3,6 +3,12 @@
 from xrpl.asyncio.clients.async_json_rpc_client import AsyncJsonRpcClient
 from xrpl.asyncio.clients.async_websocket_client import AsyncWebsocketClient
 from xrpl.asyncio.clients.client import Client
+from xrpl.asyncio.clients.client_pool import (
+    HEDGEABLE_METHODS,
+    ClientPool,
+    PoolEndpoint,
+    PoolPolicy,
+)
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
 from xrpl.asyncio.clients.utils import (
     json_to_response,
@@ -15,6 +21,10 @@ __all__ = [
     "AsyncJsonRpcClient",
     "AsyncWebsocketClient",
     "Client",
+    "ClientPool",
+    "HEDGEABLE_METHODS",
+    "PoolEndpoint",
+    "PoolPolicy",
     "json_to_response",
     "request_to_json_rpc",
     "XRPLRequestFailureException",
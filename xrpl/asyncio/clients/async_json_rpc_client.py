@@ -1,10 +1,55 @@
 """An async client for interacting with the rippled JSON RPC."""
 
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Type
+
+from typing_extensions import Self
+
 from xrpl.asyncio.clients.async_client import AsyncClient
 from xrpl.asyncio.clients.json_rpc_base import JsonRpcBase
 
 
 class AsyncJsonRpcClient(AsyncClient, JsonRpcBase):
-    """An async client for interacting with the rippled JSON RPC."""
+    """
+    An async client for interacting with the rippled JSON RPC.
+
+    A client that is not open makes a new connection for every request. Opening
+    the client keeps a pool of connections to the server alive until it is closed,
+    which saves a TCP and TLS handshake on every request::
+
+        async with AsyncJsonRpcClient(url, max_connections=10) as client:
+            # inside the context the client reuses its connections
+            print(await client.request(Fee()))
+        # after exiting the context, the connections are closed
+    """
+
+    async def open(self: Self) -> None:
+        """Opens a pool of connections to the server at the given URL."""
+        if not self.is_open():
+            await self._do_open()
+
+    async def close(self: Self) -> None:
+        """Closes the pooled connections."""
+        if self.is_open():
+            await self._do_close()
+
+    async def __aenter__(self: Self) -> Self:
+        """
+        Enters an async context after opening itself.
+
+        Returns:
+            The opened client.
+        """
+        await self.open()
+        return self
 
-    pass
+    async def __aexit__(
+        self: Self,
+        _exc_type: Type[BaseException],
+        _exc_val: BaseException,
+        _trace: TracebackType,
+    ) -> None:
+        """Exits an async context after closing itself."""
+        await self.close()
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from types import TracebackType
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Sequence, Type, Union
 
 from typing_extensions import Self
 
 from xrpl.asyncio.clients.async_client import AsyncClient
-from xrpl.asyncio.clients.client import REQUEST_TIMEOUT
+from xrpl.asyncio.clients.client import DEFAULT_MAX_IN_FLIGHT, REQUEST_TIMEOUT
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.clients.websocket_base import WebsocketBase
 from xrpl.models.requests.request import Request
@@ -286,4 +286,34 @@ class AsyncWebsocketClient(AsyncClient, WebsocketBase):
         """
         if not self.is_open():
             raise XRPLWebsocketException("Websocket is not open")
-        return await self._do_request_impl(request, timeout)
+        return await self._coalesce(
+            request, timeout, lambda: self._do_request_impl(request, timeout)
+        )
+
+    async def _request_many_impl(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        ``_request_many_impl`` implementation for async websocket.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+
+        Raises:
+            XRPLWebsocketException: If this WebsocketBase is not open.
+
+        :meta private:
+        """
+        if not self.is_open():
+            raise XRPLWebsocketException("Websocket is not open")
+        return await self._do_request_many(requests, max_in_flight, timeout)
@@ -2,20 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import json
 from abc import ABC, abstractmethod
-from typing import Optional
+from copy import deepcopy
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Counter,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Final, Self
 
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
 from xrpl.models.requests import ServerInfo
-from xrpl.models.requests.request import Request
+from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.response import Response
 
+# the types from asyncio are not implemented as generics in python 3.8 and
+# lower, so we need to only subscript them when running typechecking.
+if TYPE_CHECKING:
+    _IN_FLIGHT_TYPE = Dict[str, asyncio.Future[Response]]
+else:
+    _IN_FLIGHT_TYPE = Dict[str, asyncio.Future]
+
 # The default request timeout duration. Set in Client._request_impl to allow more time
 # for longer running commands.
 REQUEST_TIMEOUT: Final[float] = 10.0
 
+DEFAULT_MAX_IN_FLIGHT: Final[int] = 16
+"""
+The default maximum number of requests ``request_many`` has in flight at once.
+:meta hide-value:
+"""
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class Client(ABC):
     """
@@ -34,6 +68,17 @@ class Client(ABC):
         self.url = url
         self.network_id: Optional[int] = None
         self.build_version: Optional[str] = None
+        self.coalesce_methods: Set[RequestMethod] = set()
+        """
+        The methods whose requests are coalesced: a request that is identical to
+        one already in flight, apart from its ``id``, and has the same timeout
+        waits for the response of that request instead of being sent. Only add
+        read methods, whose response does not depend on when they are sent, such
+        as ``fee`` or ``server_info``.
+        """
+        self.coalesced_requests: Counter[RequestMethod] = collections.Counter()
+        """The number of requests of each method that were coalesced."""
+        self._in_flight: _IN_FLIGHT_TYPE = {}
 
     @abstractmethod
     async def _request_impl(
@@ -55,6 +100,126 @@ class Client(ABC):
         """
         pass
 
+    async def _coalesce(
+        self: Self,
+        request: Request,
+        timeout: float,
+        send: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """
+        Sends a request with ``send``, unless its method is coalesced and an
+        identical request with the same timeout is already in flight, in which
+        case it waits for the response of that request. Call this in
+        ``_request_impl``.
+
+        Arguments:
+            request: The request to send.
+            timeout: The maximum tolerable delay on waiting for a response.
+            send: A function that sends the request.
+
+        Returns:
+            The response to the request. Each caller gets its own copy, with the
+            ``id`` of its own request.
+
+        :meta private:
+        """
+        if request.method not in self.coalesce_methods:
+            return await send()
+
+        request_dict = request.to_dict()
+        request_dict.pop("id", None)
+        # a caller must not inherit the timeout error of a request with a shorter
+        # timeout, so only requests with the same timeout are coalesced
+        key = json.dumps([timeout, request_dict], sort_keys=True)
+        in_flight = self._in_flight.get(key)
+
+        def forget(future: asyncio.Future[Response]) -> None:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+        # a future can only be awaited on its own event loop, which differs when a
+        # sync client is used from several threads
+        if in_flight is None or in_flight.get_loop() is not asyncio.get_running_loop():
+            in_flight = asyncio.ensure_future(send())
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(forget)
+        else:
+            self.coalesced_requests[request.method] += 1
+        # cancelling one of the callers must not cancel the request of the others
+        response = await asyncio.shield(in_flight)
+        return replace(
+            response,
+            id=response.id if request.id is None else request.id,
+            result=deepcopy(response.result),
+        )
+
+    async def _request_many_impl(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        The driver for ``request_many``. By default it sends the requests through
+        ``_request_impl``, at most ``max_in_flight`` at a time. Override this in a
+        given Client that can send requests more efficiently.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+
+        :meta private:
+        """
+        return await gather_in_window(
+            lambda request: self._request_impl(request, timeout=timeout),
+            requests,
+            max_in_flight,
+        )
+
+
+async def gather_in_window(
+    func: Callable[[T], Awaitable[R]], items: Sequence[T], max_in_flight: int
+) -> List[Union[R, Exception]]:
+    """
+    Run an async function on each item, at most ``max_in_flight`` at a time.
+
+    Args:
+        func: The async function to run on each item.
+        items: The items to run the function on.
+        max_in_flight: The maximum number of calls running at once.
+
+    Returns:
+        The result of each call, or the exception it raised, in the order of the
+        items. An exception does not stop the other calls.
+
+    Raises:
+        ValueError: if max_in_flight is less than 1.
+
+    :meta private:
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+    results = cast(List[Union[R, Exception]], [None] * len(items))
+    pending = iter(enumerate(items))
+
+    # each worker takes the next item as soon as its previous call is done, which
+    # keeps the window full without making a task per item
+    async def worker() -> None:
+        for i, item in pending:
+            try:
+                results[i] = await func(item)
+            except Exception as error:
+                results[i] = error
+
+    await asyncio.gather(*(worker() for _ in range(min(max_in_flight, len(items)))))
+    return results
+
 
 async def get_network_id_and_build_version(client: Client) -> None:
     """
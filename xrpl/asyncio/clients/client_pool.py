@@ -0,0 +1,511 @@
+"""An async client that spreads requests over several rippled nodes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from enum import Enum
+from itertools import count
+from time import monotonic
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    Union,
+    cast,
+)
+
+from typing_extensions import Final, Self
+
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.client import REQUEST_TIMEOUT
+from xrpl.models.requests import ServerInfo
+from xrpl.models.requests.request import Request, RequestMethod
+from xrpl.models.response import Response
+
+DEFAULT_HEALTH_CHECK_INTERVAL: Final[float] = 30.0
+"""
+The default number of seconds between the health checks of an open pool.
+:meta hide-value:
+"""
+
+DEFAULT_MAX_LEDGER_AGE: Final[float] = 10.0
+"""
+The default maximum age, in seconds, of the latest validated ledger of a healthy
+node.
+:meta hide-value:
+"""
+
+DEFAULT_EWMA_WEIGHT: Final[float] = 0.3
+"""
+The default weight of the latest latency in the moving average of an endpoint.
+:meta hide-value:
+"""
+
+DEFAULT_HEDGE_PERCENTILE: Final[float] = 95.0
+"""
+The default percentile of the recent latencies of a method after which a request
+is hedged.
+:meta hide-value:
+"""
+
+HEDGEABLE_METHODS: Final[FrozenSet[RequestMethod]] = frozenset(
+    [
+        RequestMethod.ACCOUNT_CHANNELS,
+        RequestMethod.ACCOUNT_CURRENCIES,
+        RequestMethod.ACCOUNT_INFO,
+        RequestMethod.ACCOUNT_LINES,
+        RequestMethod.ACCOUNT_NFTS,
+        RequestMethod.ACCOUNT_OBJECTS,
+        RequestMethod.ACCOUNT_OFFERS,
+        RequestMethod.ACCOUNT_TX,
+        RequestMethod.GATEWAY_BALANCES,
+        RequestMethod.NO_RIPPLE_CHECK,
+        RequestMethod.TRANSACTION_ENTRY,
+        RequestMethod.TX,
+        RequestMethod.CHANNEL_VERIFY,
+        RequestMethod.BOOK_OFFERS,
+        RequestMethod.DEPOSIT_AUTHORIZED,
+        RequestMethod.RIPPLE_PATH_FIND,
+        RequestMethod.LEDGER,
+        RequestMethod.LEDGER_CLOSED,
+        RequestMethod.LEDGER_CURRENT,
+        RequestMethod.LEDGER_DATA,
+        RequestMethod.LEDGER_ENTRY,
+        RequestMethod.NFT_BUY_OFFERS,
+        RequestMethod.NFT_SELL_OFFERS,
+        RequestMethod.NFT_INFO,
+        RequestMethod.NFT_HISTORY,
+        RequestMethod.NFTS_BY_ISSUER,
+        RequestMethod.FEATURE,
+        RequestMethod.FEE,
+        RequestMethod.MANIFEST,
+        RequestMethod.SERVER_DEFINITIONS,
+        RequestMethod.SERVER_INFO,
+        RequestMethod.SERVER_STATE,
+        RequestMethod.AMM_INFO,
+        RequestMethod.GET_AGGREGATE_PRICE,
+    ]
+)
+"""
+The read-only methods a ``ClientPool`` can hedge. Methods that change the ledger,
+such as ``submit``, or the state of a connection, such as ``subscribe``, are never
+hedged.
+:meta hide-value:
+"""
+
+# the number of recent latencies of each method the hedging delay is computed from,
+# and how many of them are needed before requests are hedged
+_HEDGE_WINDOW: Final[int] = 200
+_HEDGE_MIN_SAMPLES: Final[int] = 20
+
+_HEALTHY_SERVER_STATES: Final[FrozenSet[str]] = frozenset(
+    ["full", "validating", "proposing"]
+)
+
+
+class PoolPolicy(str, Enum):
+    """How a ``ClientPool`` picks the endpoint of each request."""
+
+    ROUND_ROBIN = "round_robin"
+    """Each endpoint in turn."""
+
+    LEAST_OUTSTANDING = "least_outstanding"
+    """The endpoint with the fewest requests in flight."""
+
+    LATENCY_EWMA = "latency_ewma"
+    """
+    The endpoint with the lowest moving average of its latency, multiplied by one
+    more than its number of requests in flight. Endpoints without a measured latency
+    are tried first.
+    """
+
+
+class PoolEndpoint:
+    """The statistics and health of one client of a ``ClientPool``."""
+
+    def __init__(self: Self, client: AsyncClient) -> None:
+        """
+        Initializes an endpoint.
+
+        Args:
+            client: The client that sends the requests of this endpoint.
+        """
+        self.client = client
+        """The client that sends the requests of this endpoint."""
+
+        self.outstanding = 0
+        """The number of requests in flight."""
+
+        self.latency_ewma: Optional[float] = None
+        """
+        The exponentially weighted moving average of the latency in seconds, or None
+        before the first response.
+        """
+
+        self.healthy = True
+        """Whether the last health check passed. Unhealthy endpoints get no requests."""
+
+        self.server_state: Optional[str] = None
+        """The ``server_state`` of the node at the last health check."""
+
+        self.ledger_age: Optional[float] = None
+        """The age of the latest validated ledger at the last health check."""
+
+        self.load_factor: Optional[float] = None
+        """The ``load_factor`` of the node at the last health check."""
+
+    def __repr__(self: Self) -> str:
+        """
+        Returns a string with the URL and statistics of the endpoint.
+
+        Returns:
+            A string with the URL and statistics of the endpoint.
+        """
+        return (
+            f"PoolEndpoint(url={self.client.url!r}, healthy={self.healthy}, "
+            f"outstanding={self.outstanding}, latency_ewma={self.latency_ewma})"
+        )
+
+
+PoolSelector = Callable[[Sequence[PoolEndpoint]], PoolEndpoint]
+"""A function that picks the endpoint of a request among the healthy endpoints."""
+
+
+class ClientPool(AsyncClient):
+    """
+    An async client that spreads requests over several rippled nodes.
+
+    The pool sends each request to one of its clients, picked by its ``policy``.
+    While it is open, it checks the health of every node with ``server_info``
+    requests, and stops sending requests to nodes that are not in sync, whose
+    latest validated ledger is too old or whose load factor is too high. The
+    helper functions accept a pool like any other client::
+
+        clients = [AsyncJsonRpcClient(url) for url in urls]
+        async with ClientPool(clients, policy=PoolPolicy.LATENCY_EWMA) as pool:
+            print(await get_fee(pool))
+
+    If no node is healthy, the requests are spread over all of them.
+
+    Read requests can also be hedged to cut the latency of slow nodes: when a node
+    takes longer to answer than most recent requests of the same method, the
+    request is sent to another node too, and the first answer wins::
+
+        pool = ClientPool(
+            clients,
+            hedge_methods=[RequestMethod.ACCOUNT_INFO, RequestMethod.TX],
+            hedge_percentile=95,
+        )
+    """
+
+    def __init__(
+        self: Self,
+        clients: Sequence[AsyncClient],
+        *,
+        policy: Union[PoolPolicy, PoolSelector] = PoolPolicy.ROUND_ROBIN,
+        health_check_interval: Optional[float] = DEFAULT_HEALTH_CHECK_INTERVAL,
+        max_ledger_age: Optional[float] = DEFAULT_MAX_LEDGER_AGE,
+        max_load_factor: Optional[float] = None,
+        ewma_weight: float = DEFAULT_EWMA_WEIGHT,
+        hedge_methods: Collection[RequestMethod] = (),
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    ) -> None:
+        """
+        Initializes a pool of clients.
+
+        Args:
+            clients: The async clients of the nodes to send requests to. Sync
+                clients block the event loop of the pool until they are answered,
+                so they are not accepted.
+            policy: How to pick the endpoint of each request. Either a
+                ``PoolPolicy``, or a function that picks one of the healthy
+                endpoints it is given.
+            health_check_interval: The number of seconds between the health checks
+                of an open pool. None turns the periodic checks off.
+            max_ledger_age: The maximum age, in seconds, of the latest validated
+                ledger of a healthy node. None means no limit.
+            max_load_factor: The maximum ``load_factor`` of a healthy node. None
+                means no limit.
+            ewma_weight: The weight of the latest latency in the moving average of
+                an endpoint, between 0 and 1.
+            hedge_methods: The methods to hedge: if a request of one of these
+                methods takes longer than ``hedge_percentile`` of their recent
+                requests, it is sent to a second node too, and the first answer
+                wins. Only ``HEDGEABLE_METHODS`` can be hedged. By default, no
+                requests are hedged.
+            hedge_percentile: The percentile, between 0 and 100, of the recent
+                latencies of a method after which its requests are hedged.
+
+        Raises:
+            ValueError: if there are no clients, a client is not async, ewma_weight
+                is not between 0 and 1, hedge_percentile is not between 0 and 100,
+                or a hedge method is not hedgeable.
+        """
+        if len(clients) == 0:
+            raise ValueError("A ClientPool needs at least one client.")
+        for client in clients:
+            if not isinstance(client, AsyncClient):
+                raise ValueError(
+                    f"A ClientPool only accepts async clients, not {client!r}."
+                )
+        if not 0 < ewma_weight <= 1:
+            raise ValueError("ewma_weight must be between 0 and 1.")
+        if not 0 <= hedge_percentile <= 100:
+            raise ValueError("hedge_percentile must be between 0 and 100.")
+        unhedgeable = set(hedge_methods) - HEDGEABLE_METHODS
+        if unhedgeable:
+            raise ValueError(f"These methods cannot be hedged: {unhedgeable}.")
+        self.endpoints: List[PoolEndpoint] = [PoolEndpoint(c) for c in clients]
+        """The endpoints of the pool, one per client."""
+        self.policy = policy
+        self.health_check_interval = health_check_interval
+        self.max_ledger_age = max_ledger_age
+        self.max_load_factor = max_load_factor
+        self.ewma_weight = ewma_weight
+        self.hedge_methods = frozenset(hedge_methods)
+        self.hedge_percentile = hedge_percentile
+        self.hedged_requests = 0
+        """The number of requests that were sent to a second node."""
+        self.hedge_wins = 0
+        """The number of hedged requests that the second node answered first."""
+        self._latencies: Dict[RequestMethod, Deque[float]] = {}
+        self._turns = count()
+        self._health_check_task: Optional[asyncio.Task[None]] = None
+        super().__init__(", ".join(client.url for client in clients))
+
+    def is_open(self: Self) -> bool:
+        """
+        Returns whether the pool is currently open.
+
+        Returns:
+            True if the pool is currently open, False otherwise.
+        """
+        return self._health_check_task is not None
+
+    async def open(self: Self) -> None:
+        """Opens every client, and checks the health of the nodes."""
+        if self.is_open():
+            return
+        await self._call_clients("open")
+        await self.check_health()
+        self._health_check_task = asyncio.create_task(self._check_health_forever())
+
+    async def close(self: Self) -> None:
+        """Stops the health checks, and closes every client."""
+        if not self.is_open():
+            return
+        health_check_task = cast("asyncio.Task[None]", self._health_check_task)
+        self._health_check_task = None
+        health_check_task.cancel()
+        # wait for the cancelled checks to stop before their clients are closed
+        await asyncio.gather(health_check_task, return_exceptions=True)
+        await self._call_clients("close")
+
+    async def _call_clients(self: Self, method_name: str) -> None:
+        # only the clients with a lifecycle, such as AsyncWebsocketClient,
+        # AsyncJsonRpcClient or a nested ClientPool, have open and close methods
+        await asyncio.gather(
+            *(
+                getattr(endpoint.client, method_name)()
+                for endpoint in self.endpoints
+                if hasattr(endpoint.client, method_name)
+            )
+        )
+
+    async def __aenter__(self: Self) -> Self:
+        """
+        Enters an async context after opening itself.
+
+        Returns:
+            The opened pool.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self: Self,
+        _exc_type: Type[BaseException],
+        _exc_val: BaseException,
+        _trace: TracebackType,
+    ) -> None:
+        """Exits an async context after closing itself."""
+        await self.close()
+
+    async def check_health(self: Self) -> None:
+        """
+        Sends a ``server_info`` request to every node, and marks the nodes that do
+        not answer, are not in sync, or lag or are loaded beyond the limits of the
+        pool as unhealthy.
+        """
+        await asyncio.gather(
+            *(self._check_endpoint_health(endpoint) for endpoint in self.endpoints)
+        )
+
+    async def _check_health_forever(self: Self) -> None:
+        if self.health_check_interval is None:
+            return
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check_health()
+
+    async def _check_endpoint_health(self: Self, endpoint: PoolEndpoint) -> None:
+        # a node that fails the request or answers with an unexpected result is
+        # unhealthy, and the health checks of the other nodes go on
+        try:
+            response = await self._send(endpoint, ServerInfo(), REQUEST_TIMEOUT)
+            endpoint.healthy = response.is_successful() and self._is_healthy(
+                endpoint, response.result["info"]
+            )
+        except Exception:
+            endpoint.healthy = False
+
+    def _is_healthy(self: Self, endpoint: PoolEndpoint, info: Dict[str, Any]) -> bool:
+        endpoint.server_state = info.get("server_state")
+        endpoint.ledger_age = (info.get("validated_ledger") or {}).get("age")
+        endpoint.load_factor = info.get("load_factor")
+        return (
+            endpoint.server_state in _HEALTHY_SERVER_STATES
+            and (
+                self.max_ledger_age is None
+                or (
+                    endpoint.ledger_age is not None
+                    and endpoint.ledger_age <= self.max_ledger_age
+                )
+            )
+            and (
+                self.max_load_factor is None
+                or endpoint.load_factor is None
+                or endpoint.load_factor <= self.max_load_factor
+            )
+        )
+
+    def _select(
+        self: Self, exclude: Optional[PoolEndpoint] = None
+    ) -> Optional[PoolEndpoint]:
+        candidates = [
+            endpoint for endpoint in self.endpoints if endpoint is not exclude
+        ]
+        endpoints = [endpoint for endpoint in candidates if endpoint.healthy]
+        if len(endpoints) == 0:
+            endpoints = candidates
+        if len(endpoints) == 0:
+            return None
+        if not isinstance(self.policy, PoolPolicy):
+            return self.policy(endpoints)
+
+        # start from the next endpoint in turn, so that ties are broken fairly
+        start = next(self._turns) % len(endpoints)
+        endpoints = endpoints[start:] + endpoints[:start]
+        if self.policy == PoolPolicy.LEAST_OUTSTANDING:
+            return min(endpoints, key=lambda endpoint: endpoint.outstanding)
+        if self.policy == PoolPolicy.LATENCY_EWMA:
+            return min(
+                endpoints,
+                key=lambda endpoint: (endpoint.latency_ewma or 0.0)
+                * (endpoint.outstanding + 1),
+            )
+        return endpoints[0]
+
+    async def _send(
+        self: Self, endpoint: PoolEndpoint, request: Request, timeout: float
+    ) -> Response:
+        endpoint.outstanding += 1
+        start = monotonic()
+        try:
+            response = await endpoint.client._request_impl(request, timeout=timeout)
+        finally:
+            endpoint.outstanding -= 1
+        latency = monotonic() - start
+        if endpoint.latency_ewma is None:
+            endpoint.latency_ewma = latency
+        else:
+            endpoint.latency_ewma += self.ewma_weight * (
+                latency - endpoint.latency_ewma
+            )
+        return response
+
+    async def _request_impl(
+        self: Self, request: Request, *, timeout: float = REQUEST_TIMEOUT
+    ) -> Response:
+        """
+        ``_request_impl`` implementation for a pool, which sends the request to the
+        endpoint picked by the policy of the pool, and hedges it on a second
+        endpoint if its method is hedged and the first one is slow to answer.
+
+        Arguments:
+            request: An object representing information about a rippled request.
+            timeout: The maximum tolerable delay on waiting for a response.
+
+        Returns:
+            The response from the server, as a Response object.
+
+        :meta private:
+        """
+        return await self._coalesce(
+            request, timeout, lambda: self._send_hedged(request, timeout)
+        )
+
+    async def _send_hedged(self: Self, request: Request, timeout: float) -> Response:
+        start = monotonic()
+        response = await self._race(request, timeout)
+        # one latency per request, from the first send to the first answer. timing
+        # each send instead would miss the slow requests that hedging cancels, and
+        # time hedges from when they were sent, so the hedging delay would drift
+        # below its percentile
+        if request.method in self.hedge_methods:
+            self._latencies.setdefault(
+                request.method, deque(maxlen=_HEDGE_WINDOW)
+            ).append(monotonic() - start)
+        return response
+
+    async def _race(self: Self, request: Request, timeout: float) -> Response:
+        primary = cast(PoolEndpoint, self._select())
+        hedge_delay = self._get_hedge_delay(request.method)
+        if hedge_delay is None:
+            return await self._send(primary, request, timeout)
+
+        primary_task = asyncio.ensure_future(self._send(primary, request, timeout))
+        tasks: Set[asyncio.Future[Response]] = {primary_task}
+        try:
+            done, tasks = await asyncio.wait(tasks, timeout=hedge_delay)
+            secondary = None if done else self._select(exclude=primary)
+            if secondary is not None:
+                self.hedged_requests += 1
+                tasks.add(
+                    asyncio.ensure_future(self._send(secondary, request, timeout))
+                )
+            # the first response wins. an error only wins once both have failed
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary_task:
+                            self.hedge_wins += 1
+                        return task.result()
+            return done.pop().result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _get_hedge_delay(self: Self, method: RequestMethod) -> Optional[float]:
+        if method not in self.hedge_methods or len(self.endpoints) < 2:
+            return None
+        latencies = self._latencies.get(method)
+        if latencies is None or len(latencies) < _HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(latencies)
+        return ordered[
+            min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        ]
@@ -3,16 +3,41 @@
 from __future__ import annotations
 
 from json import JSONDecodeError
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from httpx import AsyncClient
-from typing_extensions import Self
+from httpx import AsyncClient, Limits
+from httpx import Response as HttpResponse
+from typing_extensions import Final, Self
 
-from xrpl.asyncio.clients.client import REQUEST_TIMEOUT, Client
+from xrpl.asyncio.clients.client import (
+    DEFAULT_MAX_IN_FLIGHT,
+    REQUEST_TIMEOUT,
+    Client,
+    gather_in_window,
+)
 from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
 from xrpl.asyncio.clients.utils import json_to_response, request_to_json_rpc
 from xrpl.models.requests.request import Request
 from xrpl.models.response import Response
 
+DEFAULT_MAX_CONNECTIONS: Final[int] = 100
+"""
+The default maximum number of connections an open JSON RPC client makes at once.
+:meta hide-value:
+"""
+
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+"""
+The default maximum number of idle connections an open JSON RPC client keeps alive.
+:meta hide-value:
+"""
+
+DEFAULT_KEEPALIVE_EXPIRY: Final[float] = 5.0
+"""
+The default number of seconds an open JSON RPC client keeps an idle connection.
+:meta hide-value:
+"""
+
 
 class JsonRpcBase(Client):
     """
@@ -21,12 +46,94 @@ class JsonRpcBase(Client):
     :meta private:
     """
 
+    def __init__(
+        self: Self,
+        url: str,
+        *,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes a JSON RPC client.
+
+        Arguments:
+            url: The URL of the rippled node to submit requests to.
+            max_connections: The maximum number of connections the client makes at
+                once while it is open. None means no limit.
+            max_keepalive_connections: The maximum number of idle connections the
+                client keeps alive while it is open. None means no limit.
+            keepalive_expiry: How many seconds an idle connection is kept alive.
+                None means forever.
+            http2: Whether to use HTTP/2 when the server supports it. This requires
+                the ``h2`` package, installed with the ``http2`` extra.
+            max_batch_size: If set, ``request_many`` combines up to this many
+                requests into one rippled ``batch`` request. Only use this with
+                servers that accept ``batch`` requests.
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self._max_batch_size = max_batch_size
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._http_client: Optional[AsyncClient] = None
+        super().__init__(url)
+
+    def is_open(self: Self) -> bool:
+        """
+        Returns whether the client is currently open, i.e. whether it keeps its
+        connections to the server alive between requests.
+
+        Returns:
+            True if the client is currently open, False otherwise.
+        """
+        return self._http_client is not None
+
+    async def _do_open(self: Self) -> None:
+        """Creates the pool of connections to the server."""
+        self._http_client = AsyncClient(
+            limits=self._limits, http2=self._http2, timeout=REQUEST_TIMEOUT
+        )
+
+    async def _do_close(self: Self) -> None:
+        """Closes the pool of connections to the server."""
+        if self._http_client is not None:
+            http_client, self._http_client = self._http_client, None
+            await http_client.aclose()
+
     async def _request_impl(
         self: Self, request: Request, *, timeout: float = REQUEST_TIMEOUT
     ) -> Response:
         """
         Base ``_request_impl`` implementation for JSON RPC.
 
+        Arguments:
+            request: An object representing information about a rippled request.
+            timeout: The duration within which we expect to hear a response from the
+            rippled validator.
+
+        Returns:
+            The response from the server, as a Response object.
+
+        :meta private:
+        """
+        return await self._coalesce(
+            request, timeout, lambda: self._do_request_impl(request, timeout)
+        )
+
+    async def _do_request_impl(
+        self: Self, request: Request, timeout: float = REQUEST_TIMEOUT
+    ) -> Response:
+        """
+        Sends a request over the pooled connections of an open client, or over a
+        new connection otherwise.
+
         Arguments:
             request: An object representing information about a rippled request.
             timeout: The duration within which we expect to hear a response from the
@@ -40,17 +147,160 @@ class JsonRpcBase(Client):
 
         :meta private:
         """
-        async with AsyncClient(timeout=timeout) as http_client:
-            response = await http_client.post(
-                self.url,
-                json=request_to_json_rpc(request),
+        if self._http_client is not None:
+            return await self._send(self._http_client, request, timeout)
+        async with AsyncClient(timeout=timeout, http2=self._http2) as http_client:
+            return await self._send(http_client, request, timeout)
+
+    async def _request_many_impl(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        Base ``_request_many_impl`` implementation for JSON RPC.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+
+        :meta private:
+        """
+        return await self._do_request_many(requests, max_in_flight, timeout)
+
+    async def _do_request_many(
+        self: Self,
+        requests: Sequence[Request],
+        max_in_flight: int,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        Sends many requests over the pooled connections of an open client, or over
+        connections shared by these requests otherwise.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of HTTP requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+
+        :meta private:
+        """
+        if self._http_client is not None:
+            return await self._send_many(
+                self._http_client, requests, max_in_flight, timeout
+            )
+        async with AsyncClient(
+            limits=self._limits, http2=self._http2, timeout=timeout
+        ) as http_client:
+            return await self._send_many(http_client, requests, max_in_flight, timeout)
+
+    async def _send_many(
+        self: Self,
+        http_client: AsyncClient,
+        requests: Sequence[Request],
+        max_in_flight: int,
+        timeout: float,
+    ) -> List[Union[Response, Exception]]:
+        if self._max_batch_size is None:
+            return await gather_in_window(
+                lambda request: self._send(http_client, request, timeout),
+                requests,
+                max_in_flight,
             )
+
+        batches = [
+            requests[i : i + self._max_batch_size]
+            for i in range(0, len(requests), self._max_batch_size)
+        ]
+        batch_results = await gather_in_window(
+            lambda batch: self._send_batch(http_client, batch, timeout),
+            batches,
+            max_in_flight,
+        )
+        results: List[Union[Response, Exception]] = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                # a batch that failed as a whole fails each of its requests
+                results.extend([batch_result] * len(batch))
+            else:
+                results.extend(batch_result)
+        return results
+
+    async def _send(
+        self: Self, http_client: AsyncClient, request: Request, timeout: float
+    ) -> Response:
+        """
+        Sends one request.
+
+        Raises:
+            XRPLRequestFailureException: if response can't be JSON decoded.
+        """
+        response = await self._post(http_client, request_to_json_rpc(request), timeout)
+        return json_to_response(_decode_json(response))
+
+    async def _send_batch(
+        self: Self,
+        http_client: AsyncClient,
+        requests: Sequence[Request],
+        timeout: float,
+    ) -> List[Union[Response, Exception]]:
+        """
+        Sends many requests in one rippled ``batch`` request.
+
+        Raises:
+            XRPLRequestFailureException: if response can't be JSON decoded, or is
+                not a result for each request.
+        """
+        response = await self._post(
+            http_client,
+            {
+                "method": "batch",
+                "params": [request_to_json_rpc(request) for request in requests],
+            },
+            timeout,
+        )
+        batch_result = _decode_json(response)
+        if not isinstance(batch_result, list) or len(batch_result) != len(requests):
+            raise XRPLRequestFailureException(
+                {
+                    "error": response.status_code,
+                    "error_message": "The server did not answer the batch request "
+                    f"with one result per request: {response.text}",
+                }
+            )
+        results: List[Union[Response, Exception]] = []
+        for result in batch_result:
             try:
-                return json_to_response(response.json())
-            except JSONDecodeError:
-                raise XRPLRequestFailureException(
-                    {
-                        "error": response.status_code,
-                        "error_message": response.text,
-                    }
-                )
+                results.append(json_to_response(result))
+            except (KeyError, TypeError):
+                # the server rejected this request before running it
+                results.append(XRPLRequestFailureException(result))
+        return results
+
+    async def _post(
+        self: Self, http_client: AsyncClient, body: Dict[str, Any], timeout: float
+    ) -> HttpResponse:
+        return await http_client.post(self.url, json=body, timeout=timeout)
+
+
+def _decode_json(response: HttpResponse) -> Any:  # noqa: ANN401
+    try:
+        return response.json()
+    except JSONDecodeError:
+        raise XRPLRequestFailureException(
+            {
+                "error": response.status_code,
+                "error_message": response.text,
+            }
+        )
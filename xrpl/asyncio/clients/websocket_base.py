@@ -4,20 +4,32 @@ from __future__ import annotations
 
 import asyncio
 import json
-from random import randrange
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
 from typing_extensions import Final, Self
 from websockets import client as websocket_client
 
-from xrpl.asyncio.clients.client import Client
+from xrpl.asyncio.clients.client import Client, gather_in_window
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.clients.utils import request_to_websocket, websocket_to_response
 from xrpl.models.requests.request import Request
 from xrpl.models.response import Response
 
 _PAYLOAD_MAX_SIZE: Final[int] = 2**24
-_REQ_ID_MAX: Final[int] = 1_000_000
+
+# generated IDs must not collide, since many requests can be in flight on one socket
+_REQUEST_IDS: Final[Iterator[int]] = count()
 
 # the types from asyncio are not implemented as generics in python 3.8 and
 # lower, so we need to only subscript them when running typechecking.
@@ -35,7 +47,7 @@ def _inject_request_id(request: Request) -> Request:
     """
     Given a Request with an ID, return the same Request.
 
-    Given a Request without an ID, make a copy with a randomly generated ID.
+    Given a Request without an ID, make a copy with a generated ID.
 
     Arguments:
         request: The request to inject an ID into.
@@ -46,7 +58,7 @@ def _inject_request_id(request: Request) -> Request:
     if request.id is not None:
         return request
     request_dict = request.to_dict()
-    request_dict["id"] = f"{request.method}_{randrange(_REQ_ID_MAX)}"
+    request_dict["id"] = f"{request.method}_{next(_REQUEST_IDS)}"
     return Request.from_dict(request_dict)
 
 
@@ -238,3 +250,25 @@ class WebsocketBase(Client):
             del self._open_requests[request_str]
 
         return websocket_to_response(raw_response)
+
+    async def _do_request_many(
+        self: Self, requests: Sequence[Request], max_in_flight: int, timeout: float
+    ) -> List[Union[Response, Exception]]:
+        """
+        Base ``_request_many_impl`` implementation for websockets, which pipelines
+        the requests on the socket.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+        """
+        return await gather_in_window(
+            lambda request: self._do_request_impl(request, timeout),
+            requests,
+            max_in_flight,
+        )
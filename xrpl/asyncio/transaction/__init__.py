@@ -1,10 +1,12 @@
 """Async methods for working with transactions on the XRP Ledger."""
 
 from xrpl.asyncio.transaction.main import (
+    SignedTransaction,
     _calculate_fee_per_transaction_type,
     autofill,
     autofill_and_sign,
     sign,
+    sign_and_encode,
     sign_and_submit,
     simulate,
     submit,
@@ -19,11 +21,13 @@ __all__ = [
     "autofill",
     "autofill_and_sign",
     "sign",
+    "sign_and_encode",
     "sign_and_submit",
     "simulate",
     "submit",
     "submit_and_wait",
     "transaction_json_to_binary_codec_form",
+    "SignedTransaction",
     "XRPLReliableSubmissionException",
     "_calculate_fee_per_transaction_type",
 ]
@@ -1,7 +1,8 @@
 """High-level transaction methods with XRPL transactions."""
 
 import math
-from typing import Any, Dict, List, Optional, Union, cast
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Generic, List, Optional, Tuple, Union, cast
 
 from typing_extensions import Final, TypeVar
 
@@ -11,7 +12,14 @@ from xrpl.asyncio.clients.client import get_network_id_and_build_version
 from xrpl.asyncio.ledger import get_fee, get_latest_validated_ledger_sequence
 from xrpl.constants import XRPLException
 from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
-from xrpl.core.binarycodec import encode, encode_for_multisigning, encode_for_signing
+from xrpl.core.binarycodec import (
+    encode,
+    encode_bytes,
+    encode_bytes_for_multisigning,
+    encode_bytes_for_signing,
+    insert_field_bytes,
+)
+from xrpl.core.binarycodec.definitions import get_field_instance
 from xrpl.core.keypairs.main import sign as keypairs_sign
 from xrpl.models import (
     Batch,
@@ -23,6 +31,9 @@ from xrpl.models import (
     Transaction,
     TransactionFlag,
 )
+from xrpl.models.transactions.transaction import (
+    get_hash_from_bytes,
+)
 from xrpl.models.transactions.transaction import (
     transaction_json_to_binary_codec_form as model_transaction_to_binary_codec,
 )
@@ -39,9 +50,26 @@ _LEDGER_OFFSET: Final[int] = 20
 _RESTRICTED_NETWORKS = 1024
 _REQUIRED_NETWORKID_VERSION = "1.11.0"
 
+# encode_bytes_for_signing prepends this many bytes of hash prefix
+_SIGNING_PREFIX_LENGTH: Final[int] = 4
+
 T = TypeVar("T", bound=Transaction, default=Transaction)
 
 
+@dataclass(frozen=True)
+class SignedTransaction(Generic[T]):
+    """A signed transaction, along with its binary encoding and hash."""
+
+    transaction: T
+    """The signed transaction."""
+
+    tx_blob: str
+    """The signed transaction in the XRPL's binary format, ready to submit."""
+
+    hash: str
+    """The hash of the signed transaction, which identifies it on the ledger."""
+
+
 async def sign_and_submit(
     transaction: Transaction,
     client: Client,
@@ -96,11 +124,9 @@ def sign(
     transaction_json = _prepare_transaction(transaction)
     if multisign:
         signature = keypairs_sign(
-            bytes.fromhex(
-                encode_for_multisigning(
-                    transaction_json,
-                    wallet.address,
-                )
+            encode_bytes_for_multisigning(
+                transaction_json,
+                wallet.address,
             ),
             wallet.private_key,
         )
@@ -115,12 +141,70 @@ def sign(
         ]
         return cast(T, Transaction.from_xrpl(transaction_json))
 
+    return sign_and_encode(transaction, wallet).transaction
+
+
+def sign_and_encode(transaction: T, wallet: Wallet) -> SignedTransaction[T]:
+    """
+    Signs a transaction locally, without trusting external rippled nodes, and
+    returns the signed transaction along with its binary encoding and hash.
+
+    The transaction is only encoded once: the signature is added to the encoding
+    that was signed.
+
+    Args:
+        transaction: the transaction to be signed.
+        wallet: the wallet with which to sign the transaction.
+
+    Returns:
+        The signed transaction, its blob and its hash.
+    """
+    transaction_json, is_changed = _prepare_transaction_json(transaction)
     transaction_json["SigningPubKey"] = wallet.public_key
-    serialized_for_signing = encode_for_signing(transaction_json)
-    serialized_bytes = bytes.fromhex(serialized_for_signing)
-    signature = keypairs_sign(serialized_bytes, wallet.private_key)
+    signing_bytes = encode_bytes_for_signing(transaction_json)
+    signature = keypairs_sign(signing_bytes, wallet.private_key)
     transaction_json["TxnSignature"] = signature
-    return cast(T, Transaction.from_xrpl(transaction_json))
+
+    if all(get_field_instance(field).is_signing for field in transaction_json):
+        # the signing encoding has every field, so it only lacks the signature
+        tx_bytes = insert_field_bytes(
+            memoryview(signing_bytes)[_SIGNING_PREFIX_LENGTH:],
+            "TxnSignature",
+            signature,
+        )
+    else:
+        # e.g. the BatchSigners of a Batch, which aren't signed by the account
+        tx_bytes = encode_bytes(transaction_json)
+
+    signed_transaction: T
+    if is_changed or not _has_init_signature_fields(transaction):
+        # preparing the transaction changed some of its fields, or it is a
+        # pseudo-transaction, which can't be given a signature
+        signed_transaction = cast(T, Transaction.from_xrpl(transaction_json))
+    else:
+        # flags are normalized to an integer, as `from_xrpl` would. The transaction
+        # was validated when it was created, so it isn't validated again
+        signed_transaction = type(transaction).construct(
+            **{
+                **transaction.__dict__,
+                "flags": transaction_json.get("Flags", transaction.flags),
+                "signing_pub_key": wallet.public_key,
+                "txn_signature": signature,
+            }
+        )
+    return SignedTransaction(
+        transaction=signed_transaction,
+        tx_blob=tx_bytes.hex().upper(),
+        hash=get_hash_from_bytes(tx_bytes),
+    )
+
+
+def _has_init_signature_fields(transaction: Transaction) -> bool:
+    return all(
+        field.init
+        for field in fields(transaction)
+        if field.name in ("signing_pub_key", "txn_signature")
+    )
 
 
 async def autofill_and_sign(
@@ -237,10 +321,35 @@ def _prepare_transaction(transaction: Transaction) -> Dict[str, Any]:
             if an address tag is provided that does not match the X-Address tag, or if
             attempting to directly sign a Batch inner transaction.
     """
+    return _prepare_transaction_json(transaction)[0]
+
+
+def _prepare_transaction_json(
+    transaction: Transaction,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Prepares a Transaction like `_prepare_transaction`, and also reports whether
+    that changed any of its fields, such as an X-Address converted to a classic
+    address.
+
+    Args:
+        transaction: the Transaction to be prepared.
+
+    Returns:
+        A JSON-like dictionary that is ready to be signed, and whether its fields
+        differ from those of the transaction.
+
+    Raises:
+        XRPLException: if an address tag is provided that does not match the
+            X-Address tag, or if attempting to directly sign a Batch inner
+            transaction.
+    """
     if transaction.has_flag(TransactionFlag.TF_INNER_BATCH_TXN):
         raise XRPLException("Cannot directly sign a batch inner transaction.")
 
     transaction_json = transaction.to_xrpl()
+    # the conversions below only replace or add top-level fields
+    original_json = dict(transaction_json)
 
     _validate_account_xaddress(transaction_json, "Account", "SourceTag")
     if "Destination" in transaction_json:
@@ -254,7 +363,7 @@ def _prepare_transaction(transaction: Transaction) -> Dict[str, Any]:
     # SetRegularKey
     _convert_to_classic_address(transaction_json, "RegularKey")
 
-    return transaction_json
+    return transaction_json, transaction_json != original_json
 
 
 async def autofill(
@@ -1,10 +1,208 @@
 """A sync client for interacting with the rippled JSON RPC."""
 
-from xrpl.asyncio.clients.json_rpc_base import JsonRpcBase
+from __future__ import annotations
+
+import asyncio
+from threading import Thread
+from types import TracebackType
+from typing import List, Optional, Sequence, Type, Union, cast
+
+from typing_extensions import Self
+
+from xrpl.asyncio.clients.client import DEFAULT_MAX_IN_FLIGHT, REQUEST_TIMEOUT
+from xrpl.asyncio.clients.json_rpc_base import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    JsonRpcBase,
+)
 from xrpl.clients.sync_client import SyncClient
+from xrpl.models.requests.request import Request
+from xrpl.models.response import Response
 
 
 class JsonRpcClient(SyncClient, JsonRpcBase):
-    """A sync client for interacting with the rippled JSON RPC."""
+    """
+    A sync client for interacting with the rippled JSON RPC.
+
+    A client that is not open makes a new connection for every request. Opening
+    the client keeps a pool of connections to the server alive until it is closed,
+    which saves a TCP and TLS handshake on every request::
+
+        with JsonRpcClient(url) as client:
+            # inside the context the client reuses its connections
+            print(client.request(Fee()))
+        # after exiting the context, the connections are closed
+    """
+
+    def __init__(
+        self: Self,
+        url: str,
+        *,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Constructs a JsonRpcClient.
+
+        Arguments:
+            url: The URL of the rippled node to submit requests to.
+            max_connections: The maximum number of connections the client makes at
+                once while it is open. None means no limit.
+            max_keepalive_connections: The maximum number of idle connections the
+                client keeps alive while it is open. None means no limit.
+            keepalive_expiry: How many seconds an idle connection is kept alive.
+                None means forever.
+            http2: Whether to use HTTP/2 when the server supports it. This requires
+                the ``h2`` package, installed with the ``http2`` extra.
+            max_batch_size: If set, ``request_many`` combines up to this many
+                requests into one rippled ``batch`` request. Only use this with
+                servers that accept ``batch`` requests.
+        """
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        super().__init__(
+            url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_batch_size=max_batch_size,
+        )
+
+    def is_open(self: Self) -> bool:
+        """
+        Returns whether the client is currently open, i.e. whether it keeps its
+        connections to the server alive between requests.
+
+        Returns:
+            True if the client is currently open, False otherwise.
+        """
+        return self._loop is not None and self._thread is not None and super().is_open()
+
+    def open(self: Self) -> None:
+        """Opens a pool of connections to the server at the given URL."""
+        if self.is_open():
+            return
+
+        # the pooled connections belong to one event loop, but every sync request
+        # runs in a new one, so the pool lives on the event loop of a child thread
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(
+            target=self._loop.run_forever,
+            daemon=True,
+        )
+        self._thread.start()
+
+        # run JsonRpcBase._do_open on the event loop of the child thread and
+        # wait for it to finish
+        asyncio.run_coroutine_threadsafe(self._do_open(), self._loop).result()
+
+    def close(self: Self) -> None:
+        """Closes the pooled connections."""
+        if not self.is_open():
+            return
+
+        # run JsonRpcBase._do_close on the event loop of the child thread and
+        # wait for it to finish
+        asyncio.run_coroutine_threadsafe(
+            self._do_close(), cast(asyncio.AbstractEventLoop, self._loop)
+        ).result()
+
+        # request the child thread to stop the loop and wait for it to
+        # terminate
+        cast(asyncio.AbstractEventLoop, self._loop).call_soon_threadsafe(
+            cast(asyncio.AbstractEventLoop, self._loop).stop
+        )
+        cast(Thread, self._thread).join()
+
+        # close the stopped loop
+        cast(asyncio.AbstractEventLoop, self._loop).close()
+
+        # clear state
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self: Self) -> Self:
+        """
+        Enters a context after opening itself.
+
+        Returns:
+            The opened client.
+        """
+        self.open()
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: Type[BaseException],
+        _exc_val: BaseException,
+        _trace: TracebackType,
+    ) -> None:
+        """Exits a context after closing itself."""
+        self.close()
+
+    async def _request_impl(
+        self: Self, request: Request, *, timeout: float = REQUEST_TIMEOUT
+    ) -> Response:
+        """
+        ``_request_impl`` implementation for the sync JSON RPC client that sends
+        the request over the pooled connections on the other thread while the
+        client is open.
+
+        Arguments:
+            request: An object representing information about a rippled request.
+            timeout: The duration within which we expect to hear a response from the
+            rippled validator.
+
+        Returns:
+            The response from the server, as a Response object.
+
+        :meta private:
+        """
+        if not self.is_open():
+            return await self._coalesce(
+                request, timeout, lambda: self._do_request_impl(request, timeout)
+            )
+
+        # like WebsocketClient, this blocks until the request is complete, just as
+        # if it were not async
+        return asyncio.run_coroutine_threadsafe(
+            self._coalesce(
+                request, timeout, lambda: self._do_request_impl(request, timeout)
+            ),
+            cast(asyncio.AbstractEventLoop, self._loop),
+        ).result()
+
+    async def _request_many_impl(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        ``_request_many_impl`` implementation for the sync JSON RPC client that
+        sends the requests over the pooled connections on the other thread while
+        the client is open.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
 
-    pass
+        :meta private:
+        """
+        if not self.is_open():
+            return await self._do_request_many(requests, max_in_flight, timeout)
+        return asyncio.run_coroutine_threadsafe(
+            self._do_request_many(requests, max_in_flight, timeout),
+            cast(asyncio.AbstractEventLoop, self._loop),
+        ).result()
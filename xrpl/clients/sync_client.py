@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from typing import List, Sequence, Union
 
 from typing_extensions import Self
 
-from xrpl.asyncio.clients.client import Client
+from xrpl.asyncio.clients.client import DEFAULT_MAX_IN_FLIGHT, Client
 from xrpl.models.requests.request import Request
 from xrpl.models.response import Response
 
@@ -29,3 +30,28 @@ class SyncClient(Client):
             The Response for the given Request.
         """
         return asyncio.run(self._request_impl(request))
+
+    def request_many(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        Makes many requests with this client, at most ``max_in_flight`` at a time,
+        and returns their responses.
+
+        A request that fails does not affect the others: the exception it raised
+        takes the place of its response.
+
+        Arguments:
+            requests: The Requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+
+        Returns:
+            The Response for each Request, or the exception it raised, in the order
+            of the Requests.
+        """
+        return asyncio.run(
+            self._request_many_impl(requests, max_in_flight=max_in_flight)
+        )
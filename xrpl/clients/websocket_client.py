@@ -6,11 +6,11 @@ import asyncio
 from concurrent.futures import CancelledError, TimeoutError
 from threading import Thread
 from types import TracebackType
-from typing import Any, Dict, Iterator, Optional, Type, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, Union, cast
 
 from typing_extensions import Self
 
-from xrpl.asyncio.clients.client import REQUEST_TIMEOUT
+from xrpl.asyncio.clients.client import DEFAULT_MAX_IN_FLIGHT, REQUEST_TIMEOUT
 from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.clients.websocket_base import WebsocketBase
 from xrpl.clients.sync_client import SyncClient
@@ -238,6 +238,40 @@ class WebsocketClient(SyncClient, WebsocketBase):
         # completely block the main thread until completed,
         # just as if it were not async.
         return asyncio.run_coroutine_threadsafe(
-            self._do_request_impl(request, timeout),
+            self._coalesce(
+                request, timeout, lambda: self._do_request_impl(request, timeout)
+            ),
+            cast(asyncio.AbstractEventLoop, self._loop),
+        ).result()
+
+    async def _request_many_impl(
+        self: Self,
+        requests: Sequence[Request],
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> List[Union[Response, Exception]]:
+        """
+        ``_request_many_impl`` implementation for sync websockets that pipelines
+        the requests on the event loop of the other thread.
+
+        Arguments:
+            requests: The requests to send.
+            max_in_flight: The maximum number of requests in flight at once.
+            timeout: The maximum tolerable delay on waiting for each response.
+
+        Returns:
+            The response to each request, or the exception it raised, in the order
+            of the requests.
+
+        Raises:
+            XRPLWebsocketException: If this WebsocketClient is not open.
+
+        :meta private:
+        """
+        if not self.is_open():
+            raise XRPLWebsocketException("Websocket is not open")
+        return asyncio.run_coroutine_threadsafe(
+            self._do_request_many(requests, max_in_flight, timeout),
             cast(asyncio.AbstractEventLoop, self._loop),
         ).result()
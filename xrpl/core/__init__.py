@@ -1,5 +1,20 @@
 """Core codec functions for interacting with the XRPL."""
 
-from xrpl.core import addresscodec, binarycodec, keypairs
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from xrpl.core import addresscodec, binarycodec, keypairs  # noqa: F401
 
 __all__ = ["addresscodec", "binarycodec", "keypairs"]
+
+
+# the codecs are imported on first access (PEP 562)
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
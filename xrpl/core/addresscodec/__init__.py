@@ -1,16 +1,23 @@
 """Functions for encoding and decoding XRP Ledger addresses and seeds."""
 
 from xrpl.core.addresscodec.codec import (
+    DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE,
     SEED_LENGTH,
+    ClassicAddressCacheInfo,
+    clear_classic_address_cache,
     decode_account_public_key,
     decode_classic_address,
+    decode_classic_addresses,
     decode_node_public_key,
     decode_seed,
     encode_account_public_key,
     encode_classic_address,
+    encode_classic_addresses,
     encode_node_public_key,
     encode_seed,
+    get_classic_address_cache_info,
     is_valid_classic_address,
+    set_classic_address_cache_size,
 )
 from xrpl.core.addresscodec.exceptions import XRPLAddressCodecException
 from xrpl.core.addresscodec.main import (
@@ -23,18 +30,25 @@ from xrpl.core.addresscodec.utils import XRPL_ALPHABET
 
 __all__ = [
     "classic_address_to_xaddress",
+    "ClassicAddressCacheInfo",
+    "clear_classic_address_cache",
     "decode_account_public_key",
     "decode_classic_address",
+    "decode_classic_addresses",
     "decode_node_public_key",
     "decode_seed",
     "encode_seed",
     "encode_account_public_key",
     "encode_classic_address",
+    "encode_classic_addresses",
     "encode_node_public_key",
     "ensure_classic_address",
+    "get_classic_address_cache_info",
     "is_valid_classic_address",
     "is_valid_xaddress",
+    "DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE",
     "SEED_LENGTH",
+    "set_classic_address_cache_size",
     "xaddress_to_classic_address",
     "XRPLAddressCodecException",
     "XRPL_ALPHABET",
@@ -1,6 +1,7 @@
 """This module encodes and decodes various types of base58 encodings."""
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import base58
 from typing_extensions import Final
@@ -32,6 +33,28 @@ _ALGORITHM_TO_PREFIX_MAP: Final[Dict[CryptoAlgorithm, List[List[int]]]] = {
     CryptoAlgorithm.SECP256K1: [_FAMILY_SEED_PREFIX],
 }  # first is default, rest are other options
 
+DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE: Final[int] = 8192
+"""
+The default number of classic addresses cached in each direction.
+:meta hide-value:
+"""
+
+
+class ClassicAddressCacheInfo(NamedTuple):
+    """Statistics for the classic address cache, in both directions combined."""
+
+    hits: int
+    """The number of encodes and decodes answered from the cache."""
+
+    misses: int
+    """The number of encodes and decodes that had to do base58 work."""
+
+    maxsize: int
+    """The maximum number of entries in each direction. 0 means caching is off."""
+
+    currsize: int
+    """The number of cached entries, in both directions."""
+
 
 def _encode(bytestring: bytes, prefix: List[int], expected_length: int) -> str:
     """
@@ -130,9 +153,76 @@ def decode_seed(
     )
 
 
+def _encode_classic_address(bytestring: bytes) -> str:
+    """Uncached `encode_classic_address`."""
+    return _encode(bytestring, _CLASSIC_ADDRESS_PREFIX, _CLASSIC_ADDRESS_LENGTH)
+
+
+def _decode_classic_address(classic_address: str) -> bytes:
+    """Uncached `decode_classic_address`."""
+    return _decode(classic_address, bytes(_CLASSIC_ADDRESS_PREFIX))
+
+
+# One cache maps 20-byte account IDs to classic addresses and the other maps them
+# back. Ledger data names the same few senders, issuers and destinations again and
+# again, and each conversion computes a base58check checksum (a double SHA-256) in
+# pure Python.
+_classic_address_cache_size = DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE
+_cached_encode_classic_address = lru_cache(DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE)(
+    _encode_classic_address
+)
+_cached_decode_classic_address = lru_cache(DEFAULT_CLASSIC_ADDRESS_CACHE_SIZE)(
+    _decode_classic_address
+)
+
+
+def set_classic_address_cache_size(maxsize: int) -> None:
+    """
+    Set how many classic addresses `encode_classic_address` and
+    `decode_classic_address` cache in each direction. This clears the cache.
+
+    Args:
+        maxsize: The maximum number of cached addresses in each direction. 0
+            turns caching off.
+
+    Raises:
+        XRPLAddressCodecException: If maxsize is negative.
+    """
+    global _classic_address_cache_size
+    global _cached_encode_classic_address, _cached_decode_classic_address
+    if maxsize < 0:
+        raise XRPLAddressCodecException("Cache size must not be negative.")
+    _classic_address_cache_size = maxsize
+    _cached_encode_classic_address = lru_cache(maxsize)(_encode_classic_address)
+    _cached_decode_classic_address = lru_cache(maxsize)(_decode_classic_address)
+
+
+def clear_classic_address_cache() -> None:
+    """Empty the classic address cache and reset its statistics."""
+    set_classic_address_cache_size(_classic_address_cache_size)
+
+
+def get_classic_address_cache_info() -> ClassicAddressCacheInfo:
+    """
+    Returns the statistics of the classic address cache.
+
+    Returns:
+        The hits, misses, maximum size and current size of the cache.
+    """
+    encode_info = _cached_encode_classic_address.cache_info()
+    decode_info = _cached_decode_classic_address.cache_info()
+    return ClassicAddressCacheInfo(
+        hits=encode_info.hits + decode_info.hits,
+        misses=encode_info.misses + decode_info.misses,
+        maxsize=_classic_address_cache_size,
+        currsize=encode_info.currsize + decode_info.currsize,
+    )
+
+
 def encode_classic_address(bytestring: bytes) -> str:
     """
     Returns the classic address encoding of these bytes as a base58 string.
+    Results are cached, see `set_classic_address_cache_size`.
 
     Args:
         bytestring: Bytes to be encoded.
@@ -140,12 +230,13 @@ def encode_classic_address(bytestring: bytes) -> str:
     Returns:
         The classic address encoding of these bytes as a base58 string.
     """
-    return _encode(bytestring, _CLASSIC_ADDRESS_PREFIX, _CLASSIC_ADDRESS_LENGTH)
+    return _cached_encode_classic_address(bytes(bytestring))
 
 
 def decode_classic_address(classic_address: str) -> bytes:
     """
     Returns the decoded bytes of the classic address.
+    Results are cached, see `set_classic_address_cache_size`.
 
     Args:
         classic_address: Classic address to be decoded.
@@ -153,7 +244,35 @@ def decode_classic_address(classic_address: str) -> bytes:
     Returns:
         The decoded bytes of the classic address.
     """
-    return _decode(classic_address, bytes(_CLASSIC_ADDRESS_PREFIX))
+    return _cached_decode_classic_address(classic_address)
+
+
+def encode_classic_addresses(bytestrings: Iterable[bytes]) -> List[str]:
+    """
+    Returns the classic address encodings of many account IDs.
+
+    Args:
+        bytestrings: The 20-byte account IDs to be encoded.
+
+    Returns:
+        The classic addresses, in the same order.
+    """
+    encode = _cached_encode_classic_address
+    return [encode(bytes(bytestring)) for bytestring in bytestrings]
+
+
+def decode_classic_addresses(classic_addresses: Iterable[str]) -> List[bytes]:
+    """
+    Returns the decoded bytes of many classic addresses.
+
+    Args:
+        classic_addresses: The classic addresses to be decoded.
+
+    Returns:
+        The 20-byte account IDs, in the same order.
+    """
+    decode = _cached_decode_classic_address
+    return [decode(classic_address) for classic_address in classic_addresses]
 
 
 def encode_node_public_key(bytestring: bytes) -> str:
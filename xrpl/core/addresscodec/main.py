@@ -1,6 +1,6 @@
 """This module handles everything related to X-Addresses."""
 
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 
 import base58
 from typing_extensions import Final
@@ -14,6 +14,13 @@ MAX_32_BIT_UNSIGNED_INT: Final[int] = 4294967295
 _PREFIX_BYTES_MAIN: Final[bytes] = bytes([0x05, 0x44])  # 5, 68
 _PREFIX_BYTES_TEST: Final[bytes] = bytes([0x04, 0x93])  # 4, 147
 
+# Every X-Address is 47 characters long, and the prefix bytes make it start with
+# "X" on the main network and "T" on test networks. Checking that first lets
+# is_valid_xaddress reject other strings without decoding them.
+_XADDRESS_LENGTH: Final[int] = 47
+_XADDRESS_LEADING_CHARS: Final[str] = "XT"
+_XRPL_ALPHABET_CHARS: Final[FrozenSet[str]] = frozenset(XRPL_ALPHABET.decode("utf-8"))
+
 # To better understand the cryptographic details, visit
 # https://github.com/xrp-community/standards-drafts/issues/6
 
@@ -180,6 +187,12 @@ def is_valid_xaddress(xaddress: str) -> bool:
     Returns:
         Whether ``xaddress`` is a valid X-Address.
     """
+    if (
+        len(xaddress) != _XADDRESS_LENGTH
+        or xaddress[0] not in _XADDRESS_LEADING_CHARS
+        or not _XRPL_ALPHABET_CHARS.issuperset(xaddress)
+    ):
+        return False
     try:
         xaddress_to_classic_address(xaddress)
         return True
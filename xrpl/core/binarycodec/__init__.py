@@ -3,22 +3,65 @@ Functions for encoding objects into the XRP Ledger's canonical
 binary format and decoding them.
 """
 
+from xrpl.core.binarycodec.columnar import AmountColumns, decode_columns
+from xrpl.core.binarycodec.decoded_object import DecodedObject
+from xrpl.core.binarycodec.definitions import (
+    Definitions,
+    DefinitionsRegistry,
+    use_definitions,
+)
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.main import (
     decode,
+    decode_bytes,
     encode,
+    encode_bytes,
+    encode_bytes_for_multisigning,
+    encode_bytes_for_multisigning_many,
+    encode_bytes_for_signing,
+    encode_bytes_for_signing_batch,
+    encode_bytes_for_signing_claim,
     encode_for_multisigning,
     encode_for_signing,
     encode_for_signing_batch,
     encode_for_signing_claim,
+    insert_field_bytes,
+)
+from xrpl.core.binarycodec.streaming import decode_stream
+from xrpl.core.binarycodec.types.st_object import (
+    DEFAULT_FIELD_ORDER_CACHE_SIZE,
+    FieldOrderCacheInfo,
+    clear_field_order_cache,
+    get_field_order_cache_info,
+    set_field_order_cache_size,
 )
 
 __all__ = [
+    "AmountColumns",
+    "clear_field_order_cache",
+    "DecodedObject",
+    "Definitions",
+    "DefinitionsRegistry",
+    "DEFAULT_FIELD_ORDER_CACHE_SIZE",
     "decode",
+    "decode_bytes",
+    "decode_columns",
+    "decode_stream",
     "encode",
+    "encode_bytes",
+    "encode_bytes_for_multisigning",
+    "encode_bytes_for_multisigning_many",
+    "encode_bytes_for_signing",
+    "encode_bytes_for_signing_batch",
+    "encode_bytes_for_signing_claim",
     "encode_for_signing_batch",
     "encode_for_multisigning",
     "encode_for_signing",
     "encode_for_signing_claim",
+    "FieldOrderCacheInfo",
+    "get_field_order_cache_info",
+    "insert_field_bytes",
+    "set_field_order_cache_size",
+    "use_definitions",
     "XRPLBinaryCodecException",
 ]
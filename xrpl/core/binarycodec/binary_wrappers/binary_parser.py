@@ -2,11 +2,11 @@
 
 from __future__ import annotations  # Requires Python 3.7+
 
-from typing import TYPE_CHECKING, Optional, Tuple, Type, cast
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Type, Union
 
 from typing_extensions import Final, Self
 
-from xrpl.core.binarycodec.definitions import definitions
+from xrpl.core.binarycodec.definitions.definitions import Definitions, get_definitions
 from xrpl.core.binarycodec.definitions.field_header import FieldHeader
 from xrpl.core.binarycodec.definitions.field_instance import FieldInstance
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
@@ -29,25 +29,71 @@ _MAX_DOUBLE_BYTE_VALUE: Final[int] = 65536
 
 
 class BinaryParser:
-    """Deserializes from hex-encoded XRPL binary format to JSON fields and values."""
+    """Deserializes from hex-encoded XRPL binary format to JSON fields and values.
 
-    def __init__(self: Self, hex_bytes: str) -> None:
+    The parser wraps its buffer in a ``memoryview`` and tracks a read cursor, so
+    consuming bytes never copies the unread remainder of the buffer.
+
+    Fields are read with the definitions that are active when the parser is
+    constructed, unless others are given.
+    """
+
+    def __init__(
+        self: Self, hex_bytes: str, definitions: Optional[Definitions] = None
+    ) -> None:
         """Construct a BinaryParser that will parse hex-encoded bytes."""
-        self.bytes = bytes.fromhex(hex_bytes)
+        self._set_buffer(bytes.fromhex(hex_bytes), definitions)
+
+    @classmethod
+    def from_bytes(
+        cls: Type[Self],
+        buffer: Union[bytes, bytearray, memoryview],
+        definitions: Optional[Definitions] = None,
+    ) -> Self:
+        """
+        Construct a BinaryParser that will parse raw bytes, without a hex round-trip.
+
+        The buffer is not copied. A ``bytearray`` cannot be resized while a parser
+        is reading from it.
+
+        Args:
+            buffer: The bytes to parse.
+            definitions: The definitions to read fields with. Defaults to the active
+                definitions.
+
+        Returns:
+            A BinaryParser reading from the start of buffer.
+        """
+        parser = cls.__new__(cls)
+        parser._set_buffer(buffer, definitions)
+        return parser
+
+    def _set_buffer(
+        self: Self,
+        buffer: Union[bytes, bytearray, memoryview],
+        definitions: Optional[Definitions],
+    ) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+        self._end = len(self._view)
+        if definitions is None:
+            definitions = get_definitions()
+        self._fields_by_header_byte = definitions.fields_by_header_byte
+        self._fields_by_header_code = definitions.fields_by_header_code
 
     def __len__(self: Self) -> int:
-        """Return the number of bytes in this parser's buffer."""
-        return len(self.bytes)
+        """Return the number of unread bytes in this parser's buffer."""
+        return self._end - self._position
 
-    def peek(self: Self) -> Optional[bytes]:
+    def peek(self: Self) -> Optional[int]:
         """
         Peek the first byte of the BinaryParser.
 
         Returns:
-            The first byte of the BinaryParser.
+            The first unread byte of the BinaryParser, as an int.
         """
-        if len(self.bytes) > 0:
-            return cast(bytes, self.bytes[0])
+        if self._position < self._end:
+            return self._view[self._position]
         return None
 
     def skip(self: Self, n: int) -> None:
@@ -60,11 +106,12 @@ class BinaryParser:
         Raises:
             XRPLBinaryCodecException: If n bytes can't be skipped.
         """
-        if n > len(self.bytes):
+        remaining = self._end - self._position
+        if n > remaining:
             raise XRPLBinaryCodecException(
-                f"BinaryParser can't skip {n} bytes, only contains {len(self.bytes)}."
+                f"BinaryParser can't skip {n} bytes, only contains {remaining}."
             )
-        self.bytes = self.bytes[n:]
+        self._position += n
 
     def read(self: Self, n: int) -> bytes:
         """
@@ -76,9 +123,9 @@ class BinaryParser:
         Returns:
             The bytes read.
         """
-        first_n_bytes = self.bytes[:n]
+        start = self._position
         self.skip(n)
-        return first_n_bytes
+        return self._view[start : self._position].tobytes()
 
     def read_uint8(self: Self) -> int:
         """
@@ -86,8 +133,17 @@ class BinaryParser:
 
         Returns:
             The byte read.
+
+        Raises:
+            XRPLBinaryCodecException: If the parser has no bytes left.
         """
-        return int.from_bytes(self.read(1), byteorder="big", signed=False)
+        position = self._position
+        if position >= self._end:
+            raise XRPLBinaryCodecException(
+                "BinaryParser can't skip 1 bytes, only contains 0."
+            )
+        self._position = position + 1
+        return self._view[position]
 
     def read_uint16(self: Self) -> int:
         """
@@ -96,7 +152,11 @@ class BinaryParser:
         Returns:
             The bytes read.
         """
-        return int.from_bytes(self.read(2), byteorder="big", signed=False)
+        start = self._position
+        self.skip(2)
+        return int.from_bytes(
+            self._view[start : self._position], byteorder="big", signed=False
+        )
 
     def read_uint32(self: Self) -> int:
         """
@@ -105,7 +165,11 @@ class BinaryParser:
         Returns:
             The bytes read.
         """
-        return int.from_bytes(self.read(4), byteorder="big", signed=False)
+        start = self._position
+        self.skip(4)
+        return int.from_bytes(
+            self._view[start : self._position], byteorder="big", signed=False
+        )
 
     def is_end(self: Self, custom_end: Optional[int] = None) -> bool:
         """
@@ -118,9 +182,8 @@ class BinaryParser:
         Returns:
             Whether or not it's the end.
         """
-        return len(self.bytes) == 0 or (
-            custom_end is not None and len(self.bytes) <= custom_end
-        )
+        remaining = self._end - self._position
+        return remaining == 0 or (custom_end is not None and remaining <= custom_end)
 
     def read_variable_length(self: Self) -> bytes:
         """
@@ -176,12 +239,19 @@ class BinaryParser:
         Returns:
             The field header.
 
+        """
+        return FieldHeader(*self._read_field_codes(self.read_uint8()))
+
+    def _read_field_codes(self: Self, first_byte: int) -> Tuple[int, int]:
+        """
+        Reads the rest of a field ID that starts with first_byte, and returns its
+        type code and field code.
+
         Raises:
             XRPLBinaryCodecException: If the field ID cannot be read.
         """
-        type_code = self.read_uint8()
-        field_code = type_code & 15
-        type_code >>= 4
+        type_code = first_byte >> 4
+        field_code = first_byte & 15
 
         if type_code == 0:
             type_code = self.read_uint8()
@@ -196,7 +266,7 @@ class BinaryParser:
                 raise XRPLBinaryCodecException(
                     "Cannot read field ID, field_code out of range."
                 )
-        return FieldHeader(type_code, field_code)
+        return type_code, field_code
 
     def read_field(self: Self) -> FieldInstance:
         """
@@ -207,9 +277,12 @@ class BinaryParser:
         Returns:
             The field ordinal at the head of the BinaryParser.
         """
-        field_header = self.read_field_header()
-        field_name = definitions.get_field_name_from_header(field_header)
-        return definitions.get_field_instance(field_name)
+        first_byte = self.read_uint8()
+        field = self._fields_by_header_byte[first_byte]
+        if field is not None:
+            return field
+        type_code, field_code = self._read_field_codes(first_byte)
+        return self._fields_by_header_code[type_code << 8 | field_code]
 
     def read_type(self: Self, field_type: Type[SerializedType]) -> SerializedType:
         """
@@ -248,6 +321,42 @@ class BinaryParser:
             )
         return value
 
+    def read_field_json(self: Self, field: FieldInstance) -> Any:  # noqa: ANN401
+        """
+        Read value of the type specified by field from the BinaryParser, and return
+        its JSON representation.
+
+        Nested objects and arrays are decoded straight from this parser's buffer.
+        Enum-valued fields such as TransactionType are returned as their names.
+
+        Args:
+            field: The FieldInstance specifying the field to read.
+
+        Returns:
+            The JSON representation of the value read from the BinaryParser.
+        """
+        size_hint = (
+            self._read_length_prefix() if field.is_variable_length_encoded else None
+        )
+        json_value = field.associated_type.json_from_parser(self, size_hint)
+        if field.enum_name_from_code is not None:
+            return field.enum_name_from_code(json_value)
+        return json_value
+
+    def skip_field_value(self: Self, field: FieldInstance) -> None:
+        """
+        Skip over the value of the type specified by field without decoding it.
+
+        Variable length encoded values are skipped using their length prefix.
+
+        Args:
+            field: The FieldInstance specifying the field to skip.
+        """
+        if field.is_variable_length_encoded:
+            self.skip(self._read_length_prefix())
+        else:
+            field.associated_type.skip_from_parser(self, None)
+
     def read_field_and_value(
         self: Self,
     ) -> Tuple[FieldInstance, SerializedType]:
@@ -259,3 +368,16 @@ class BinaryParser:
         """
         field = self.read_field()
         return field, self.read_field_value(field)
+
+    @property
+    def bytes(self: Self) -> bytes:
+        """
+        The unread bytes of the BinaryParser.
+
+        This copies the remainder of the buffer, so it should not be used on hot
+        paths.
+
+        Returns:
+            The bytes that have not been consumed yet.
+        """
+        return self._view[self._position : self._end].tobytes()
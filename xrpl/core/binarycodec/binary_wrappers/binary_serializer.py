@@ -2,6 +2,8 @@
 
 from __future__ import annotations  # Requires Python 3.7+
 
+from typing import Any, Optional
+
 from typing_extensions import Final, Self
 
 from xrpl.core.binarycodec.definitions.field_instance import FieldInstance
@@ -54,9 +56,16 @@ def _encode_variable_length_prefix(length: int) -> bytes:
 class BinarySerializer:
     """Serializes JSON to XRPL binary format."""
 
-    def __init__(self: Self) -> None:
-        """Construct a BinarySerializer."""
-        self.bytesink = bytes()
+    def __init__(self: Self, bytesink: Optional[bytearray] = None) -> None:
+        """
+        Construct a BinarySerializer.
+
+        Args:
+            bytesink: An existing growable buffer to append to. Nested types pass
+                their parent's sink here so that they write into it directly. If
+                omitted, a new empty buffer is used.
+        """
+        self.bytesink = bytesink if bytesink is not None else bytearray()
 
     def append(self: Self, bytes_object: bytes) -> None:
         """
@@ -65,7 +74,7 @@ class BinarySerializer:
         Args:
             bytes_object: The bytes to write to bytesink.
         """
-        self.bytesink += bytes_object
+        self.bytesink.extend(bytes_object)
 
     def __bytes__(self: Self) -> bytes:
         """
@@ -74,7 +83,16 @@ class BinarySerializer:
         Returns:
             The bytes representation of the BinarySerializer's bytesink.
         """
-        return self.bytesink
+        return bytes(self.bytesink)
+
+    def __len__(self: Self) -> int:
+        """
+        Get the number of bytes written to this BinarySerializer's bytesink.
+
+        Returns:
+            The number of bytes in bytesink.
+        """
+        return len(self.bytesink)
 
     def write_length_encoded(
         self: Self,
@@ -89,12 +107,11 @@ class BinarySerializer:
             encode_value: Does not encode the value; just encodes `00` in its place.
                 Used in the UNLModify encoding workaround. The default is True.
         """
-        byte_object = bytearray()
-        if encode_value:
-            value.to_byte_sink(byte_object)
-        length_prefix = _encode_variable_length_prefix(len(byte_object))
-        self.bytesink += length_prefix
-        self.bytesink += byte_object
+        if not encode_value:
+            self.bytesink.extend(_encode_variable_length_prefix(0))
+            return
+        self.bytesink.extend(_encode_variable_length_prefix(len(value)))
+        value.to_byte_sink(self.bytesink)
 
     def write_field_and_value(
         self: Self,
@@ -112,9 +129,37 @@ class BinarySerializer:
                 pseudotransactions, due to a bug in rippled. Only True for the Account
                 field in UNLModify pseudotransactions. The default is False.
         """
-        self.bytesink += bytes(field.header)
+        self.bytesink.extend(field.header_bytes)
 
         if field.is_variable_length_encoded:
             self.write_length_encoded(value, not is_unl_modify_workaround)
         else:
-            self.bytesink += bytes(value)
+            value.to_byte_sink(self.bytesink)
+
+    def write_field_from_value(
+        self: Self,
+        field: FieldInstance,
+        value: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Write a field and the serialized form of a JSON value to the buffer.
+
+        Unlike `write_field_and_value`, the value is serialized straight into this
+        BinarySerializer's bytesink rather than into an intermediate object.
+
+        Args:
+            field: The field to write to the buffer.
+            value: The JSON value of the field.
+        """
+        self.bytesink.extend(field.header_bytes)
+
+        if not field.is_variable_length_encoded:
+            field.associated_type.write_from_value(self.bytesink, value)
+            return
+
+        # The length prefix is only known once the value has been written, so
+        # it is spliced in afterwards. This only moves the bytes of this value.
+        start = len(self.bytesink)
+        field.associated_type.write_from_value(self.bytesink, value)
+        length_prefix = _encode_variable_length_prefix(len(self.bytesink) - start)
+        self.bytesink[start:start] = length_prefix
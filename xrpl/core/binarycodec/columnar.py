@@ -0,0 +1,430 @@
+"""
+Columnar decoding of binary ledger entries into NumPy arrays, for analytics over
+large amounts of ledger state.
+
+NumPy is an optional dependency, installed with ``pip install xrpl-py[numpy]``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
+
+from typing_extensions import Final, Self
+
+from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
+from xrpl.core.binarycodec.definitions import (
+    Definitions,
+    FieldInstance,
+    get_definitions,
+)
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.core.binarycodec.streaming import _iter_entries
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+_INDEX: Final[str] = "index"
+
+# How the value of a field is laid out, which decides how it is skipped and
+# which column it is decoded into:
+# a fixed number of bytes
+_FIXED_WIDTHS: Final[Dict[str, int]] = {
+    "UInt8": 1,
+    "UInt16": 2,
+    "UInt32": 4,
+    "UInt64": 8,
+    "Hash128": 16,
+    "Hash160": 20,
+    "Hash192": 24,
+    "Hash256": 32,
+    "Currency": 20,
+    "UInt96": 12,
+    "UInt384": 48,
+    "UInt512": 64,
+}
+# a length prefix followed by that many bytes
+_VARIABLE_LENGTH: Final[int] = -1
+# 8 bytes for XRP, 48 for issued currencies and 33 for MPTs
+_AMOUNT: Final[int] = -2
+# anything else, which is skipped with a BinaryParser
+_OTHER: Final[int] = -3
+_MAX_SINGLE_BYTE_LENGTH: Final[int] = 192
+
+# the field types that can be decoded into a column, and the dtype of the column
+_COLUMN_DTYPES: Final[Dict[str, str]] = {
+    "AccountID": "S20",
+    "Hash128": "S16",
+    "Hash160": "S20",
+    "Hash192": "S24",
+    "Hash256": "S32",
+    "Currency": "S20",
+    "UInt8": "u1",
+    "UInt16": "u2",
+    "UInt32": "u4",
+    "UInt64": "u8",
+    "Amount": "",
+}
+
+_IOU_BIT: Final[int] = 1 << 63
+_POSITIVE_BIT: Final[int] = 1 << 62
+_MPT_BIT: Final[int] = 1 << 61
+_XRP_DROPS_MASK: Final[int] = (1 << 62) - 1
+_IOU_MANTISSA_MASK: Final[int] = (1 << 54) - 1
+_IOU_EXPONENT_BIAS: Final[int] = 97
+
+
+class AmountColumns(NamedTuple):
+    """
+    The columns an Amount field is decoded into. Each amount is
+    ``mantissa * 10 ** exponent`` of the currency ``currency`` issued by
+    ``issuer``. XRP amounts are in drops, with an exponent of 0 and a currency and
+    issuer of zero bytes, which is XRP's currency code.
+    """
+
+    mantissa: npt.NDArray[np.int64]
+    """The signed mantissa, or the number of drops for XRP amounts."""
+
+    exponent: npt.NDArray[np.int8]
+    """The exponent, which is 0 for XRP amounts."""
+
+    currency: npt.NDArray[np.bytes_]
+    """The 20-byte currency code."""
+
+    issuer: npt.NDArray[np.bytes_]
+    """The 20-byte account ID of the issuer."""
+
+
+Column = Union["npt.NDArray[Any]", AmountColumns]
+
+
+def decode_columns(
+    pages: Iterable[Any],  # noqa: ANN401
+    ledger_entry_type: str,
+    fields: Sequence[str],
+    *,
+    definitions: Optional[Definitions] = None,
+) -> Dict[str, Column]:
+    """
+    Decode fields of binary ledger entries of one type straight into NumPy arrays,
+    one array per field, without building a dictionary for each entry.
+
+    Fields are decoded into these columns:
+
+    * AccountID fields and hashes into fixed-width byte arrays, such as ``S20``
+      for account IDs and ``S32`` for Hash256 fields;
+    * UInt8, UInt16, UInt32 and UInt64 fields into unsigned integer arrays of the
+      same width;
+    * Amount fields into `AmountColumns`, an int64 mantissa (the number of drops
+      for XRP) and an int8 exponent, with the currency and issuer of each amount.
+
+    The ``index`` of each entry can also be requested, as an ``S32`` array, when
+    the entries come from `ledger_data` pages. Fields that an entry doesn't have
+    are decoded as zeros.
+
+    Args:
+        pages: `ledger_data` pages requested with ``binary=True``, or their
+            ``state`` entries, or blobs, as accepted by `decode_stream`.
+        ledger_entry_type: The type of ledger entry to decode, such as
+            ``"AccountRoot"``. Entries of other types are skipped.
+        fields: The names of the fields to decode, such as ``"Balance"``.
+        definitions: The definitions to decode with. Defaults to the active
+            definitions.
+
+    Returns:
+        A dictionary mapping each field name to its column. Row ``i`` of every
+        column belongs to the ``i``-th entry of type `ledger_entry_type`.
+
+    Raises:
+        XRPLBinaryCodecException: If a field can't be decoded into a column, or an
+            amount is an MPT amount.
+        ImportError: If NumPy isn't installed.
+    """
+    np = _import_numpy()
+    if definitions is None:
+        definitions = get_definitions()
+    if ledger_entry_type not in definitions.ledger_entry_types:
+        raise XRPLBinaryCodecException(
+            f"{ledger_entry_type} is not a ledger entry type."
+        )
+    entry_type_code = definitions.ledger_entry_types[ledger_entry_type]
+
+    field_instances: List[FieldInstance] = []
+    for field_name in fields:
+        if field_name == _INDEX:
+            continue
+        field_instance = definitions.field_instances.get(field_name)
+        if field_instance is None or field_instance.type not in _COLUMN_DTYPES:
+            raise XRPLBinaryCodecException(f"Cannot decode {field_name} into a column.")
+        field_instances.append(field_instance)
+    columns_by_field = {field: i for (i, field) in enumerate(field_instances)}
+    scanner = _EntryScanner(definitions, entry_type_code, columns_by_field)
+    with_index = _INDEX in fields
+
+    blobs: List[bytes] = []
+    indexes: List[bytes] = []
+    # the offset of each field's value in the concatenated blobs, row by row, or
+    # -1 if the entry doesn't have the field
+    offsets = array("q")
+    position = 0
+    for entry in _iter_entries(pages):
+        blob, index = _get_blob(entry, with_index)
+        row = [-1] * len(field_instances)
+        if not scanner.scan(blob, position, row):
+            continue
+        blobs.append(blob)
+        if with_index:
+            indexes.append(index)
+        offsets.extend(row)
+        position += len(blob)
+
+    buffer = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+    offset_matrix = np.frombuffer(offsets, dtype=np.int64).reshape(
+        len(blobs), len(field_instances)
+    )
+    columns: Dict[str, Column] = {}
+    for field_name in fields:
+        if field_name == _INDEX:
+            columns[_INDEX] = np.array(indexes, dtype="S32")
+            continue
+        field_instance = definitions.field_instances[field_name]
+        field_offsets = offset_matrix[:, columns_by_field[field_instance]]
+        if field_instance.type == "Amount":
+            columns[field_name] = _decode_amounts(np, buffer, field_offsets)
+        else:
+            columns[field_name] = _decode_fixed_width(
+                np, buffer, field_offsets, _COLUMN_DTYPES[field_instance.type]
+            )
+    return columns
+
+
+def _import_numpy() -> Any:  # noqa: ANN401
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Columnar decoding requires NumPy, which can be installed with "
+            "`pip install xrpl-py[numpy]`."
+        ) from e
+    return numpy
+
+
+def _get_blob(entry: Any, with_index: bool) -> Tuple[bytes, bytes]:  # noqa: ANN401
+    if isinstance(entry, str):
+        return bytes.fromhex(entry), b""
+    if isinstance(entry, (bytes, bytearray, memoryview)):
+        return bytes(entry), b""
+    if "data" in entry:
+        index = bytes.fromhex(entry.get(_INDEX, "")) if with_index else b""
+        return bytes.fromhex(entry["data"]), index
+    raise XRPLBinaryCodecException(
+        f"Expected a ledger entry blob, received {sorted(entry.keys())}."
+    )
+
+
+_LAYOUTS: WeakKeyDictionary[Definitions, Dict[FieldInstance, int]] = WeakKeyDictionary()
+
+
+def _get_layouts(definitions: Definitions) -> Dict[FieldInstance, int]:
+    """Map each field to the layout of its values, computed once per definitions."""
+    layouts = _LAYOUTS.get(definitions)
+    if layouts is not None:
+        return layouts
+    layouts = {}
+    for field in definitions.field_instances.values():
+        if field.is_variable_length_encoded:
+            layouts[field] = _VARIABLE_LENGTH
+        elif field.type == "Amount":
+            layouts[field] = _AMOUNT
+        else:
+            layouts[field] = _FIXED_WIDTHS.get(field.type, _OTHER)
+    _LAYOUTS[definitions] = layouts
+    return layouts
+
+
+class _EntryScanner:
+    """
+    Walks the fields of ledger entries, recording where the values of the fields
+    that have a column start, without decoding anything.
+    """
+
+    def __init__(
+        self: Self,
+        definitions: Definitions,
+        entry_type_code: int,
+        columns_by_field: Dict[FieldInstance, int],
+    ) -> None:
+        self._definitions = definitions
+        self._entry_type_code = entry_type_code
+        self._layouts = _get_layouts(definitions)
+        self._columns_by_field = columns_by_field
+        # the layout and column (or -1) of each field with a one byte field ID,
+        # indexed by that byte, so that most fields take a single lookup
+        self._by_header_byte: List[Optional[Tuple[int, int]]] = [
+            (
+                (self._layouts[field], columns_by_field.get(field, -1))
+                if field is not None
+                else None
+            )
+            for field in definitions.fields_by_header_byte
+        ]
+
+    def scan(self: Self, blob: bytes, base: int, row: List[int]) -> bool:
+        """
+        Record in `row` the offset of the value of each field that has a column,
+        plus `base`.
+
+        Returns:
+            Whether the entry is of the requested type.
+
+        Raises:
+            XRPLBinaryCodecException: If the blob isn't a ledger entry.
+        """
+        # LedgerEntryType sorts first, and its field ID is one byte
+        if len(blob) < 3 or blob[0] != 0x11:
+            raise XRPLBinaryCodecException("Expected a ledger entry.")
+        if blob[1] << 8 | blob[2] != self._entry_type_code:
+            return False
+
+        by_header_byte = self._by_header_byte
+        end = len(blob)
+        position = 3
+        while position < end:
+            layout_and_column = by_header_byte[blob[position]]
+            if layout_and_column is None:
+                position = self._scan_slowly(blob, position, base, row)
+                continue
+            layout, column = layout_and_column
+            position += 1
+            if layout >= 0:
+                length = layout
+            elif layout == _AMOUNT:
+                first = blob[position]
+                length = 48 if first & 0x80 else (33 if first & 0x20 else 8)
+            elif (
+                layout == _VARIABLE_LENGTH and blob[position] <= _MAX_SINGLE_BYTE_LENGTH
+            ):
+                # short values, such as account IDs, have a one byte length prefix
+                length = blob[position]
+                position += 1
+            else:
+                position = self._scan_slowly(blob, position - 1, base, row)
+                continue
+            if column >= 0:
+                row[column] = base + position
+            position += length
+        return True
+
+    def _scan_slowly(
+        self: Self, blob: bytes, position: int, base: int, row: List[int]
+    ) -> int:
+        """
+        Read the field at `position` with a BinaryParser, for fields with a long
+        field ID or value.
+
+        Returns:
+            The position of the next field.
+        """
+        end = len(blob)
+        parser = BinaryParser.from_bytes(blob, self._definitions)
+        parser.skip(position)
+        field = parser.read_field()
+        if field.is_variable_length_encoded:
+            length = parser._read_length_prefix()
+            value_start = end - len(parser)
+            value_end = value_start + length
+        else:
+            value_start = end - len(parser)
+            parser.skip_field_value(field)
+            value_end = end - len(parser)
+        column = self._columns_by_field.get(field)
+        if column is not None:
+            row[column] = base + value_start
+        return value_end
+
+
+def _gather(
+    np: Any,  # noqa: ANN401
+    buffer: npt.NDArray[np.uint8],
+    offsets: npt.NDArray[np.int64],
+    present: npt.NDArray[np.bool_],
+    width: int,
+) -> npt.NDArray[np.uint8]:
+    """Gather `width` bytes at each offset into a row, with zeros where absent."""
+    if not present.any():
+        # the buffer may be shorter than `width` when no row has the field
+        return cast("npt.NDArray[np.uint8]", np.zeros((len(offsets), width), np.uint8))
+    safe_offsets = np.where(present, offsets, 0)
+    gathered = cast(
+        "npt.NDArray[np.uint8]", buffer[safe_offsets[:, None] + np.arange(width)]
+    )
+    gathered[~present] = 0
+    return gathered
+
+
+def _decode_fixed_width(
+    np: Any,  # noqa: ANN401
+    buffer: npt.NDArray[np.uint8],
+    offsets: npt.NDArray[np.int64],
+    dtype: str,
+) -> npt.NDArray[Any]:
+    width = np.dtype(dtype).itemsize
+    if len(offsets) == 0:
+        return cast("npt.NDArray[Any]", np.zeros(0, dtype=dtype))
+    gathered = _gather(np, buffer, offsets, offsets >= 0, width)
+    if dtype.startswith("S"):
+        return gathered.view(dtype).ravel()
+    # integers are big-endian in the binary format
+    return gathered.view(f">{dtype}").ravel().astype(dtype)
+
+
+def _decode_amounts(
+    np: Any,  # noqa: ANN401
+    buffer: npt.NDArray[np.uint8],
+    offsets: npt.NDArray[np.int64],
+) -> AmountColumns:
+    count = len(offsets)
+    if count == 0:
+        return AmountColumns(
+            np.zeros(0, dtype=np.int64),
+            np.zeros(0, dtype=np.int8),
+            np.zeros(0, dtype="S20"),
+            np.zeros(0, dtype="S20"),
+        )
+    present = offsets >= 0
+    serials = _gather(np, buffer, offsets, present, 8).view(">u8").ravel()
+    serials = serials.astype(np.uint64)
+
+    is_iou = (serials & np.uint64(_IOU_BIT)) != 0
+    if np.any(~is_iou & ((serials & np.uint64(_MPT_BIT)) != 0)):
+        raise XRPLBinaryCodecException("Cannot decode MPT amounts into columns.")
+    is_positive = (serials & np.uint64(_POSITIVE_BIT)) != 0
+
+    iou_mantissas = (serials & np.uint64(_IOU_MANTISSA_MASK)).astype(np.int64)
+    drops = (serials & np.uint64(_XRP_DROPS_MASK)).astype(np.int64)
+    mantissas = np.where(is_iou, iou_mantissas, drops)
+    mantissas = np.where(is_positive, mantissas, -mantissas)
+
+    # the canonical zero has no exponent
+    exponents = (serials >> np.uint64(54)).astype(np.int16) & 0xFF
+    exponents = np.where(
+        is_iou & (iou_mantissas != 0), exponents - _IOU_EXPONENT_BIAS, 0
+    ).astype(np.int8)
+
+    currency = _gather(np, buffer, offsets + 8, is_iou, 20).view("S20").ravel()
+    issuer = _gather(np, buffer, offsets + 28, is_iou, 20).view("S20").ravel()
+    return AmountColumns(mantissas, exponents, currency, issuer)
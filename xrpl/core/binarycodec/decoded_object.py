@@ -0,0 +1,120 @@
+"""A lazily-decoded, read-only view of a binary-encoded object."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from typing_extensions import Final, Self
+
+from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
+from xrpl.core.binarycodec.definitions import (
+    Definitions,
+    FieldInstance,
+    get_definitions,
+)
+
+_OBJECT_END_MARKER: Final[str] = "ObjectEndMarker"
+
+
+class DecodedObject(Mapping[str, Any]):
+    """
+    A lazily-decoded, read-only view of a binary-encoded object, such as a
+    transaction, its metadata or a ledger entry.
+
+    The first lookup walks the field headers once, skipping over every value using
+    its length prefix or fixed size. A field's value is only decoded when it is
+    accessed, and is then cached.
+
+    Example:
+        tx = DecodedObject(tx_blob)
+        if tx["TransactionType"] == "Payment":
+            print(tx["Account"], tx["Amount"])
+    """
+
+    def __init__(
+        self: Self,
+        buffer: Union[str, bytes, bytearray, memoryview],
+        definitions: Optional[Definitions] = None,
+    ) -> None:
+        """
+        Construct a DecodedObject.
+
+        Args:
+            buffer: The encoded object, as a hexadecimal string or as raw bytes.
+                Raw bytes are read in place and not copied.
+            definitions: The definitions to decode with. Defaults to the active
+                definitions when the DecodedObject is constructed.
+        """
+        self._buffer = bytes.fromhex(buffer) if isinstance(buffer, str) else buffer
+        self._definitions = (
+            definitions if definitions is not None else get_definitions()
+        )
+        self._fields: Optional[Dict[str, Tuple[FieldInstance, int]]] = None
+        self._values: Dict[str, Any] = {}
+
+    def _get_fields(self: Self) -> Dict[str, Tuple[FieldInstance, int]]:
+        """Map each field name to its FieldInstance and the offset of its value."""
+        if self._fields is None:
+            fields = {}
+            parser = BinaryParser.from_bytes(self._buffer, self._definitions)
+            total_length = len(parser)
+            while not parser.is_end():
+                field = parser.read_field()
+                if field.name == _OBJECT_END_MARKER:
+                    break
+                fields[field.name] = (field, total_length - len(parser))
+                parser.skip_field_value(field)
+            self._fields = fields
+        return self._fields
+
+    def __getitem__(self: Self, field_name: str) -> Any:  # noqa: ANN401
+        """
+        Decode and return the JSON representation of the given field.
+
+        Args:
+            field_name: The name of the field to decode.
+
+        Returns:
+            The JSON representation of the field's value.
+
+        Raises:
+            KeyError: If the object doesn't contain the field.
+        """
+        if field_name in self._values:
+            return self._values[field_name]
+        fields = self._get_fields()
+        if field_name not in fields:
+            raise KeyError(field_name)
+        field, offset = fields[field_name]
+        parser = BinaryParser.from_bytes(
+            memoryview(self._buffer)[offset:], self._definitions
+        )
+        value = parser.read_field_json(field)
+        self._values[field_name] = value
+        return value
+
+    def __iter__(self: Self) -> Iterator[str]:
+        """Iterate over the names of the fields in canonical order."""
+        return iter(self._get_fields())
+
+    def __len__(self: Self) -> int:
+        """Return the number of fields in the object."""
+        return len(self._get_fields())
+
+    def __contains__(self: Self, field_name: object) -> bool:
+        """Return whether the object contains the given field."""
+        return field_name in self._get_fields()
+
+    def to_json(self: Self) -> Dict[str, Any]:
+        """
+        Decode every field.
+
+        Returns:
+            A JSON-like dictionary representation of the whole object, the same as
+            `decode` returns.
+        """
+        return {field_name: self[field_name] for field_name in self}
+
+    def __repr__(self: Self) -> str:
+        """Print a string representation of a DecodedObject (for debugging)."""
+        return f"DecodedObject({list(self)})"
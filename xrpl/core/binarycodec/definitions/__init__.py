@@ -1,6 +1,8 @@
 """Handles the XRPL type and definition specifics."""
 
 from xrpl.core.binarycodec.definitions.definitions import (
+    Definitions,
+    get_definitions,
     get_field_header_from_name,
     get_field_instance,
     get_field_name_from_header,
@@ -13,16 +15,22 @@ from xrpl.core.binarycodec.definitions.definitions import (
     get_transaction_type_code,
     get_transaction_type_name,
     load_definitions,
+    use_definitions,
 )
 from xrpl.core.binarycodec.definitions.field_header import FieldHeader
 from xrpl.core.binarycodec.definitions.field_info import FieldInfo
 from xrpl.core.binarycodec.definitions.field_instance import FieldInstance
+from xrpl.core.binarycodec.definitions.registry import DefinitionsRegistry
 
 __all__ = [
+    "Definitions",
+    "DefinitionsRegistry",
     "FieldHeader",
     "FieldInfo",
     "FieldInstance",
     "load_definitions",
+    "get_definitions",
+    "use_definitions",
     "get_field_header_from_name",
     "get_field_name_from_header",
     "get_field_instance",
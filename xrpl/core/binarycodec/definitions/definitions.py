@@ -1,8 +1,14 @@
 """Maps and helpers providing serialization-related information about fields."""
 
+from __future__ import annotations
+
 import json
 import os
-from typing import Any, Dict, cast
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from typing_extensions import Self
 
 from xrpl.core.binarycodec.definitions.field_header import FieldHeader
 from xrpl.core.binarycodec.definitions.field_info import FieldInfo
@@ -28,37 +34,30 @@ def load_definitions(filename: str = "definitions.json") -> Dict[str, Any]:
     dirname = os.path.dirname(__file__)
     absolute_path = os.path.join(dirname, filename)
     with open(absolute_path) as definitions_file:
-        definitions = json.load(definitions_file)
-        return {
-            "TYPES": definitions["TYPES"],
-            # type_name str: type_sort_key int
-            "FIELDS": {
-                k: v for (k, v) in definitions["FIELDS"]
-            },  # convert list of tuples to dict
-            # "field_name" str: {
-            #   "nth": field_sort_key int,
-            #   "isVLEncoded": bool,
-            #   "isSerialized": bool,
-            #   "isSigningField": bool,
-            #   "type": string
-            # }
-            "LEDGER_ENTRY_TYPES": definitions["LEDGER_ENTRY_TYPES"],
-            "TRANSACTION_RESULTS": definitions["TRANSACTION_RESULTS"],
-            "TRANSACTION_TYPES": definitions["TRANSACTION_TYPES"],
-        }
+        return _convert_definitions(json.load(definitions_file))
+
+
+def _convert_definitions(definitions: Dict[str, Any]) -> Dict[str, Any]:
+    fields = definitions["FIELDS"]
+    return {
+        "TYPES": definitions["TYPES"],
+        # type_name str: type_sort_key int
+        "FIELDS": (
+            fields if isinstance(fields, dict) else {k: v for (k, v) in fields}
+        ),  # convert list of tuples to dict
+        # "field_name" str: {
+        #   "nth": field_sort_key int,
+        #   "isVLEncoded": bool,
+        #   "isSerialized": bool,
+        #   "isSigningField": bool,
+        #   "type": string
+        # }
+        "LEDGER_ENTRY_TYPES": definitions["LEDGER_ENTRY_TYPES"],
+        "TRANSACTION_RESULTS": definitions["TRANSACTION_RESULTS"],
+        "TRANSACTION_TYPES": definitions["TRANSACTION_TYPES"],
+    }
 
 
-_DEFINITIONS = load_definitions()
-_TRANSACTION_TYPE_CODE_TO_STR_MAP = {
-    value: key for (key, value) in _DEFINITIONS["TRANSACTION_TYPES"].items()
-}
-_TRANSACTION_RESULTS_CODE_TO_STR_MAP = {
-    value: key for (key, value) in _DEFINITIONS["TRANSACTION_RESULTS"].items()
-}
-_LEDGER_ENTRY_TYPES_CODE_TO_STR_MAP = {
-    value: key for (key, value) in _DEFINITIONS["LEDGER_ENTRY_TYPES"].items()
-}
-
 _GRANULAR_PERMISSIONS = {
     "TrustlineAuthorize": 65537,
     "TrustlineFreeze": 65538,
@@ -74,40 +73,178 @@ _GRANULAR_PERMISSIONS = {
     "MPTokenIssuanceUnlock": 65548,
 }
 
-_tx_delegations = {
-    key: value + 1 for (key, value) in _DEFINITIONS["TRANSACTION_TYPES"].items()
-}
-_DELEGABLE_PERMISSIONS_STR_TO_CODE_MAP: Dict[str, int] = {
-    **_tx_delegations,
-    **_GRANULAR_PERMISSIONS,
-}
-_DELEGABLE_PERMISSIONS_CODE_TO_STR_MAP: Dict[int, str] = {
-    **{value: key for (key, value) in _DELEGABLE_PERMISSIONS_STR_TO_CODE_MAP.items()},
-}
 
-_TYPE_ORDINAL_MAP = _DEFINITIONS["TYPES"]
-
-_FIELD_INFO_MAP = {}
-_FIELD_HEADER_NAME_MAP: Dict[FieldHeader, str] = {}
-
-# Populate _FIELD_INFO_MAP and _FIELD_HEADER_NAME_MAP
-try:
-    for field in _DEFINITIONS["FIELDS"]:
-        field_entry = _DEFINITIONS["FIELDS"][field]
-        field_info = FieldInfo(
-            field_entry["nth"],
-            field_entry["isVLEncoded"],
-            field_entry["isSerialized"],
-            field_entry["isSigningField"],
-            field_entry["type"],
-        )
-        header = FieldHeader(_TYPE_ORDINAL_MAP[field_entry["type"]], field_entry["nth"])
-        _FIELD_INFO_MAP[field] = field_info
-        _FIELD_HEADER_NAME_MAP[header] = field
-except KeyError as e:
-    raise XRPLBinaryCodecException(
-        f"Malformed definitions.json file. (Original exception: KeyError: {e})"
-    )
+class Definitions:
+    """
+    The definitions of the XRP Ledger's binary format, compiled into the tables
+    used to encode and decode fields.
+
+    Definitions are immutable once built, so one instance can be shared by any
+    number of threads and clients. The definitions bundled with xrpl-py are used
+    unless others are passed to `encode` or `decode`, or made active with
+    `use_definitions`.
+    """
+
+    def __init__(
+        self: Self, definitions: Dict[str, Any], definitions_hash: Optional[str] = None
+    ) -> None:
+        """
+        Compile definitions.
+
+        Args:
+            definitions: The definitions, in the format returned by
+                `load_definitions`.
+            definitions_hash: The hash that identifies the definitions, as returned
+                by the `server_definitions` method.
+
+        Raises:
+            XRPLBinaryCodecException: If the definitions are malformed.
+        """
+        self.hash = definitions_hash
+        self.definitions = definitions
+        try:
+            self._compile(definitions)
+        except KeyError as e:
+            raise XRPLBinaryCodecException(
+                f"Malformed definitions.json file. (Original exception: KeyError: {e})"
+            )
+
+    def _compile(self: Self, definitions: Dict[str, Any]) -> None:
+        self.transaction_types: Dict[str, int] = definitions["TRANSACTION_TYPES"]
+        self.transaction_results: Dict[str, int] = definitions["TRANSACTION_RESULTS"]
+        self.ledger_entry_types: Dict[str, int] = definitions["LEDGER_ENTRY_TYPES"]
+        self.type_ordinals: Dict[str, int] = definitions["TYPES"]
+
+        self.transaction_type_names = {
+            value: key for (key, value) in self.transaction_types.items()
+        }
+        self.transaction_result_names = {
+            value: key for (key, value) in self.transaction_results.items()
+        }
+        self.ledger_entry_type_names = {
+            value: key for (key, value) in self.ledger_entry_types.items()
+        }
+        self.permission_values: Dict[str, int] = {
+            **{key: value + 1 for (key, value) in self.transaction_types.items()},
+            **_GRANULAR_PERMISSIONS,
+        }
+        self.permission_value_names: Dict[int, str] = {
+            value: key for (key, value) in self.permission_values.items()
+        }
+
+        enum_hooks = {
+            "TransactionType": (
+                self.transaction_types.__getitem__,
+                self.transaction_type_names.__getitem__,
+            ),
+            "TransactionResult": (
+                self.transaction_results.__getitem__,
+                self.transaction_result_names.__getitem__,
+            ),
+            "LedgerEntryType": (
+                self.ledger_entry_types.__getitem__,
+                self.ledger_entry_type_names.__getitem__,
+            ),
+            "PermissionValue": (
+                self.permission_values.__getitem__,
+                self.permission_value_names.__getitem__,
+            ),
+        }
+
+        self.field_info: Dict[str, FieldInfo] = {}
+        self.field_header_names: Dict[FieldHeader, str] = {}
+        self.field_instances: Dict[str, FieldInstance] = {}
+        # Fields whose ID is a single byte (type code and field code both < 16),
+        # indexed by that byte. Entries for bytes that aren't a one-byte field ID
+        # are None.
+        self.fields_by_header_byte: List[Optional[FieldInstance]] = [None] * 256
+        # All fields, keyed by `type_code << 8 | field_code`.
+        self.fields_by_header_code: Dict[int, FieldInstance] = {}
+
+        for field_name, field_entry in definitions["FIELDS"].items():
+            field_info = FieldInfo(
+                field_entry["nth"],
+                field_entry["isVLEncoded"],
+                field_entry["isSerialized"],
+                field_entry["isSigningField"],
+                field_entry["type"],
+            )
+            field_header = FieldHeader(
+                self.type_ordinals[field_entry["type"]], field_entry["nth"]
+            )
+            field_instance = FieldInstance(
+                field_info, field_name, field_header, *enum_hooks.get(field_name, ())
+            )
+            self.field_info[field_name] = field_info
+            self.field_header_names[field_header] = field_name
+            self.field_instances[field_name] = field_instance
+
+            type_code = field_header.type_code
+            field_code = field_header.field_code
+            if not (0 < type_code <= 255 and 0 < field_code <= 255):
+                # can't appear in a binary blob
+                continue
+            self.fields_by_header_code[type_code << 8 | field_code] = field_instance
+            if type_code < 16 and field_code < 16:
+                self.fields_by_header_byte[type_code << 4 | field_code] = field_instance
+
+    def __repr__(self: Self) -> str:
+        """Print a string representation of the Definitions (for debugging)."""
+        return f"Definitions(hash={self.hash!r})"
+
+
+_DEFAULT_DEFINITIONS = Definitions(load_definitions())
+# The definitions used by the current thread or asyncio task.
+_ACTIVE_DEFINITIONS: ContextVar[Definitions] = ContextVar(
+    "xrpl_definitions", default=_DEFAULT_DEFINITIONS
+)
+
+_DEFINITIONS = _DEFAULT_DEFINITIONS.definitions
+_TRANSACTION_TYPE_CODE_TO_STR_MAP = _DEFAULT_DEFINITIONS.transaction_type_names
+_TRANSACTION_RESULTS_CODE_TO_STR_MAP = _DEFAULT_DEFINITIONS.transaction_result_names
+_LEDGER_ENTRY_TYPES_CODE_TO_STR_MAP = _DEFAULT_DEFINITIONS.ledger_entry_type_names
+_DELEGABLE_PERMISSIONS_STR_TO_CODE_MAP = _DEFAULT_DEFINITIONS.permission_values
+_DELEGABLE_PERMISSIONS_CODE_TO_STR_MAP = _DEFAULT_DEFINITIONS.permission_value_names
+_TYPE_ORDINAL_MAP = _DEFAULT_DEFINITIONS.type_ordinals
+_FIELD_INFO_MAP = _DEFAULT_DEFINITIONS.field_info
+_FIELD_HEADER_NAME_MAP = _DEFAULT_DEFINITIONS.field_header_names
+_FIELD_INSTANCE_MAP = _DEFAULT_DEFINITIONS.field_instances
+_FIELD_INSTANCES_BY_HEADER_BYTE = _DEFAULT_DEFINITIONS.fields_by_header_byte
+_FIELD_INSTANCES_BY_HEADER_CODE = _DEFAULT_DEFINITIONS.fields_by_header_code
+
+
+def get_definitions() -> Definitions:
+    """
+    Returns the definitions used to encode and decode in the current context.
+
+    Returns:
+        The active definitions, which are the ones bundled with xrpl-py unless
+        others were made active with `use_definitions`.
+    """
+    return _ACTIVE_DEFINITIONS.get()
+
+
+@contextmanager
+def use_definitions(definitions: Optional[Definitions]) -> Iterator[Definitions]:
+    """
+    Makes definitions active for the duration of a `with` block. This only
+    affects the current thread or asyncio task.
+
+    Args:
+        definitions: The definitions to use. If None, the active definitions are
+            left unchanged.
+
+    Yields:
+        The active definitions.
+    """
+    if definitions is None:
+        yield _ACTIVE_DEFINITIONS.get()
+        return
+    token = _ACTIVE_DEFINITIONS.set(definitions)
+    try:
+        yield definitions
+    finally:
+        _ACTIVE_DEFINITIONS.reset(token)
 
 
 def get_field_type_name(field_name: str) -> str:
@@ -121,7 +258,7 @@ def get_field_type_name(field_name: str) -> str:
     Returns:
         The serialization data type for the given field name.
     """
-    return _FIELD_INFO_MAP[field_name].type
+    return _ACTIVE_DEFINITIONS.get().field_info[field_name].type
 
 
 def get_field_type_code(field_name: str) -> int:
@@ -138,8 +275,8 @@ def get_field_type_code(field_name: str) -> int:
     Raises:
         XRPLBinaryCodecException: If definitions.json is invalid.
     """
-    field_type_name = get_field_type_name(field_name)
-    field_type_code = _TYPE_ORDINAL_MAP[field_type_name]
+    definitions = _ACTIVE_DEFINITIONS.get()
+    field_type_code = definitions.type_ordinals[definitions.field_info[field_name].type]
     if not isinstance(field_type_code, int):
         raise XRPLBinaryCodecException(
             "Field type codes in definitions.json must be ints."
@@ -159,7 +296,7 @@ def get_field_code(field_name: str) -> int:
     Returns:
         The field code associated with the given field.
     """
-    return _FIELD_INFO_MAP[field_name].nth
+    return _ACTIVE_DEFINITIONS.get().field_info[field_name].nth
 
 
 def get_field_header_from_name(field_name: str) -> FieldHeader:
@@ -185,7 +322,7 @@ def get_field_name_from_header(field_header: FieldHeader) -> str:
     Returns:
         The name of the field described by the given FieldHeader.
     """
-    return _FIELD_HEADER_NAME_MAP[field_header]
+    return _ACTIVE_DEFINITIONS.get().field_header_names[field_header]
 
 
 def get_field_instance(field_name: str) -> FieldInstance:
@@ -198,13 +335,7 @@ def get_field_instance(field_name: str) -> FieldInstance:
     Returns:
         A FieldInstance object for the given field name.
     """
-    info = _FIELD_INFO_MAP[field_name]
-    field_header = get_field_header_from_name(field_name)
-    return FieldInstance(
-        info,
-        field_name,
-        field_header,
-    )
+    return _ACTIVE_DEFINITIONS.get().field_instances[field_name]
 
 
 def get_transaction_type_code(transaction_type: str) -> int:
@@ -217,7 +348,7 @@ def get_transaction_type_code(transaction_type: str) -> int:
     Returns:
         An integer representing the given transaction type string in an enum.
     """
-    return cast(int, _DEFINITIONS["TRANSACTION_TYPES"][transaction_type])
+    return _ACTIVE_DEFINITIONS.get().transaction_types[transaction_type]
 
 
 def get_transaction_type_name(transaction_type: int) -> str:
@@ -230,7 +361,7 @@ def get_transaction_type_name(transaction_type: int) -> str:
     Returns:
         The string name of the transaction type.
     """
-    return cast(str, _TRANSACTION_TYPE_CODE_TO_STR_MAP[transaction_type])
+    return _ACTIVE_DEFINITIONS.get().transaction_type_names[transaction_type]
 
 
 def get_transaction_result_code(transaction_result_type: str) -> int:
@@ -244,7 +375,7 @@ def get_transaction_result_code(transaction_result_type: str) -> int:
     Returns:
         An integer representing the given transaction result type string in an enum.
     """
-    return cast(int, _DEFINITIONS["TRANSACTION_RESULTS"][transaction_result_type])
+    return _ACTIVE_DEFINITIONS.get().transaction_results[transaction_result_type]
 
 
 def get_transaction_result_name(transaction_result_type: int) -> str:
@@ -257,7 +388,7 @@ def get_transaction_result_name(transaction_result_type: int) -> str:
     Returns:
         The string name of the transaction result type.
     """
-    return cast(str, _TRANSACTION_RESULTS_CODE_TO_STR_MAP[transaction_result_type])
+    return _ACTIVE_DEFINITIONS.get().transaction_result_names[transaction_result_type]
 
 
 def get_ledger_entry_type_code(ledger_entry_type: str) -> int:
@@ -270,7 +401,7 @@ def get_ledger_entry_type_code(ledger_entry_type: str) -> int:
     Returns:
         An integer representing the given ledger entry type string in an enum.
     """
-    return cast(int, _DEFINITIONS["LEDGER_ENTRY_TYPES"][ledger_entry_type])
+    return _ACTIVE_DEFINITIONS.get().ledger_entry_types[ledger_entry_type]
 
 
 def get_ledger_entry_type_name(ledger_entry_type: int) -> str:
@@ -283,7 +414,7 @@ def get_ledger_entry_type_name(ledger_entry_type: int) -> str:
     Returns:
         The string name of the ledger entry type.
     """
-    return cast(str, _LEDGER_ENTRY_TYPES_CODE_TO_STR_MAP[ledger_entry_type])
+    return _ACTIVE_DEFINITIONS.get().ledger_entry_type_names[ledger_entry_type]
 
 
 def get_permission_value_type_code(permission_value: str) -> int:
@@ -296,7 +427,7 @@ def get_permission_value_type_code(permission_value: str) -> int:
     Returns:
         An integer representing the given permission value string.
     """
-    return _DELEGABLE_PERMISSIONS_STR_TO_CODE_MAP[permission_value]
+    return _ACTIVE_DEFINITIONS.get().permission_values[permission_value]
 
 
 def get_permission_value_type_name(permission_value: int) -> str:
@@ -309,4 +440,4 @@ def get_permission_value_type_name(permission_value: int) -> str:
     Returns:
         The string name of the permission value.
     """
-    return _DELEGABLE_PERMISSIONS_CODE_TO_STR_MAP[permission_value]
+    return _ACTIVE_DEFINITIONS.get().permission_value_names[permission_value]
@@ -10,6 +10,8 @@ class FieldHeader:
     field code.
     """
 
+    __slots__ = ("type_code", "field_code")
+
     def __init__(self: Self, type_code: int, field_code: int) -> None:
         """
         Construct a FieldHeader.
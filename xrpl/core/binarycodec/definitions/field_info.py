@@ -10,6 +10,14 @@ class FieldInfo:
     definitions.json.
     """
 
+    __slots__ = (
+        "nth",
+        "is_variable_length_encoded",
+        "is_serialized",
+        "is_signing_field",
+        "type",
+    )
+
     def __init__(
         self: Self,
         nth: int,
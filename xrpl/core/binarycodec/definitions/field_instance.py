@@ -2,7 +2,7 @@
 
 from __future__ import annotations  # Requires Python 3.7+
 
-from typing import TYPE_CHECKING, Dict, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type
 
 from typing_extensions import Self
 
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
     # To prevent a circular dependency.
     from xrpl.core.binarycodec.types.serialized_type import SerializedType
 
+_TYPE_MAP: Dict[str, Type[SerializedType]] = {}
+
 
 def _get_type_by_name(name: str) -> Type[SerializedType]:
     """
@@ -24,25 +26,63 @@ def _get_type_by_name(name: str) -> Type[SerializedType]:
     Returns:
         The corresponding class object.
     """
-    import xrpl.core.binarycodec.types as types
+    if not _TYPE_MAP:
+        import xrpl.core.binarycodec.types as types
 
-    type_map: Dict[str, Type[SerializedType]] = {
-        name: object_type
-        for (name, object_type) in types.__dict__.items()
-        if name in types.__all__
-    }
+        _TYPE_MAP.update(
+            {
+                name: object_type
+                for (name, object_type) in types.__dict__.items()
+                if name in types.__all__
+            }
+        )
 
-    return type_map[name]
+    return _TYPE_MAP[name]
 
 
 class FieldInstance:
-    """A collection of serialization information about a specific field type."""
+    """
+    A collection of serialization information about a specific field type.
+
+    FieldInstances are immutable. One instance per field is built when the
+    definitions are loaded and shared by every encode and decode.
+    """
+
+    __slots__ = (
+        "nth",
+        "is_variable_length_encoded",
+        "is_serialized",
+        "is_signing",
+        "type",
+        "name",
+        "header",
+        "ordinal",
+        "header_bytes",
+        "enum_code_from_name",
+        "enum_name_from_code",
+        "_associated_type",
+    )
+
+    nth: int
+    is_variable_length_encoded: bool
+    is_serialized: bool
+    is_signing: bool
+    type: str
+    name: str
+    header: FieldHeader
+    ordinal: int
+    header_bytes: bytes
+    enum_code_from_name: Optional[Callable[[str], int]]
+    enum_name_from_code: Optional[Callable[[int], str]]
+    _associated_type: Optional[Type[SerializedType]]
 
     def __init__(
         self: Self,
         field_info: FieldInfo,
         field_name: str,
         field_header: FieldHeader,
+        enum_code_from_name: Optional[Callable[[str], int]] = None,
+        enum_name_from_code: Optional[Callable[[int], str]] = None,
     ) -> None:
         """
         Construct a FieldInstance.
@@ -50,13 +90,53 @@ class FieldInstance:
         :param field_info: The field's serialization info from definitions.json.
         :param field_name: The field's string name.
         :param field_header: A FieldHeader object with the type_code and field_code.
+        :param enum_code_from_name: For enum-valued fields such as TransactionType,
+            converts a name to its code.
+        :param enum_name_from_code: For enum-valued fields such as TransactionType,
+            converts a code to its name.
         """
-        self.nth = field_info.nth
-        self.is_variable_length_encoded = field_info.is_variable_length_encoded
-        self.is_serialized = field_info.is_serialized
-        self.is_signing = field_info.is_signing_field
-        self.type = field_info.type
-        self.name = field_name
-        self.header = field_header
-        self.ordinal = self.header.type_code << 16 | self.nth
-        self.associated_type = _get_type_by_name(self.type)
+        initialize = object.__setattr__
+        initialize(self, "nth", field_info.nth)
+        initialize(
+            self, "is_variable_length_encoded", field_info.is_variable_length_encoded
+        )
+        initialize(self, "is_serialized", field_info.is_serialized)
+        initialize(self, "is_signing", field_info.is_signing_field)
+        initialize(self, "type", field_info.type)
+        initialize(self, "name", field_name)
+        initialize(self, "header", field_header)
+        initialize(self, "ordinal", field_header.type_code << 16 | field_info.nth)
+        # Fields that are never serialized may have codes that don't fit in a
+        # field ID, so they have no header bytes.
+        initialize(
+            self,
+            "header_bytes",
+            bytes(field_header) if field_info.is_serialized else b"",
+        )
+        initialize(self, "enum_code_from_name", enum_code_from_name)
+        initialize(self, "enum_name_from_code", enum_name_from_code)
+        initialize(self, "_associated_type", None)
+
+    @property
+    def associated_type(self: Self) -> Type[SerializedType]:
+        """
+        The codec type used to serialize values of this field.
+
+        Resolved on first use, since the codec types import the definitions.
+
+        Returns:
+            The SerializedType subclass for this field's type.
+        """
+        associated_type = self._associated_type
+        if associated_type is None:
+            associated_type = _get_type_by_name(self.type)
+            object.__setattr__(self, "_associated_type", associated_type)
+        return associated_type
+
+    def __setattr__(self: Self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Prevent modification, since FieldInstances are shared."""
+        raise AttributeError(f"Cannot set {name}: FieldInstance is immutable.")
+
+    def __repr__(self: Self) -> str:
+        """Print a string representation of a FieldInstance (for debugging)."""
+        return f"FieldInstance({self.name})"
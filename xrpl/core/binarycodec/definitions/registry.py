@@ -0,0 +1,168 @@
+"""A registry of the definitions reported by servers, cached on disk by their hash."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Optional, Pattern
+
+from typing_extensions import Final, Self
+
+from xrpl.core.binarycodec.definitions.definitions import (
+    Definitions,
+    _convert_definitions,
+)
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+
+# the hash is used as a file name, so it must be hex
+_HASH_PATTERN: Final[Pattern[str]] = re.compile("[0-9A-F]+")
+
+
+def _get_default_cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "xrpl-py", "definitions")
+
+
+class DefinitionsRegistry:
+    """
+    The definitions reported by servers with the `server_definitions` method,
+    compiled once per definitions hash.
+
+    Compiled definitions are shared by every client and thread that uses the
+    registry, and are saved to a cache directory so that they don't have to be
+    fetched again by later processes. A registry can be used from several threads
+    at once.
+
+    Example:
+        registry = DefinitionsRegistry()
+        definitions = registry.from_response(client.request(ServerDefinitions()))
+        tx_blob = transaction.blob(definitions=definitions)
+    """
+
+    def __init__(self: Self, cache_dir: Optional[str] = None) -> None:
+        """
+        Construct a DefinitionsRegistry.
+
+        Args:
+            cache_dir: The directory in which to cache definitions. Defaults to
+                ``xrpl-py/definitions`` in the user's cache directory.
+        """
+        self.cache_dir = (
+            cache_dir if cache_dir is not None else _get_default_cache_dir()
+        )
+        self._definitions: Dict[str, Definitions] = {}
+        self._lock = threading.Lock()
+
+    def from_response(self: Self, response: Any) -> Definitions:  # noqa: ANN401
+        """
+        Get the compiled definitions from a `server_definitions` response.
+
+        If the request included the hash of definitions the server already uses,
+        the server only returns that hash, and the definitions are taken from the
+        registry.
+
+        Args:
+            response: The Response to a ServerDefinitions request, or its result.
+
+        Returns:
+            The compiled definitions.
+
+        Raises:
+            XRPLBinaryCodecException: If the request failed, or the response only
+                contains the hash of definitions that aren't in the registry.
+        """
+        if hasattr(response, "is_successful") and not response.is_successful():
+            raise XRPLBinaryCodecException(
+                f"Request for server definitions failed: {response.result}"
+            )
+        result: Dict[str, Any] = getattr(response, "result", response)
+        definitions_hash = result.get("hash")
+        if definitions_hash is not None:
+            definitions_hash = definitions_hash.upper()
+
+        if "FIELDS" not in result:
+            if definitions_hash is None:
+                raise XRPLBinaryCodecException(
+                    "The response contains neither definitions nor their hash."
+                )
+            definitions = self.get(definitions_hash)
+            if definitions is None:
+                raise XRPLBinaryCodecException(
+                    f"Definitions {definitions_hash} aren't in the registry."
+                )
+            return definitions
+
+        if definitions_hash is None:
+            return Definitions(_convert_definitions(result))
+        with self._lock:
+            definitions = self._definitions.get(definitions_hash)
+            if definitions is None:
+                converted_definitions = _convert_definitions(result)
+                definitions = Definitions(converted_definitions, definitions_hash)
+                self._definitions[definitions_hash] = definitions
+                self._write_cache(definitions_hash, converted_definitions)
+        return definitions
+
+    def get(self: Self, definitions_hash: str) -> Optional[Definitions]:
+        """
+        Get compiled definitions by their hash, loading them from the cache
+        directory if they haven't been used by this process yet.
+
+        Args:
+            definitions_hash: The hash of the definitions.
+
+        Returns:
+            The compiled definitions, or None if the registry doesn't have them.
+        """
+        definitions_hash = definitions_hash.upper()
+        with self._lock:
+            definitions = self._definitions.get(definitions_hash)
+            if definitions is None:
+                converted_definitions = self._read_cache(definitions_hash)
+                if converted_definitions is None:
+                    return None
+                definitions = Definitions(converted_definitions, definitions_hash)
+                self._definitions[definitions_hash] = definitions
+        return definitions
+
+    def _get_cache_path(self: Self, definitions_hash: str) -> Optional[str]:
+        if _HASH_PATTERN.fullmatch(definitions_hash) is None:
+            return None
+        return os.path.join(self.cache_dir, f"{definitions_hash}.json")
+
+    def _read_cache(self: Self, definitions_hash: str) -> Optional[Dict[str, Any]]:
+        cache_path = self._get_cache_path(definitions_hash)
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached_definitions = json.loads(cache_file.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached_definitions, dict):
+            return None
+        return cached_definitions
+
+    def _write_cache(
+        self: Self, definitions_hash: str, definitions: Dict[str, Any]
+    ) -> None:
+        cache_path = self._get_cache_path(definitions_hash)
+        if cache_path is None:
+            return
+        # write to a temporary file first, so that other processes never read a
+        # partially written cache
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary_path, "w") as cache_file:
+                json.dump(definitions, cache_file)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
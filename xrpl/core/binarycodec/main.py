@@ -3,11 +3,17 @@ Codec for encoding objects into the XRP Ledger's canonical binary format and
 decoding them.
 """
 
-from typing import Any, Dict, List, Optional, TypedDict, cast
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, TypedDict, Union
 
 from typing_extensions import Final
 
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
+from xrpl.core.binarycodec.definitions import (
+    Definitions,
+    get_field_instance,
+    use_definitions,
+)
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types import AccountID, Hash256, STObject, UInt32, UInt64
 
 
@@ -20,36 +26,81 @@ _PAYMENT_CHANNEL_CLAIM_PREFIX: Final[bytes] = _num_to_bytes(0x434C4D00)
 _TRANSACTION_MULTISIG_PREFIX: Final[bytes] = _num_to_bytes(0x534D5400)
 _BATCH_PREFIX: Final[bytes] = _num_to_bytes(0x42434800)
 
+_OBJECT_END_MARKER: Final[str] = "ObjectEndMarker"
 
-def encode(json: Dict[str, Any]) -> str:
+
+def encode(json: Dict[str, Any], definitions: Optional[Definitions] = None) -> str:
     """
     Encode a transaction or other object into the canonical binary format.
 
     Args:
         json: A JSON-like dictionary representation of an object.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
 
     Returns:
         The binary-encoded object, as a hexadecimal string.
     """
-    return _serialize_json(json)
+    return encode_bytes(json, definitions).hex().upper()
+
+
+def encode_bytes(
+    json: Dict[str, Any], definitions: Optional[Definitions] = None
+) -> bytes:
+    """
+    Encode a transaction or other object into the canonical binary format.
+
+    Args:
+        json: A JSON-like dictionary representation of an object.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
+
+    Returns:
+        The binary-encoded object, as raw bytes.
+    """
+    with use_definitions(definitions):
+        return _serialize_json(json)
 
 
-def encode_for_signing(json: Dict[str, Any]) -> str:
+def encode_for_signing(
+    json: Dict[str, Any], definitions: Optional[Definitions] = None
+) -> str:
     """
     Encode a transaction into binary format in preparation for signing. (Only
     encodes fields that are intended to be signed.)
 
     Args:
         json: A JSON-like dictionary representation of a transaction.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
 
     Returns:
         The binary-encoded transaction, ready to be signed.
     """
-    return _serialize_json(
-        json,
-        prefix=_TRANSACTION_SIGNATURE_PREFIX,
-        signing_only=True,
-    )
+    return encode_bytes_for_signing(json, definitions).hex().upper()
+
+
+def encode_bytes_for_signing(
+    json: Dict[str, Any], definitions: Optional[Definitions] = None
+) -> bytes:
+    """
+    Encode a transaction into binary format in preparation for signing. (Only
+    encodes fields that are intended to be signed.)
+
+    Args:
+        json: A JSON-like dictionary representation of a transaction.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
+
+    Returns:
+        The binary-encoded transaction, ready to be signed, as raw bytes.
+    """
+    with use_definitions(definitions):
+        return _serialize_json(
+            json,
+            prefix=_TRANSACTION_SIGNATURE_PREFIX,
+            signing_only=True,
+        )
 
 
 def encode_for_signing_claim(json: Dict[str, Any]) -> str:
@@ -63,12 +114,25 @@ def encode_for_signing_claim(json: Dict[str, Any]) -> str:
     Returns:
         The binary-encoded claim, ready to be signed.
     """
+    return encode_bytes_for_signing_claim(json).hex().upper()
+
+
+def encode_bytes_for_signing_claim(json: Dict[str, Any]) -> bytes:
+    """
+    Encode a `payment channel <https://xrpl.org/payment-channels.html>`_ Claim
+    to be signed.
+
+    Args:
+        json: A JSON-like dictionary representation of a Claim.
+
+    Returns:
+        The binary-encoded claim, ready to be signed, as raw bytes.
+    """
     prefix = _PAYMENT_CHANNEL_CLAIM_PREFIX
     channel = Hash256.from_value(json["channel"])
     amount = UInt64.from_value(int(json["amount"]))
 
-    buffer = prefix + bytes(channel) + bytes(amount)
-    return buffer.hex().upper()
+    return prefix + bytes(channel) + bytes(amount)
 
 
 class BatchSigningDict(TypedDict):
@@ -91,19 +155,35 @@ def encode_for_signing_batch(json: BatchSigningDict) -> str:
     Returns:
         The binary-encoded Batch data, ready to be signed.
     """
-    prefix = _BATCH_PREFIX
-    flags = UInt32.from_value(json["flags"])
+    return encode_bytes_for_signing_batch(json).hex().upper()
+
+
+def encode_bytes_for_signing_batch(json: BatchSigningDict) -> bytes:
+    """
+    Encode a Batch transaction's data to be signed.
+
+    Args:
+        json: A JSON-like dictionary representation of Batch data.
+
+    Returns:
+        The binary-encoded Batch data, ready to be signed, as raw bytes.
+    """
     transaction_ids = json["transaction_ids"]
-    len_transaction_ids = UInt32.from_value(len(transaction_ids))
 
-    buffer = prefix + bytes(flags) + bytes(len_transaction_ids)
+    bytesink = bytearray(_BATCH_PREFIX)
+    UInt32.from_value(json["flags"]).to_byte_sink(bytesink)
+    UInt32.from_value(len(transaction_ids)).to_byte_sink(bytesink)
     for tx in transaction_ids:
-        buffer += bytes(Hash256.from_value(tx))
+        Hash256.from_value(tx).to_byte_sink(bytesink)
 
-    return buffer.hex().upper()
+    return bytes(bytesink)
 
 
-def encode_for_multisigning(json: Dict[str, Any], signing_account: str) -> str:
+def encode_for_multisigning(
+    json: Dict[str, Any],
+    signing_account: str,
+    definitions: Optional[Definitions] = None,
+) -> str:
     """
     Encode a transaction into binary format in preparation for providing one
     signature towards a multi-signed transaction.
@@ -112,34 +192,190 @@ def encode_for_multisigning(json: Dict[str, Any], signing_account: str) -> str:
     Args:
         json: A JSON-like dictionary representation of a transaction.
         signing_account: The address of the signer who'll provide the signature.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
 
     Returns:
         A hex string of the encoded transaction.
     """
+    return (
+        encode_bytes_for_multisigning(json, signing_account, definitions).hex().upper()
+    )
+
+
+def encode_bytes_for_multisigning(
+    json: Dict[str, Any],
+    signing_account: str,
+    definitions: Optional[Definitions] = None,
+) -> bytes:
+    """
+    Encode a transaction into binary format in preparation for providing one
+    signature towards a multi-signed transaction.
+    (Only encodes fields that are intended to be signed.)
+
+    Args:
+        json: A JSON-like dictionary representation of a transaction.
+        signing_account: The address of the signer who'll provide the signature.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
+
+    Returns:
+        The encoded transaction, as raw bytes.
+    """
     signing_account_id = bytes(AccountID.from_value(signing_account))
 
-    return _serialize_json(
-        json,
-        prefix=_TRANSACTION_MULTISIG_PREFIX,
-        suffix=signing_account_id,
-        signing_only=True,
-    )
+    with use_definitions(definitions):
+        return _serialize_json(
+            json,
+            prefix=_TRANSACTION_MULTISIG_PREFIX,
+            suffix=signing_account_id,
+            signing_only=True,
+        )
+
+
+def encode_bytes_for_multisigning_many(
+    json: Dict[str, Any],
+    signing_accounts: Iterable[str],
+    definitions: Optional[Definitions] = None,
+) -> List[bytes]:
+    """
+    Encode a transaction into binary format in preparation for providing several
+    signatures towards a multi-signed transaction. The transaction is only encoded
+    once; each signer's encoding differs only in its account ID suffix.
+    (Only encodes fields that are intended to be signed.)
 
+    Args:
+        json: A JSON-like dictionary representation of a transaction.
+        signing_accounts: The addresses of the signers who'll provide the signatures.
+        definitions: The definitions to encode with. Defaults to the definitions
+            bundled with xrpl-py.
 
-def decode(buffer: str) -> Dict[str, Any]:
+    Returns:
+        The encoded transaction for each signer, as raw bytes, in the order of
+        `signing_accounts`.
+    """
+    with use_definitions(definitions):
+        body = _serialize_json(
+            json, prefix=_TRANSACTION_MULTISIG_PREFIX, signing_only=True
+        )
+    return [
+        body + bytes(AccountID.from_value(signing_account))
+        for signing_account in signing_accounts
+    ]
+
+
+def insert_field_bytes(
+    buffer: Union[bytes, bytearray, memoryview],
+    field_name: str,
+    value: Any,  # noqa: ANN401
+) -> bytes:
+    """
+    Add a top-level field to an encoded object, at its canonical position, without
+    decoding or re-encoding the fields already in it. For example, this adds the
+    TxnSignature to a transaction encoded for signing.
+
+    Args:
+        buffer: The encoded object, as raw bytes.
+        field_name: The name of the field to add.
+        value: The JSON-like value of the field.
+
+    Returns:
+        The encoded object with the field added.
+
+    Raises:
+        XRPLBinaryCodecException: If the object already contains the field.
+    """
+    field = get_field_instance(field_name)
+    parser = BinaryParser.from_bytes(buffer)
+    total_length = len(parser)
+    offset = total_length
+    while not parser.is_end():
+        field_offset = total_length - len(parser)
+        existing_field = parser.read_field()
+        if existing_field.ordinal == field.ordinal:
+            raise XRPLBinaryCodecException(
+                f"The encoded object already contains {field_name}."
+            )
+        if existing_field.ordinal > field.ordinal:
+            offset = field_offset
+            break
+        parser.skip_field_value(existing_field)
+
+    bytesink = bytearray(buffer[:offset])
+    STObject.write_from_value(bytesink, {field_name: value})
+    bytesink.extend(buffer[offset:])
+    return bytes(bytesink)
+
+
+def decode(
+    buffer: str,
+    fields: Optional[Iterable[str]] = None,
+    definitions: Optional[Definitions] = None,
+) -> Dict[str, Any]:
     """
     Decode a transaction from binary format to a JSON-like dictionary
     representation.
 
     Args:
         buffer: The encoded transaction binary, as a hexadecimal string.
+        fields: If provided, only these top-level fields are decoded. Other fields
+            are skipped without being decoded, and fields that aren't present are
+            left out of the result.
+        definitions: The definitions to decode with. Defaults to the definitions
+            bundled with xrpl-py.
 
     Returns:
         A JSON-like dictionary representation of the transaction.
     """
-    parser = BinaryParser(buffer)
-    parsed_type = cast(STObject, parser.read_type(STObject))
-    return parsed_type.to_json()
+    return _deserialize(BinaryParser(buffer, definitions), fields)
+
+
+def decode_bytes(
+    buffer: Union[bytes, bytearray, memoryview],
+    fields: Optional[Iterable[str]] = None,
+    definitions: Optional[Definitions] = None,
+) -> Dict[str, Any]:
+    """
+    Decode a transaction from binary format to a JSON-like dictionary
+    representation.
+
+    Args:
+        buffer: The encoded transaction binary, as raw bytes. The buffer is read in
+            place and not copied.
+        fields: If provided, only these top-level fields are decoded. Other fields
+            are skipped without being decoded, and fields that aren't present are
+            left out of the result.
+        definitions: The definitions to decode with. Defaults to the definitions
+            bundled with xrpl-py.
+
+    Returns:
+        A JSON-like dictionary representation of the transaction.
+    """
+    return _deserialize(BinaryParser.from_bytes(buffer, definitions), fields)
+
+
+def _deserialize(
+    parser: BinaryParser, fields: Optional[Iterable[str]]
+) -> Dict[str, Any]:
+    if fields is None:
+        return STObject.json_from_parser(parser)
+    return _deserialize_fields(parser, frozenset(fields))
+
+
+def _deserialize_fields(
+    parser: BinaryParser, fields: AbstractSet[str]
+) -> Dict[str, Any]:
+    accumulator: Dict[str, Any] = {}
+    # fields are in canonical order, so stop as soon as all have been found
+    while len(accumulator) < len(fields) and not parser.is_end():
+        field = parser.read_field()
+        if field.name == _OBJECT_END_MARKER:
+            break
+        if field.name in fields:
+            accumulator[field.name] = parser.read_field_json(field)
+        else:
+            parser.skip_field_value(field)
+    return accumulator
 
 
 def _serialize_json(
@@ -147,14 +383,14 @@ def _serialize_json(
     prefix: Optional[bytes] = None,
     suffix: Optional[bytes] = None,
     signing_only: bool = False,
-) -> str:
-    buffer = b""
+) -> bytes:
+    bytesink = bytearray()
     if prefix is not None:
-        buffer += prefix
+        bytesink.extend(prefix)
 
-    buffer += bytes(STObject.from_value(json, signing_only))
+    STObject.write_from_value(bytesink, json, signing_only)
 
     if suffix is not None:
-        buffer += suffix
+        bytesink.extend(suffix)
 
-    return buffer.hex().upper()
+    return bytes(bytesink)
@@ -0,0 +1,169 @@
+"""
+Helpers for decoding streams of binary ledger data, such as the pages returned by
+`ledger_data` or `ledger` requests with ``binary=True``.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from typing_extensions import Final
+
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.core.binarycodec.main import decode, decode_bytes
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+_DEFAULT_CHUNK_SIZE: Final[int] = 256
+# how many chunks per worker may be in flight at once, which bounds memory use
+_CHUNKS_PER_WORKER: Final[int] = 2
+
+_BinaryEntry = Union[str, bytes, bytearray, memoryview, Mapping[str, Any]]
+
+
+def decode_stream(
+    pages: Iterable[Any],
+    *,
+    fields: Optional[Iterable[str]] = None,
+    workers: int = 0,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Decode a stream of binary ledger data one entry at a time.
+
+    Each item of `pages` can be:
+
+    * a `ledger_data` page (a Response, or its ``result`` dictionary), whose
+      ``state`` entries are yielded as decoded ledger entries with their ``index``;
+    * a `ledger` page whose ``ledger.transactions``, or an `account_tx` page whose
+      ``transactions``, are yielded as ``{"tx_json": ..., "meta": ...}``
+      dictionaries, along with any other keys of the entry (such as ``hash``).
+      The metadata is read from ``meta_blob`` in API v2 responses and from
+      ``meta`` otherwise;
+    * a single one of those entries;
+    * a single hex-encoded or raw blob, which is yielded decoded.
+
+    Pages are consumed lazily, so only the entries being decoded are held in
+    memory, which makes it possible to walk a whole ledger's state.
+
+    Args:
+        pages: An iterable of pages, entries or blobs, such as a generator that
+            fetches one page at a time.
+        fields: If provided, only these top-level fields of each decoded ledger entry
+            or transaction are decoded. See `decode`. Transaction metadata is always
+            decoded in full.
+        workers: If greater than 0, decode chunks of entries in parallel in this
+            many worker processes. Entries are still yielded in input order.
+            Defaults to 0 (decode in this process).
+        chunk_size: The number of entries sent to a worker at once. Only used when
+            `workers` is greater than 0.
+
+    Yields:
+        Each decoded entry, in input order.
+
+    Raises:
+        XRPLBinaryCodecException: If `chunk_size` is less than 1.
+    """
+    field_set = frozenset(fields) if fields is not None else None
+    entries = _iter_entries(pages)
+    if workers <= 0:
+        for entry in entries:
+            yield _decode_entry(entry, field_set)
+        return
+
+    if chunk_size < 1:
+        raise XRPLBinaryCodecException("chunk_size must be at least 1.")
+    # imported here since multiprocessing is slow to import and rarely needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: Deque[Future[List[Dict[str, Any]]]] = deque()
+        while True:
+            while len(in_flight) < workers * _CHUNKS_PER_WORKER:
+                # memoryviews cannot be pickled to be sent to a worker
+                chunk: List[_BinaryEntry] = [
+                    bytes(entry) if isinstance(entry, memoryview) else entry
+                    for entry in islice(entries, chunk_size)
+                ]
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_decode_chunk, chunk, field_set))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+def _iter_entries(pages: Iterable[Any]) -> Iterator[_BinaryEntry]:
+    """Flatten pages into the individual binary entries they contain."""
+    for page in pages:
+        # Response objects
+        result = getattr(page, "result", None)
+        if isinstance(result, Mapping):
+            page = result
+
+        if isinstance(page, (str, bytes, bytearray, memoryview)):
+            yield page
+        elif not isinstance(page, Mapping):
+            raise XRPLBinaryCodecException(
+                f"Cannot decode a {page.__class__.__name__} as binary ledger data."
+            )
+        elif "state" in page:
+            yield from page["state"]
+        elif "ledger" in page and isinstance(page["ledger"], Mapping):
+            yield from page["ledger"].get("transactions", [])
+        elif "transactions" in page:
+            yield from page["transactions"]
+        else:
+            yield page
+
+
+def _decode_entry(
+    entry: _BinaryEntry, fields: Optional[FrozenSet[str]]
+) -> Dict[str, Any]:
+    """Decode a single blob, ledger_data state entry or transaction entry."""
+    if isinstance(entry, str):
+        return decode(entry, fields)
+    if isinstance(entry, (bytes, bytearray, memoryview)):
+        return decode_bytes(entry, fields)
+    if "data" in entry:
+        return {**decode(entry["data"], fields), "index": entry["index"]}
+    if "tx_blob" in entry:
+        decoded = {
+            key: value
+            for key, value in entry.items()
+            if key not in ("tx_blob", "meta", "meta_blob")
+        }
+        decoded["tx_json"] = decode(entry["tx_blob"], fields)
+        # API v2 returns the metadata of `account_tx` and `tx` as `meta_blob`
+        meta = entry.get("meta_blob", entry.get("meta"))
+        if isinstance(meta, str):
+            decoded["meta"] = decode(meta)
+        elif meta is not None:
+            decoded["meta"] = meta
+        return decoded
+    raise XRPLBinaryCodecException(
+        "Expected a blob, or an entry with `data` or `tx_blob`, received "
+        f"{sorted(entry.keys())}."
+    )
+
+
+def _decode_chunk(
+    chunk: List[_BinaryEntry], fields: Optional[FrozenSet[str]]
+) -> List[Dict[str, Any]]:
+    """Decode a chunk of entries. Runs in a worker process."""
+    return [_decode_entry(entry, fields) for entry in chunk]
@@ -16,7 +16,7 @@ from xrpl.core.addresscodec import (
     is_valid_xaddress,
     xaddress_to_classic_address,
 )
-from xrpl.core.binarycodec import XRPLBinaryCodecException
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.hash160 import Hash160
 
 # matches hex-encoded accounts. this happens to be the same format as the
@@ -29,6 +29,8 @@ class AccountID(Hash160):
     See `AccountID Fields <https://xrpl.org/serialization.html#accountid-fields>`_
     """
 
+    __slots__ = ()
+
     LENGTH: Final[int] = 20  # bytes
 
     def __init__(self: Self, buffer: Optional[bytes] = None) -> None:
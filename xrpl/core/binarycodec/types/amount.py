@@ -5,8 +5,9 @@ See `Amount Fields <https://xrpl.org/serialization.html#amount-fields>`_
 
 from __future__ import annotations
 
+import re
 from decimal import MAX_PREC, Context, Decimal, InvalidOperation, localcontext
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Optional, Pattern, Tuple, Type, Union, cast
 
 from typing_extensions import Final, Self
 
@@ -33,9 +34,24 @@ _MIN_XRP: Final[Decimal] = Decimal("1e-6")
 _NOT_XRP_BIT_MASK: Final[int] = 0x80
 _POS_SIGN_BIT_MASK: Final[int] = 0x4000000000000000
 _ZERO_CURRENCY_AMOUNT_HEX: Final[int] = 0x8000000000000000
+_ZERO_XRP_AMOUNT_BYTES: Final[bytes] = _POS_SIGN_BIT_MASK.to_bytes(8, byteorder="big")
 _NATIVE_AMOUNT_BYTE_LENGTH: Final[int] = 8
 _CURRENCY_AMOUNT_BYTE_LENGTH: Final[int] = 48
 _MPT_MASK: Final[Decimal] = Decimal(0x8000000000000000)
+_MAX_DROPS_INT: Final[int] = 10**17
+_MPT_MASK_INT: Final[int] = 0x8000000000000000
+_IOU_MANTISSA_MASK: Final[int] = (1 << 54) - 1
+
+# Plain and scientific decimal strings: sign, integer digits, fractional digits and
+# exponent. Anything else (whitespace, underscores, NaN, Infinity, huge exponents)
+# is left to `Decimal`.
+_DECIMAL_REGEX: Final[Pattern[str]] = re.compile(
+    r"([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]{1,4}))?"
+)
+_UNSIGNED_INT_REGEX: Final[Pattern[str]] = re.compile("[0-9]+")
+# Long enough for any valid XRP or MPT amount, short enough to never be taken for a
+# 40-character hex MPT amount.
+_MAX_UNSIGNED_INT_LENGTH: Final[int] = 19
 
 
 def _contains_decimal(string: str) -> bool:
@@ -64,6 +80,11 @@ def verify_xrp_value(xrp_value: str) -> None:
     Raises:
         XRPLBinaryCodecException: If xrp_value is not a valid XRP amount.
     """
+    if _is_unsigned_int(xrp_value):
+        if int(xrp_value) > _MAX_DROPS_INT:
+            raise XRPLBinaryCodecException(f"{xrp_value} is an invalid XRP amount.")
+        return
+
     # Contains no decimal point
     if not _contains_decimal(xrp_value):
         raise XRPLBinaryCodecException(f"{xrp_value} is an invalid XRP amount.")
@@ -92,6 +113,11 @@ def verify_iou_value(issued_currency_value: str) -> None:
     Raises:
         XRPLBinaryCodecException: If issued_currency_value is invalid.
     """
+    parsed = _parse_decimal(issued_currency_value)
+    if parsed is not None:
+        _verify_iou_digits(parsed[1], parsed[2])
+        return
+
     decimal_value = Decimal(issued_currency_value)
     if decimal_value.is_zero():
         return
@@ -123,6 +149,11 @@ def verify_mpt_value(mpt_value: str) -> None:
     Raises:
         XRPLBinaryCodecException: If mpt_value is not a valid MPT amount.
     """
+    if _is_unsigned_int(mpt_value):
+        if int(mpt_value) & _MPT_MASK_INT != 0:
+            raise XRPLBinaryCodecException(f"{mpt_value} is an illegal amount")
+        return
+
     # Contains no decimal point
     if not _contains_decimal(mpt_value):
         raise XRPLBinaryCodecException(
@@ -149,6 +180,66 @@ def verify_mpt_value(mpt_value: str) -> None:
         raise XRPLBinaryCodecException(f"{mpt_value} is an illegal amount")
 
 
+def _is_unsigned_int(value: str) -> bool:
+    """Whether value is a short string of ASCII digits, which needs no Decimal."""
+    return (
+        len(value) <= _MAX_UNSIGNED_INT_LENGTH
+        and _UNSIGNED_INT_REGEX.fullmatch(value) is not None
+    )
+
+
+def _parse_decimal(value: str) -> Optional[Tuple[bool, str, int]]:
+    """
+    Split a decimal string into its sign, significant digits and exponent, such that
+    the value is ``(-1) ** is_negative * int(digits) * 10 ** exponent``.
+
+    The digits keep their trailing zeros and the exponent is the one written, the
+    same as `Decimal.as_tuple` gives, so both paths validate and round identically.
+
+    :param value: The decimal string to parse.
+    :return: A tuple of (is_negative, digits, exponent), with empty digits for zero,
+        or None if value is not a plain or scientific decimal string of at most
+        MAX_IOU_PRECISION significant digits. Callers fall back to Decimal then.
+    """
+    match = _DECIMAL_REGEX.fullmatch(value)
+    if match is None:
+        return None
+    sign, integer, fraction, exponent = match.groups()
+    fraction = fraction or ""
+    if not integer and not fraction:
+        return None
+    digits = (integer + fraction).lstrip("0")
+    if len(digits) > MAX_IOU_PRECISION:
+        return None
+    return sign == "-", digits, int(exponent or 0) - len(fraction)
+
+
+def _verify_iou_digits(digits: str, exponent: int) -> None:
+    """
+    Validate the digits and exponent of an issued currency value, as returned by
+    `_parse_decimal`. Equivalent to the Decimal checks in `verify_iou_value`.
+
+    :param digits: The significant digits of the value.
+    :param exponent: The exponent of the value.
+    :raises XRPLBinaryCodecException: If the value is invalid.
+    """
+    if not digits:
+        return
+    if exponent >= 0 or digits.endswith("0" * -exponent):
+        # an integer: count every digit left of the decimal point
+        precision = len(digits) + exponent
+    else:
+        precision = len(digits.rstrip("0"))
+    if (
+        (precision > MAX_IOU_PRECISION)
+        or (exponent > MAX_IOU_EXPONENT)
+        or (exponent < MIN_IOU_EXPONENT)
+    ):
+        raise XRPLBinaryCodecException(
+            "Decimal precision out of range for issued currency value."
+        )
+
+
 def _calculate_precision(value: str) -> int:
     """Calculate the precision of given value as a string."""
     decimal_value = Decimal(value, Context(prec=MAX_PREC))
@@ -186,17 +277,42 @@ def _serialize_issued_currency_value(value: str) -> bytes:
     :param value: The value to serialize, as a string.
     :return: A bytes object encoding the serialized value.
     """
+    parsed = _parse_decimal(value)
+    if parsed is not None:
+        is_negative, digits, exponent = parsed
+        _verify_iou_digits(digits, exponent)
+        if not digits:
+            return _ZERO_CURRENCY_AMOUNT_HEX.to_bytes(8, byteorder="big")
+        return _serialize_issued_currency_parts(
+            is_negative, int(digits), exponent, value
+        )
+
     verify_iou_value(value)
     decimal_value = Decimal(value)
     if decimal_value.is_zero():
         return _ZERO_CURRENCY_AMOUNT_HEX.to_bytes(8, byteorder="big")
 
     # Convert components to integers ---------------------------------------
-    sign, digits, exp = decimal_value.as_tuple()
-    mantissa = int("".join([str(d) for d in digits]))
+    sign, digits_tuple, exp = decimal_value.as_tuple()
+    mantissa = int("".join([str(d) for d in digits_tuple]))
     if not isinstance(exp, int):  # NaN, sNaN, Infinity
         raise XRPLBinaryCodecException(f"Expected exp to be int, is {exp}")
+    return _serialize_issued_currency_parts(sign == 1, mantissa, exp, value)
 
+
+def _serialize_issued_currency_parts(
+    is_negative: bool, mantissa: int, exp: int, value: str
+) -> bytes:
+    """
+    Serializes a non-zero issued currency value given as an integer mantissa and
+    exponent.
+
+    :param is_negative: Whether the value is negative.
+    :param mantissa: The integer mantissa of the value.
+    :param exp: The exponent of the value.
+    :param value: The original value, for error messages.
+    :return: A bytes object encoding the serialized value.
+    """
     # Canonicalize to expected range ---------------------------------------
     while mantissa < MIN_IOU_MANTISSA and exp > MIN_IOU_EXPONENT:
         mantissa *= 10
@@ -221,7 +337,7 @@ def _serialize_issued_currency_value(value: str) -> bytes:
 
     # Convert to bytes -----------------------------------------------------
     serial = _ZERO_CURRENCY_AMOUNT_HEX  # "Not XRP" bit set
-    if sign == 0:
+    if not is_negative:
         serial |= _POS_SIGN_BIT_MASK  # "Is positive" bit set
     serial |= (exp + 97) << 54  # next 8 bits are exponents
     serial |= mantissa  # last 54 bits are mantissa
@@ -229,6 +345,36 @@ def _serialize_issued_currency_value(value: str) -> bytes:
     return serial.to_bytes(8, byteorder="big", signed=False)
 
 
+def _format_issued_currency_value(
+    is_negative: bool, mantissa: int, exponent: int
+) -> str:
+    """
+    Format an issued currency value the way `str(Decimal)` does, dropping trailing
+    zeros after the decimal point.
+
+    :param is_negative: Whether the value is negative.
+    :param mantissa: The integer mantissa of the value.
+    :param exponent: The exponent of the value.
+    :return: The value as a decimal string.
+    """
+    if mantissa == 0:
+        return "0"
+    sign = "-" if is_negative else ""
+    digits = str(mantissa)
+    if exponent == 0:
+        return f"{sign}{digits}"
+    point = len(digits) + exponent
+    if exponent > 0 or point < -5:
+        # str(Decimal) switches to scientific notation here
+        value = Decimal(f"{sign}{mantissa}") * Decimal(f"1e{exponent}")
+        return str(value)
+    if point > 0:
+        value_str = f"{digits[:point]}.{digits[point:]}"
+    else:
+        value_str = f"0.{'0' * -point}{digits}"
+    return sign + value_str.rstrip("0").rstrip(".")
+
+
 def _serialize_xrp_amount(value: str) -> bytes:
     """Serializes an XRP amount.
 
@@ -273,13 +419,14 @@ def _serialize_mpt_amount(value: Dict[str, str]) -> bytes:
     verify_mpt_value(amount_string)
 
     # Convert the MPT amount string to a 64-bit integer and then to bytes
-    decimal_value = None
-    if amount_string.startswith("0x") or _HEX_REGEX.fullmatch(amount_string):
-        decimal_value = Decimal(int(amount_string, 16))
+    if _is_unsigned_int(amount_string):
+        int_value = int(amount_string)
+    elif amount_string.startswith("0x") or _HEX_REGEX.fullmatch(amount_string):
+        int_value = int(amount_string, 16)
     else:
-        decimal_value = Decimal(amount_string)
+        int_value = int(Decimal(amount_string))
 
-    amount_bytes = int(decimal_value).to_bytes(8, byteorder="big", signed=False)
+    amount_bytes = int_value.to_bytes(8, byteorder="big", signed=False)
 
     # Create a bytearray for the mpt_issuance_id and serialize it
     mpt_issuance_id = bytearray()
@@ -298,6 +445,8 @@ class Amount(SerializedType):
     See `Amount Fields <https://xrpl.org/serialization.html#amount-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """Construct an Amount from given bytes."""
         super().__init__(buffer)
@@ -319,6 +468,8 @@ class Amount(SerializedType):
         Raises:
             XRPLBinaryCodecException: if an Amount cannot be constructed.
         """
+        if value == "0" and cls is Amount:
+            return cast(Self, _ZERO_XRP_AMOUNT)
         with localcontext(IOU_DECIMAL_CONTEXT):
             if isinstance(value, str):
                 return cls(_serialize_xrp_amount(value))
@@ -345,16 +496,35 @@ class Amount(SerializedType):
         Returns:
             An Amount object.
         """
+        buffer = parser.read(cls._get_length_from_parser(parser))
+        if cls is Amount and buffer == _ZERO_XRP_AMOUNT_BYTES:
+            return cast(Self, _ZERO_XRP_AMOUNT)
+        return cls(buffer)
+
+    @classmethod
+    def skip_from_parser(
+        cls: Type[Self], parser: BinaryParser, length_hint: Optional[int] = None
+    ) -> None:
+        """Advance a BinaryParser past an Amount without reading it.
+
+        Args:
+            parser: The parser to skip the Amount in.
+            length_hint: Unused.
+        """
+        parser.skip(cls._get_length_from_parser(parser))
+
+    @staticmethod
+    def _get_length_from_parser(parser: BinaryParser) -> int:
+        """Work out the length of the Amount at the head of parser."""
         first_byte = parser.peek()
 
         is_iou = (first_byte & 0x80) != 0  # type: ignore
         if is_iou:
-            return cls(parser.read(_CURRENCY_AMOUNT_BYTE_LENGTH))
+            return _CURRENCY_AMOUNT_BYTE_LENGTH
 
         # the amount can be either MPT or XRP at this point
         is_mpt = (first_byte & 0x20) != 0  # type: ignore
-        num_bytes = 33 if is_mpt else 8
-        return cls(parser.read(num_bytes))
+        return 33 if is_mpt else 8
 
     def to_json(self: Self) -> Union[str, Dict[Any, Any]]:
         """Construct a JSON object representing this Amount.
@@ -373,23 +543,15 @@ class Amount(SerializedType):
             return f"{sign}{masked_bytes}"
 
         if self.is_iou():
-            parser = BinaryParser(str(self))
-            value_bytes = parser.read(8)
+            parser = BinaryParser.from_bytes(self.buffer)
+            serial = int.from_bytes(parser.read(8), byteorder="big")
             currency = Currency.from_parser(parser)
             issuer = AccountID.from_parser(parser)
-            b1 = value_bytes[0]
-            b2 = value_bytes[1]
-            is_positive = b1 & 0x40
-            sign = "" if is_positive else "-"
-            exponent = ((b1 & 0x3F) << 2) + ((b2 & 0xFF) >> 6) - 97
-            hex_mantissa = hex(b2 & 0x3F) + value_bytes[2:].hex()
-            int_mantissa = int(hex_mantissa[2:], 16)
-            value = Decimal(f"{sign}{int_mantissa}") * Decimal(f"1e{exponent}")
-
-            if value.is_zero():
-                value_str = "0"
-            else:
-                value_str = str(value).rstrip("0").rstrip(".")
+            value_str = _format_issued_currency_value(
+                not serial & _POS_SIGN_BIT_MASK,
+                serial & _IOU_MANTISSA_MASK,
+                ((serial >> 54) & 0xFF) - 97,
+            )
             verify_iou_value(value_str)
 
             return {
@@ -399,7 +561,7 @@ class Amount(SerializedType):
             }
 
         if self.is_mpt():
-            parser = BinaryParser(self.to_hex())
+            parser = BinaryParser.from_bytes(self.buffer)
             leading_byte = parser.read(1)
             value_bytes = parser.read(8)
             mpt_issuance_id = Hash192.from_parser(parser)
@@ -454,3 +616,7 @@ class Amount(SerializedType):
             False otherwise.
         """
         return (bytes(self)[0] & 0x40) > 0
+
+
+# Amounts are immutable, so the zero XRP amount is shared.
+_ZERO_XRP_AMOUNT: Final[Amount] = Amount(_ZERO_XRP_AMOUNT_BYTES)
@@ -20,6 +20,8 @@ class Blob(SerializedType):
     See `Blob Fields <https://xrpl.org/serialization.html#blob-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """Construct a new Blob type from a ``bytes`` value."""
         super().__init__(buffer)
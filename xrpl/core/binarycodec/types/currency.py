@@ -2,15 +2,17 @@
 
 from __future__ import annotations  # Requires Python 3.7+
 
-from typing import Optional, Type
+from typing import Optional, Type, cast
 
 from typing_extensions import Final, Self
 
 from xrpl.constants import HEX_CURRENCY_REGEX, ISO_CURRENCY_REGEX
+from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.hash160 import Hash160
 
 _CURRENCY_CODE_LENGTH: Final[int] = 20  # bytes
+_XRP_CURRENCY_BYTES: Final[bytes] = bytes(_CURRENCY_CODE_LENGTH)
 
 
 def _is_iso_code(value: str) -> bool:
@@ -71,8 +73,10 @@ class Currency(Hash160):
         _iso: The three-character ISO currency code if standard format, else None.
     """
 
+    __slots__ = ("_iso",)
+
     LENGTH: Final[int] = 20
-    _iso: Optional[str] = None
+    _iso: Optional[str]
 
     def __init__(self: Self, buffer: Optional[bytes] = None) -> None:
         """Construct a Currency."""
@@ -93,6 +97,25 @@ class Currency(Hash160):
         else:
             self._iso = _iso_code_from_hex(code_bytes)
 
+    @classmethod
+    def from_parser(
+        cls: Type[Self], parser: BinaryParser, length_hint: Optional[int] = None
+    ) -> Self:
+        """
+        Construct a Currency object from an existing BinaryParser.
+
+        Args:
+            parser: The parser to construct the Currency object from.
+            length_hint: The number of bytes to consume from the parser.
+
+        Returns:
+            The Currency object constructed from a parser.
+        """
+        buffer = parser.read(length_hint if length_hint is not None else cls.LENGTH)
+        if cls is Currency and buffer == _XRP_CURRENCY_BYTES:
+            return cast(Self, _XRP_CURRENCY)
+        return cls(buffer)
+
     @classmethod
     def from_value(cls: Type[Self], value: str) -> Self:
         """
@@ -113,6 +136,8 @@ class Currency(Hash160):
                 f" received {value.__class__.__name__}."
             )
 
+        if value == "XRP" and cls is Currency:
+            return cast(Self, _XRP_CURRENCY)
         if _is_iso_code(value):
             return cls(_iso_to_bytes(value))
         if _is_hex(value):
@@ -129,3 +154,7 @@ class Currency(Hash160):
         if self._iso is not None:
             return self._iso
         return self.buffer.hex().upper()
+
+
+# Currencies are immutable, so the XRP currency is shared.
+_XRP_CURRENCY: Final[Currency] = Currency(_XRP_CURRENCY_BYTES)
@@ -20,6 +20,8 @@ class Hash(SerializedType, ABC):
     `See Hash Fields <https://xrpl.org/serialization.html#hash-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: Optional[bytes]) -> None:
         """
         Construct a Hash.
@@ -79,6 +81,19 @@ class Hash(SerializedType, ABC):
         num_bytes = length_hint if length_hint is not None else cls._get_length()
         return cls(parser.read(num_bytes))
 
+    @classmethod
+    def skip_from_parser(
+        cls: Type[Self], parser: BinaryParser, length_hint: Optional[int] = None
+    ) -> None:
+        """
+        Advance a BinaryParser past a Hash without reading it.
+
+        Args:
+            parser: The parser to skip the Hash in.
+            length_hint: The number of bytes to skip.
+        """
+        parser.skip(length_hint if length_hint is not None else cls._get_length())
+
     @classmethod
     @abstractmethod
     def _get_length(cls: Type[Self]) -> int:
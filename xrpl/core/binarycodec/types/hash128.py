@@ -21,6 +21,8 @@ class Hash128(Hash):
     `See Hash Fields <https://xrpl.org/serialization.html#hash-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: Optional[bytes]) -> None:
         """
         Construct a Hash128.
@@ -19,6 +19,8 @@ class Hash160(Hash):
     `See Hash Fields <https://xrpl.org/serialization.html#hash-fields>`_
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_length(cls: Type[Self]) -> int:
         return 20
@@ -21,6 +21,8 @@ class Hash192(Hash):
     `See Hash Fields <https://xrpl.org/serialization.html#hash-fields>`_
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_length(cls: Type[Self]) -> int:
         return 24
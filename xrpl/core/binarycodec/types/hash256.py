@@ -20,6 +20,8 @@ class Hash256(Hash):
     `See Hash Fields <https://xrpl.org/serialization.html#hash-fields>`_
     """
 
+    __slots__ = ()
+
     @classmethod
     def _get_length(cls: Type[Self]) -> int:
         return 32
@@ -20,6 +20,8 @@ from xrpl.models.currencies import MPTCurrency as MPTCurrencyModel
 class Issue(SerializedType):
     """Codec for serializing and deserializing issued currency fields."""
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """
         Construct an Issue from given bytes.
@@ -103,7 +105,7 @@ class Issue(SerializedType):
         if len(self.buffer) == HASH192_BYTES:
             return {"mpt_issuance_id": self.to_hex().upper()}
 
-        parser = BinaryParser(self.to_hex())
+        parser = BinaryParser.from_bytes(self.buffer)
         currency: Union[str, Dict[Any, Any]] = Currency.from_parser(parser).to_json()
         if currency == "XRP":
             return {"currency": currency}
@@ -4,7 +4,7 @@ See `PathSet Fields <https://xrpl.org/serialization.html#pathset-fields>`_
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type, cast
+from typing import Dict, List, Optional, Type
 
 from typing_extensions import Final, Self
 
@@ -37,6 +37,8 @@ def _is_path_set(value: List[List[Dict[str, str]]]) -> bool:
 class PathStep(SerializedType):
     """Serialize and deserialize a single step in a Path."""
 
+    __slots__ = ()
+
     @classmethod
     def from_value(cls: Type[Self], value: Dict[str, str]) -> Self:
         """
@@ -47,6 +49,21 @@ class PathStep(SerializedType):
 
         Returns:
             The PathStep constructed from value.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self], bytesink: bytearray, value: Dict[str, str]
+    ) -> None:
+        """
+        Serialize a dictionary describing a PathStep directly into a bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized PathStep to.
+            value: The dictionary to serialize.
 
         Raises:
             XRPLBinaryCodecException: If the supplied value is of the wrong type.
@@ -58,21 +75,20 @@ class PathStep(SerializedType):
             )
 
         data_type = 0x00
-        buffer = b""
         if "account" in value:
-            account_id = AccountID.from_value(value["account"])
-            buffer += bytes(account_id)
             data_type |= _TYPE_ACCOUNT
         if "currency" in value:
-            currency = Currency.from_value(value["currency"])
-            buffer += bytes(currency)
             data_type |= _TYPE_CURRENCY
         if "issuer" in value:
-            issuer = AccountID.from_value(value["issuer"])
-            buffer += bytes(issuer)
             data_type |= _TYPE_ISSUER
 
-        return cls(bytes([data_type]) + buffer)
+        bytesink.append(data_type)
+        if "account" in value:
+            AccountID.from_value(value["account"]).to_byte_sink(bytesink)
+        if "currency" in value:
+            Currency.from_value(value["currency"]).to_byte_sink(bytesink)
+        if "issuer" in value:
+            AccountID.from_value(value["issuer"]).to_byte_sink(bytesink)
 
     @classmethod
     def from_parser(
@@ -88,28 +104,30 @@ class PathStep(SerializedType):
             The PathStep constructed from parser.
         """
         data_type = parser.read_uint8()
-        buffer = b""
+        num_bytes = 0
 
         if data_type & _TYPE_ACCOUNT:
-            account_id = parser.read(AccountID.LENGTH)
-            buffer += account_id
+            num_bytes += AccountID.LENGTH
         if data_type & _TYPE_CURRENCY:
-            currency = parser.read(Currency.LENGTH)
-            buffer += currency
+            num_bytes += Currency.LENGTH
         if data_type & _TYPE_ISSUER:
-            issuer = parser.read(AccountID.LENGTH)
-            buffer += issuer
+            num_bytes += AccountID.LENGTH
 
-        return cls(bytes([data_type]) + buffer)
+        return cls(bytes([data_type]) + parser.read(num_bytes))
 
-    def to_json(self: Self) -> Dict[str, str]:
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self], parser: BinaryParser, _length_hint: Optional[None] = None
+    ) -> Dict[str, str]:
         """
-        Returns the JSON representation of a PathStep.
+        Read a PathStep from a BinaryParser and return its JSON representation.
+
+        Args:
+            parser: The parser to read the PathStep from.
 
         Returns:
-            The JSON representation of a PathStep.
+            The JSON representation of the PathStep.
         """
-        parser = BinaryParser(str(self))
         data_type = parser.read_uint8()
         json = {}
 
@@ -125,6 +143,15 @@ class PathStep(SerializedType):
 
         return json
 
+    def to_json(self: Self) -> Dict[str, str]:
+        """
+        Returns the JSON representation of a PathStep.
+
+        Returns:
+            The JSON representation of a PathStep.
+        """
+        return self.json_from_parser(BinaryParser.from_bytes(self.buffer))
+
     @property
     def type(self: Self) -> int:
         """Get a number representing the type of this PathStep.
@@ -139,6 +166,8 @@ class PathStep(SerializedType):
 class Path(SerializedType):
     """Class for serializing/deserializing Paths."""
 
+    __slots__ = ()
+
     @classmethod
     def from_value(cls: Type[Self], value: List[Dict[str, str]]) -> Self:
         """
@@ -149,6 +178,22 @@ class Path(SerializedType):
 
         Returns:
             The Path constructed from value.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self], bytesink: bytearray, value: List[Dict[str, str]]
+    ) -> None:
+        """
+        Serialize an array of dictionaries describing PathSteps directly into a
+        bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized Path to.
+            value: The array to serialize.
 
         Raises:
             XRPLBinaryCodecException: If the supplied value is of the wrong type.
@@ -159,11 +204,8 @@ class Path(SerializedType):
                 f"received {value.__class__.__name__}."
             )
 
-        buffer: bytes = b""
         for PathStep_dict in value:
-            pathstep = PathStep.from_value(PathStep_dict)
-            buffer += bytes(pathstep)
-        return cls(buffer)
+            PathStep.write_from_value(bytesink, PathStep_dict)
 
     @classmethod
     def from_parser(
@@ -183,34 +225,48 @@ class Path(SerializedType):
             pathstep = PathStep.from_parser(parser)
             buffer.append(bytes(pathstep))
 
-            if parser.peek() == cast(bytes, _PATHSET_END_BYTE) or parser.peek() == cast(
-                bytes, _PATH_SEPARATOR_BYTE
-            ):
+            if parser.peek() in (_PATHSET_END_BYTE, _PATH_SEPARATOR_BYTE):
                 break
         return cls(b"".join(buffer))
 
-    def to_json(self: Self) -> List[Dict[str, str]]:
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self], parser: BinaryParser, _length_hint: Optional[None] = None
+    ) -> List[Dict[str, str]]:
         """
-        Returns the JSON representation of a Path.
+        Read a Path from a BinaryParser and return its JSON representation.
+
+        Args:
+            parser: The parser to read the Path from.
 
         Returns:
-            The JSON representation of a Path.
+            The JSON representation of the Path.
         """
         json = []
-        path_parser = BinaryParser(str(self))
-
-        while not path_parser.is_end():
-            pathstep = PathStep.from_parser(path_parser)
-            json.append(pathstep.to_json())
+        while not parser.is_end():
+            json.append(PathStep.json_from_parser(parser))
 
+            if parser.peek() in (_PATHSET_END_BYTE, _PATH_SEPARATOR_BYTE):
+                break
         return json
 
+    def to_json(self: Self) -> List[Dict[str, str]]:
+        """
+        Returns the JSON representation of a Path.
+
+        Returns:
+            The JSON representation of a Path.
+        """
+        return self.json_from_parser(BinaryParser.from_bytes(self.buffer))
+
 
 class PathSet(SerializedType):
     """Codec for serializing and deserializing PathSet fields.
     See `PathSet Fields <https://xrpl.org/serialization.html#pathset-fields>`_
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_value(cls: Type[Self], value: List[List[Dict[str, str]]]) -> Self:
         """
@@ -221,6 +277,21 @@ class PathSet(SerializedType):
 
         Returns:
             The PathSet constructed from value.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self], bytesink: bytearray, value: List[List[Dict[str, str]]]
+    ) -> None:
+        """
+        Serialize a List of Lists representing paths directly into a bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized PathSet to.
+            value: The List to serialize.
 
         Raises:
             XRPLBinaryCodecException: If the PathSet representation is invalid.
@@ -231,17 +302,14 @@ class PathSet(SerializedType):
                 f" received {value.__class__.__name__}."
             )
 
-        if _is_path_set(value):
-            buffer: List[bytes] = []
-            for path_dict in value:
-                path = Path.from_value(path_dict)
-                buffer.append(bytes(path))
-                buffer.append(bytes([_PATH_SEPARATOR_BYTE]))
+        if not _is_path_set(value):
+            raise XRPLBinaryCodecException("Cannot construct PathSet from given value")
 
-            buffer[-1] = bytes([_PATHSET_END_BYTE])
-            return cls(b"".join(buffer))
-
-        raise XRPLBinaryCodecException("Cannot construct PathSet from given value")
+        for index, path_dict in enumerate(value):
+            if index > 0:
+                bytesink.append(_PATH_SEPARATOR_BYTE)
+            Path.write_from_value(bytesink, path_dict)
+        bytesink.append(_PATHSET_END_BYTE)
 
     @classmethod
     def from_parser(
@@ -266,19 +334,32 @@ class PathSet(SerializedType):
                 break
         return cls(b"".join(buffer))
 
-    def to_json(self: Self) -> List[List[Dict[str, str]]]:
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self], parser: BinaryParser, _length_hint: Optional[None] = None
+    ) -> List[List[Dict[str, str]]]:
         """
-        Returns the JSON representation of a PathSet.
+        Read a PathSet from a BinaryParser and return its JSON representation.
+
+        Args:
+            parser: The parser to read the PathSet from.
 
         Returns:
-            The JSON representation of a PathSet.
+            The JSON representation of the PathSet.
         """
         json = []
-        pathset_parser = BinaryParser(str(self))
-
-        while not pathset_parser.is_end():
-            path = Path.from_parser(pathset_parser)
-            json.append(path.to_json())
-            pathset_parser.skip(1)
+        while not parser.is_end():
+            json.append(Path.json_from_parser(parser))
 
+            if parser.read_uint8() == _PATHSET_END_BYTE:
+                break
         return json
+
+    def to_json(self: Self) -> List[List[Dict[str, str]]]:
+        """
+        Returns the JSON representation of a PathSet.
+
+        Returns:
+            The JSON representation of a PathSet.
+        """
+        return self.json_from_parser(BinaryParser.from_bytes(self.buffer))
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class SerializedType(ABC):
     """The base class for all binary codec field types."""
 
+    __slots__ = ("buffer",)
+
     def __init__(self: Self, buffer: bytes = bytes()) -> None:
         """
         Construct a new SerializedType.
@@ -41,6 +43,66 @@ class SerializedType(ABC):
         # child-classes accept a variety of types.
         pass
 
+    @classmethod
+    def write_from_value(
+        cls: Type[Self],
+        bytesink: bytearray,
+        value: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Serialize a JSON value of this type directly into a bytearray.
+
+        Composite types override this so that nested values are written straight
+        into their parent's sink instead of being built up and then copied.
+
+        Args:
+            bytesink: The bytearray to write the serialized value to.
+            value: The JSON value to serialize.
+
+        Returns: None
+        """
+        cls.from_value(value).to_byte_sink(bytesink)
+
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        length_hint: Any = None,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """
+        Read a value of this type from a BinaryParser and return its JSON
+        representation.
+
+        Composite types override this so that nested values are decoded straight
+        from the parser's buffer instead of being copied out and parsed again.
+
+        Args:
+            parser: The parser to read the value from.
+            length_hint: The number of bytes to consume, for variable length types.
+
+        Returns:
+            The JSON representation of the value.
+        """
+        return cls.from_parser(parser, length_hint).to_json()
+
+    @classmethod
+    def skip_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        length_hint: Any = None,  # noqa: ANN401
+    ) -> None:
+        """
+        Advance a BinaryParser past a value of this type without decoding it.
+
+        Types whose length can be worked out without reading the whole value
+        override this to skip it directly.
+
+        Args:
+            parser: The parser to skip the value in.
+            length_hint: The number of bytes to consume, for variable length types.
+        """
+        cls.from_parser(parser, length_hint)
+
     def to_byte_sink(self: Self, bytesink: bytearray) -> None:
         """
         Write the bytes representation of a SerializedType to a bytearray.
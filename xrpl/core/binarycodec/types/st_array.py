@@ -24,6 +24,8 @@ class STArray(SerializedType):
     See `Array Fields <https://xrpl.org/serialization.html#array-fields>`_
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_parser(
         cls: Type[Self],
@@ -39,18 +41,18 @@ class STArray(SerializedType):
         Returns:
             The STArray constructed from parser.
         """
-        bytestring = b""
+        bytesink = bytearray()
 
         while not parser.is_end():
             field = parser.read_field()
             if field.name == _ARRAY_END_MARKER_NAME:
                 break
-            bytestring += bytes(field.header)
-            bytestring += bytes(parser.read_field_value(field))
-            bytestring += _OBJECT_END_MARKER
+            bytesink.extend(field.header_bytes)
+            parser.read_field_value(field).to_byte_sink(bytesink)
+            bytesink.extend(_OBJECT_END_MARKER)
 
-        bytestring += _ARRAY_END_MARKER
-        return cls(bytestring)
+        bytesink.extend(_ARRAY_END_MARKER)
+        return cls(bytes(bytesink))
 
     @classmethod
     def from_value(cls: Type[Self], value: List[Any]) -> Self:
@@ -62,6 +64,21 @@ class STArray(SerializedType):
 
         Returns:
             The STArray object constructed from value.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self], bytesink: bytearray, value: List[Any]
+    ) -> None:
+        """
+        Serialize a list of objects directly into a bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized array to.
+            value: The list of objects to serialize.
 
         Raises:
             XRPLBinaryCodecException: If the provided value isn't a list or contains
@@ -78,22 +95,26 @@ class STArray(SerializedType):
                 ("Cannot construct STArray from a list of non-dict" " objects")
             )
 
-        bytestring = b""
         for obj in value:
-            transaction = STObject.from_value(obj)
-            bytestring += bytes(transaction)
-        bytestring += _ARRAY_END_MARKER
-        return cls(bytestring)
+            STObject.write_from_value(bytesink, obj)
+        bytesink.extend(_ARRAY_END_MARKER)
 
-    def to_json(self: Self) -> List[Any]:
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        _length_hint: Optional[None] = None,
+    ) -> List[Any]:
         """
-        Returns the JSON representation of a STArray.
+        Read a STArray from a BinaryParser and return its JSON representation.
+
+        Args:
+            parser: The parser to read the STArray from.
 
         Returns:
-            The JSON representation of a STArray.
+            The JSON representation of the STArray.
         """
         result = []
-        parser = BinaryParser(str(self))
 
         while not parser.is_end():
             field = parser.read_field()
@@ -101,6 +122,33 @@ class STArray(SerializedType):
                 break
 
             outer = {}
-            outer[field.name] = STObject.from_parser(parser).to_json()
+            outer[field.name] = STObject.json_from_parser(parser)
             result.append(outer)
         return result
+
+    @classmethod
+    def skip_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        _length_hint: Optional[None] = None,
+    ) -> None:
+        """
+        Advance a BinaryParser past a STArray without decoding its objects.
+
+        Args:
+            parser: The parser to skip the STArray in.
+        """
+        while not parser.is_end():
+            field = parser.read_field()
+            if field.name == _ARRAY_END_MARKER_NAME:
+                break
+            STObject.skip_from_parser(parser)
+
+    def to_json(self: Self) -> List[Any]:
+        """
+        Returns the JSON representation of a STArray.
+
+        Returns:
+            The JSON representation of a STArray.
+        """
+        return self.json_from_parser(BinaryParser.from_bytes(self.buffer))
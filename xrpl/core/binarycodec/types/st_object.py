@@ -2,24 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from typing_extensions import Final, Self
 
 from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
-from xrpl.core.binarycodec.definitions import (
-    FieldInstance,
-    get_field_instance,
-    get_ledger_entry_type_code,
-    get_ledger_entry_type_name,
-    get_permission_value_type_code,
-    get_permission_value_type_name,
-    get_transaction_result_code,
-    get_transaction_result_name,
-    get_transaction_type_code,
-    get_transaction_type_name,
-)
+from xrpl.core.binarycodec.definitions import Definitions, FieldInstance
+from xrpl.core.binarycodec.definitions.definitions import get_definitions
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.serialized_type import SerializedType
 from xrpl.core.binarycodec.types.uint64 import SPECIAL_FIELDS
@@ -31,8 +32,111 @@ _DESTINATION: Final[str] = "Destination"
 _ACCOUNT: Final[str] = "Account"
 _SOURCE_TAG: Final[str] = "SourceTag"
 _DEST_TAG: Final[str] = "DestinationTag"
+_ACCOUNT_ID: Final[str] = "AccountID"
+
+_UNL_MODIFY_TX: Final[bytes] = bytes.fromhex("0066")
+
+DEFAULT_FIELD_ORDER_CACHE_SIZE: Final[int] = 1024
+"""
+The default number of object shapes whose canonical field order is cached.
+:meta hide-value:
+"""
+
+
+class FieldOrderCacheInfo(NamedTuple):
+    """Statistics for the canonical field order cache."""
+
+    hits: int
+    """The number of encoded objects whose field order was found in the cache."""
+
+    misses: int
+    """The number of encoded objects whose fields had to be looked up and sorted."""
+
+    maxsize: int
+    """The maximum number of cached shapes. 0 means caching is off."""
+
+    currsize: int
+    """The number of cached shapes."""
+
+
+class _FieldOrder(NamedTuple):
+    """The canonical field order of one shape of object."""
+
+    fields: Tuple[FieldInstance, ...]
+    """The serialized fields, sorted by ordinal."""
+
+    signing_fields: Tuple[FieldInstance, ...]
+    """The serialized signing fields, sorted by ordinal."""
+
+    account_field_names: FrozenSet[str]
+    """The names of the AccountID fields, which can hold an X-Address."""
+
+
+def _compute_field_order(
+    definitions: Definitions, field_names: FrozenSet[str]
+) -> _FieldOrder:
+    """Uncached `_get_field_order`."""
+    field_instances = [definitions.field_instances[name] for name in field_names]
+    fields = tuple(
+        sorted(
+            (field for field in field_instances if field.is_serialized),
+            key=lambda x: x.ordinal,
+        )
+    )
+    return _FieldOrder(
+        fields=fields,
+        signing_fields=tuple(field for field in fields if field.is_signing),
+        account_field_names=frozenset(
+            field.name for field in field_instances if field.type == _ACCOUNT_ID
+        ),
+    )
+
+
+# Keyed on the frozenset of an object's field names, since the canonical order
+# depends on nothing else. A stream of Payments has only a handful of distinct
+# shapes, such as with and without a DestinationTag, so the fields are sorted by
+# ordinal once per shape instead of once per object.
+_field_order_cache_size = DEFAULT_FIELD_ORDER_CACHE_SIZE
+_get_field_order = lru_cache(DEFAULT_FIELD_ORDER_CACHE_SIZE)(_compute_field_order)
+
+
+def set_field_order_cache_size(maxsize: int) -> None:
+    """
+    Set how many object shapes the encoder caches the canonical field order of.
+    This clears the cache.
+
+    Args:
+        maxsize: The maximum number of cached shapes. 0 turns caching off.
+
+    Raises:
+        XRPLBinaryCodecException: If maxsize is negative.
+    """
+    global _field_order_cache_size, _get_field_order
+    if maxsize < 0:
+        raise XRPLBinaryCodecException("Cache size must not be negative.")
+    _field_order_cache_size = maxsize
+    _get_field_order = lru_cache(maxsize)(_compute_field_order)
 
-_UNL_MODIFY_TX: Final[str] = "0066"
+
+def clear_field_order_cache() -> None:
+    """Empty the canonical field order cache and reset its statistics."""
+    set_field_order_cache_size(_field_order_cache_size)
+
+
+def get_field_order_cache_info() -> FieldOrderCacheInfo:
+    """
+    Returns the statistics of the canonical field order cache.
+
+    Returns:
+        The hits, misses, maximum size and current size of the cache.
+    """
+    info = _get_field_order.cache_info()
+    return FieldOrderCacheInfo(
+        hits=info.hits,
+        misses=info.misses,
+        maxsize=_field_order_cache_size,
+        currsize=info.currsize,
+    )
 
 
 def _handle_xaddress(field: str, xaddress: str) -> Dict[str, Union[str, int]]:
@@ -61,36 +165,56 @@ def _handle_xaddress(field: str, xaddress: str) -> Dict[str, Union[str, int]]:
     return {field: classic_address}
 
 
-# all of these fields have enum values that are used for serialization
-# converts the string name to the corresponding enum code
-def _str_to_enum(field: str, value: str) -> Union[str, int]:
-    if field == "TransactionType":
-        return get_transaction_type_code(value)
-    if field == "TransactionResult":
-        return get_transaction_result_code(value)
-    if field == "LedgerEntryType":
-        return get_ledger_entry_type_code(value)
-    if field == "PermissionValue":
-        return get_permission_value_type_code(value)
-    return value
-
-
-# reverse of the above function
-def _enum_to_str(field: str, value: int) -> Union[str, int]:
-    if field == "TransactionType":
-        return get_transaction_type_name(value)
-    if field == "TransactionResult":
-        return get_transaction_result_name(value)
-    if field == "LedgerEntryType":
-        return get_ledger_entry_type_name(value)
-    if field == "PermissionValue":
-        return get_permission_value_type_name(value)
-    return value
+def _decode_xaddresses(
+    value: Dict[str, Any], xaddress_field_names: List[str]
+) -> Dict[str, Any]:
+    """Replace the X-Addresses in an object with classic addresses and tags.
+
+    Args:
+        value: The object to decode the X-Addresses of.
+        xaddress_field_names: The names of the fields that hold an X-Address.
+
+    Returns:
+        A copy of the object without X-Addresses.
+
+    Raises:
+        XRPLBinaryCodecException: An X-Address tag does not match the tag field.
+    """
+    xaddress_decoded: Dict[str, Any] = {}
+    for k, v in value.items():
+        if k in xaddress_field_names:
+            handled = _handle_xaddress(k, v)
+            if (
+                _SOURCE_TAG in handled
+                and handled[_SOURCE_TAG] is not None
+                and _SOURCE_TAG in value
+                and value[_SOURCE_TAG] is not None
+                and handled[_SOURCE_TAG] != value[_SOURCE_TAG]
+            ):
+                raise XRPLBinaryCodecException(
+                    "Cannot have mismatched Account X-Address and SourceTag"
+                )
+            if (
+                _DEST_TAG in handled
+                and handled[_DEST_TAG] is not None
+                and _DEST_TAG in value
+                and value[_DEST_TAG] is not None
+                and handled[_DEST_TAG] != value[_DEST_TAG]
+            ):
+                raise XRPLBinaryCodecException(
+                    "Cannot have mismatched Destination X-Address and " "DestinationTag"
+                )
+            xaddress_decoded.update(handled)
+        else:
+            xaddress_decoded[k] = v
+    return xaddress_decoded
 
 
 class STObject(SerializedType):
     """Class for serializing/deserializing Dicts of objects."""
 
+    __slots__ = ()
+
     @classmethod
     def from_parser(
         cls: Type[Self],
@@ -137,6 +261,27 @@ class STObject(SerializedType):
 
         Returns:
             The STObject object constructed from value.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value, only_signing)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self],
+        bytesink: bytearray,
+        value: Dict[str, Any],
+        only_signing: bool = False,
+    ) -> None:
+        """
+        Serialize a dictionary directly into a bytearray.
+
+        Nested objects and arrays are written into the same bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized object to.
+            value: The dictionary to serialize.
+            only_signing: whether only the signing fields should be included.
 
         Raises:
             XRPLBinaryCodecException: If the STObject can't be constructed
@@ -146,61 +291,51 @@ class STObject(SerializedType):
             BinarySerializer,
         )
 
-        serializer = BinarySerializer()
-
-        xaddress_decoded = {}
-        for k, v in value.items():
-            if isinstance(v, str) and is_valid_xaddress(v):
-                handled = _handle_xaddress(k, v)
-                if (
-                    _SOURCE_TAG in handled
-                    and handled[_SOURCE_TAG] is not None
-                    and _SOURCE_TAG in value
-                    and value[_SOURCE_TAG] is not None
-                    and handled[_SOURCE_TAG] != value[_SOURCE_TAG]
-                ):
-                    raise XRPLBinaryCodecException(
-                        "Cannot have mismatched Account X-Address and SourceTag"
-                    )
-                if (
-                    _DEST_TAG in handled
-                    and handled[_DEST_TAG] is not None
-                    and _DEST_TAG in value
-                    and value[_DEST_TAG] is not None
-                    and handled[_DEST_TAG] != value[_DEST_TAG]
-                ):
-                    raise XRPLBinaryCodecException(
-                        "Cannot have mismatched Destination X-Address and "
-                        "DestinationTag"
-                    )
-                xaddress_decoded.update(handled)
-            else:
-                xaddress_decoded[k] = _str_to_enum(k, v)
-
-        sorted_keys: List[FieldInstance] = []
-        for field_name in xaddress_decoded:
-            field_instance = get_field_instance(field_name)
-            if (
-                field_instance is not None
-                and xaddress_decoded[field_instance.name] is not None
-                and field_instance.is_serialized
-            ):
-                sorted_keys.append(field_instance)
-        sorted_keys.sort(key=lambda x: x.ordinal)
+        serializer = BinarySerializer(bytesink)
 
-        if only_signing:
-            sorted_keys = list(filter(lambda x: x.is_signing, sorted_keys))
+        definitions = get_definitions()
+        field_order = _get_field_order(definitions, frozenset(value))
+        # only AccountID fields can hold an X-Address
+        xaddress_field_names = [
+            name
+            for name in field_order.account_field_names
+            if isinstance(value[name], str) and is_valid_xaddress(value[name])
+        ]
+        if xaddress_field_names:
+            value = _decode_xaddresses(value, xaddress_field_names)
+            field_order = _get_field_order(definitions, frozenset(value))
 
         is_unl_modify = False
 
-        for field in sorted_keys:
+        for field in field_order.signing_fields if only_signing else field_order.fields:
+            field_value = value[field.name]
+            if field_value is None:
+                continue
+            if field.enum_code_from_name is not None:
+                # these fields have enum values that are used for serialization
+                # converts the string name to the corresponding enum code
+                field_value = field.enum_code_from_name(field_value)
+            args = (
+                (field_value, field.name)
+                if field.name in SPECIAL_FIELDS
+                else (field_value,)
+            )
+            # true when in the UNLModify pseudotransaction (after the transaction type
+            # has been processed) and working with the Account field
+            # The Account field must not be a part of the UNLModify pseudotransaction
+            # encoding, due to a bug in rippled
+            is_unl_modify_workaround = field.name == _ACCOUNT and is_unl_modify
             try:
-                args = (
-                    (xaddress_decoded[field.name], field.name)
-                    if field.name in SPECIAL_FIELDS
-                    else (xaddress_decoded[field.name],)
-                )
-                associated_value = field.associated_type.from_value(*args)
+                # the UInt64 fields in SPECIAL_FIELDS also need the field name, which
+                # only `from_value` takes
+                if is_unl_modify_workaround or field.name in SPECIAL_FIELDS:
+                    serializer.write_field_and_value(
+                        field,
+                        field.associated_type.from_value(*args),
+                        is_unl_modify_workaround,
+                    )
+                else:
+                    serializer.write_field_from_value(field, field_value)
             except XRPLBinaryCodecException as e:
                 # mildly hacky way to get more context in the error
                 # provides the field name and not just the type it's expecting
@@ -209,39 +344,62 @@ class STObject(SerializedType):
                 raise
             if (
                 field.name == "TransactionType"
-                and str(associated_value) == _UNL_MODIFY_TX
+                and bytesink[-len(_UNL_MODIFY_TX) :] == _UNL_MODIFY_TX
             ):
                 # triggered when the TransactionType field has a value of 'UNLModify'
                 is_unl_modify = True
-            is_unl_modify_workaround = field.name == "Account" and is_unl_modify
-            # true when in the UNLModify pseudotransaction (after the transaction type
-            # has been processed) and working with the Account field
-            # The Account field must not be a part of the UNLModify pseudotransaction
-            # encoding, due to a bug in rippled
 
-            serializer.write_field_and_value(
-                field, associated_value, is_unl_modify_workaround
-            )
             if field.type == _ST_OBJECT:
                 serializer.append(_OBJECT_END_MARKER_BYTE)
 
-        return cls(bytes(serializer))
-
-    def to_json(self: Self) -> Dict[str, Any]:
+    @classmethod
+    def json_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        _length_hint: Optional[None] = None,
+    ) -> Dict[str, Any]:
         """
-        Returns the JSON representation of a STObject.
+        Read a STObject from a BinaryParser and return its JSON representation.
+
+        Args:
+            parser: The parser to read the STObject from.
 
         Returns:
-            The JSON representation of a STObject.
+            The JSON representation of the STObject.
         """
-        parser = BinaryParser(str(self))
         accumulator = {}
 
         while not parser.is_end():
             field = parser.read_field()
             if field.name == _OBJECT_END_MARKER:
                 break
-            json_value = parser.read_field_value(field).to_json()
-            accumulator[field.name] = _enum_to_str(field.name, json_value)
+            accumulator[field.name] = parser.read_field_json(field)
 
         return accumulator
+
+    @classmethod
+    def skip_from_parser(
+        cls: Type[Self],
+        parser: BinaryParser,
+        _length_hint: Optional[None] = None,
+    ) -> None:
+        """
+        Advance a BinaryParser past a STObject without decoding its fields.
+
+        Args:
+            parser: The parser to skip the STObject in.
+        """
+        while not parser.is_end():
+            field = parser.read_field()
+            if field.name == _OBJECT_END_MARKER:
+                break
+            parser.skip_field_value(field)
+
+    def to_json(self: Self) -> Dict[str, Any]:
+        """
+        Returns the JSON representation of a STObject.
+
+        Returns:
+            The JSON representation of a STObject.
+        """
+        return self.json_from_parser(BinaryParser.from_bytes(self.buffer))
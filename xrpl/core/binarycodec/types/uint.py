@@ -17,6 +17,8 @@ class UInt(SerializedType):
     See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """Construct a new UInt type from a ``bytes`` value."""
         self.buffer = buffer
@@ -4,7 +4,7 @@ See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
 
 from __future__ import annotations
 
-from typing import Optional, Type
+from typing import Dict, Optional, Type, cast
 
 from typing_extensions import Final, Self
 
@@ -14,12 +14,19 @@ from xrpl.core.binarycodec.types.uint import UInt
 
 _WIDTH: Final[int] = 2  # 16 / 8
 
+# UInt16 values are immutable, so one instance of each small value, such as the
+# TransactionType and LedgerEntryType codes, is shared.
+_INTERNED: Dict[int, UInt16] = {}
+_MAX_INTERNED: Final[int] = 255
+
 
 class UInt16(UInt):
     """Class for serializing and deserializing a 16-bit UInt.
     See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes = bytes(_WIDTH)) -> None:
         """Construct a new UInt16 type from a ``bytes`` value."""
         super().__init__(buffer)
@@ -37,7 +44,10 @@ class UInt16(UInt):
         Returns:
             The UInt16 constructed from parser.
         """
-        return cls(parser.read(_WIDTH))
+        value = parser.read_uint16()
+        if cls is UInt16 and value <= _MAX_INTERNED:
+            return cast(Self, _intern(value))
+        return cls(value.to_bytes(_WIDTH, byteorder="big", signed=False))
 
     @classmethod
     def from_value(cls: Type[Self], value: int) -> Self:
@@ -60,7 +70,17 @@ class UInt16(UInt):
             )
 
         if isinstance(value, int):
+            if cls is UInt16 and value <= _MAX_INTERNED:
+                return cast(Self, _intern(value))
             value_bytes = (value).to_bytes(_WIDTH, byteorder="big", signed=False)
             return cls(value_bytes)
 
         raise XRPLBinaryCodecException("Cannot construct UInt16 from given value")
+
+
+def _intern(value: int) -> UInt16:
+    interned = _INTERNED.get(value)
+    if interned is None:
+        interned = UInt16(value.to_bytes(_WIDTH, byteorder="big", signed=False))
+        _INTERNED[value] = interned
+    return interned
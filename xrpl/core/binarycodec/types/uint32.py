@@ -21,6 +21,8 @@ class UInt32(UInt):
     See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes = bytes(_WIDTH)) -> None:
         """Construct a new UInt32 type from a ``bytes`` value."""
         super().__init__(buffer)
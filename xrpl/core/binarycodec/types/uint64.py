@@ -32,6 +32,8 @@ class UInt64(UInt):
     See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes = bytes(_WIDTH)) -> None:
         """Construct a new UInt64 type from a ``bytes`` value."""
         super().__init__(buffer)
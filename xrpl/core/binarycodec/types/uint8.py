@@ -5,7 +5,7 @@ See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
 
 from __future__ import annotations
 
-from typing import Optional, Type
+from typing import Dict, Optional, Type, cast
 
 from typing_extensions import Final, Self
 
@@ -15,6 +15,9 @@ from xrpl.core.binarycodec.types.uint import UInt
 
 _WIDTH: Final[int] = 1  # 8 / 8
 
+# UInt8 values are immutable, so one instance of each value is shared.
+_INTERNED: Dict[int, UInt8] = {}
+
 
 class UInt8(UInt):
     """
@@ -22,6 +25,8 @@ class UInt8(UInt):
     See `UInt Fields <https://xrpl.org/serialization.html#uint-fields>`_
     """
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes = bytes(_WIDTH)) -> None:
         """Construct a new UInt8 type from a ``bytes`` value."""
         super().__init__(buffer)
@@ -39,7 +44,10 @@ class UInt8(UInt):
         Returns:
             A new UInt8.
         """
-        return cls(parser.read(_WIDTH))
+        value = parser.read_uint8()
+        if cls is UInt8:
+            return cast(Self, _intern(value))
+        return cls(value.to_bytes(_WIDTH, byteorder="big", signed=False))
 
     @classmethod
     def from_value(cls: Type[Self], value: int) -> Self:
@@ -62,7 +70,17 @@ class UInt8(UInt):
             )
 
         if isinstance(value, int):
+            if cls is UInt8:
+                return cast(Self, _intern(value))
             value_bytes = (value).to_bytes(_WIDTH, byteorder="big", signed=False)
             return cls(value_bytes)
 
         raise XRPLBinaryCodecException("Cannot construct UInt8 from given value")
+
+
+def _intern(value: int) -> UInt8:
+    interned = _INTERNED.get(value)
+    if interned is None:
+        interned = UInt8(value.to_bytes(_WIDTH, byteorder="big", signed=False))
+        _INTERNED[value] = interned
+    return interned
@@ -6,8 +6,8 @@ from typing import List, Optional, Type
 
 from typing_extensions import Final, Self
 
-from xrpl.core.binarycodec import XRPLBinaryCodecException
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.core.binarycodec.types.hash256 import Hash256
 from xrpl.core.binarycodec.types.serialized_type import SerializedType
 
@@ -17,6 +17,8 @@ _HASH_LENGTH_BYTES: Final[int] = 32
 class Vector256(SerializedType):
     """Codec for serializing and deserializing vectors of Hash256."""
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """Construct a Vector256."""
         super().__init__(buffer)
@@ -30,6 +32,20 @@ class Vector256(SerializedType):
 
         Returns:
             A Vector256 object representing these hashes.
+        """
+        bytesink = bytearray()
+        cls.write_from_value(bytesink, value)
+        return cls(bytes(bytesink))
+
+    @classmethod
+    def write_from_value(
+        cls: Type[Self], bytesink: bytearray, value: List[str]
+    ) -> None:
+        """Serialize a list of hex-encoded hashes directly into a bytearray.
+
+        Args:
+            bytesink: The bytearray to write the serialized hashes to.
+            value: A list of hashes encoded as hex strings.
 
         Raises:
             XRPLBinaryCodecException: If the supplied value is of the wrong type.
@@ -40,10 +56,8 @@ class Vector256(SerializedType):
                 " received {value.__class__.__name__}."
             )
 
-        byte_list = []
         for string in value:
-            byte_list.append(bytes(Hash256.from_value(string)))
-        return cls(b"".join(byte_list))
+            Hash256.from_value(string).to_byte_sink(bytesink)
 
     @classmethod
     def from_parser(
@@ -58,12 +72,9 @@ class Vector256(SerializedType):
         Returns:
             A Vector256 object.
         """
-        byte_list = []
         num_bytes = length_hint if length_hint is not None else len(parser)
         num_hashes = num_bytes // _HASH_LENGTH_BYTES
-        for i in range(num_hashes):
-            byte_list.append(bytes(Hash256.from_parser(parser)))
-        return cls(b"".join(byte_list))
+        return cls(parser.read(num_hashes * _HASH_LENGTH_BYTES))
 
     def to_json(self: Self) -> List[str]:
         """Return a list of hashes encoded as hex strings.
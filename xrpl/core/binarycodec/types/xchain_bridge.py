@@ -25,6 +25,8 @@ _TYPE_KEYS = {type[0] for type in _TYPE_ORDER}
 class XChainBridge(SerializedType):
     """Codec for serializing and deserializing bridge fields."""
 
+    __slots__ = ()
+
     def __init__(self: Self, buffer: bytes) -> None:
         """Construct a XChainBridge from given bytes."""
         super().__init__(buffer)
@@ -90,7 +92,7 @@ class XChainBridge(SerializedType):
         Returns:
             The JSON representation of a XChainBridge.
         """
-        parser = BinaryParser(str(self))
+        parser = BinaryParser.from_bytes(self.buffer)
         return_json = {}
         for name, object_type in _TYPE_ORDER:
             if object_type == AccountID:
@@ -6,11 +6,13 @@ for all cryptographic algorithms are derived from this interface.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Type
+from typing import TYPE_CHECKING, Tuple, Type
 
-from ecpy.keys import ECPrivateKey  # type: ignore
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from ecpy.keys import ECPrivateKey  # type: ignore
+
 
 class CryptoImplementation(ABC):
     """
@@ -2,8 +2,6 @@
 
 import hashlib
 
-import Crypto.Hash.RIPEMD160 as RIPEMD160
-
 
 def sha512_first_half(message: bytes) -> bytes:
     """
@@ -30,5 +28,9 @@ def get_account_id(public_key: bytes) -> bytes:
     Returns:
         The account ID for the given public key.
     """
+    # imported here since loading pycryptodome is slow, and only needed to derive
+    # addresses
+    import Crypto.Hash.RIPEMD160 as RIPEMD160
+
     sha_hash = hashlib.sha256(public_key).digest()
     return bytes(RIPEMD160.new(sha_hash).digest())
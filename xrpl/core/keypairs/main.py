@@ -1,25 +1,29 @@
 """Interface for cryptographic key pairs for use with the XRP Ledger."""
 
+from importlib import import_module
 from secrets import token_bytes
-from typing import Dict, Optional, Tuple, Type, Union
+from typing import Dict, Optional, Tuple, Type, Union, cast
 
 from typing_extensions import Final
 
 from xrpl.constants import CryptoAlgorithm
 from xrpl.core import addresscodec
 from xrpl.core.keypairs.crypto_implementation import CryptoImplementation
-from xrpl.core.keypairs.ed25519 import ED25519
-from xrpl.core.keypairs.ed25519 import PREFIX as ED_PREFIX
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
 from xrpl.core.keypairs.helpers import get_account_id
-from xrpl.core.keypairs.secp256k1 import SECP256K1
 
 _VERIFICATION_MESSAGE: Final[bytes] = b"This test message should verify."
 
-_ALGORITHM_TO_MODULE_MAP: Final[Dict[CryptoAlgorithm, Type[CryptoImplementation]]] = {
-    CryptoAlgorithm.ED25519: ED25519,
-    CryptoAlgorithm.SECP256K1: SECP256K1,
+# Keys of this prefix are ED25519 keys, see xrpl.core.keypairs.ed25519.
+_ED_PREFIX: Final[str] = "ED"
+
+# The implementations are imported on first use, since setting up their curves
+# is a noticeable part of the time it takes to import xrpl.
+_ALGORITHM_TO_MODULE_NAME_MAP: Final[Dict[CryptoAlgorithm, Tuple[str, str]]] = {
+    CryptoAlgorithm.ED25519: ("xrpl.core.keypairs.ed25519", "ED25519"),
+    CryptoAlgorithm.SECP256K1: ("xrpl.core.keypairs.secp256k1", "SECP256K1"),
 }
+_ALGORITHM_TO_MODULE_MAP: Dict[CryptoAlgorithm, Type[CryptoImplementation]] = {}
 
 
 def generate_seed(
@@ -71,7 +75,7 @@ def derive_keypair(
             verifiable signature.
     """
     decoded_seed, algorithm = addresscodec.decode_seed(seed, algorithm)
-    module = _ALGORITHM_TO_MODULE_MAP[algorithm]
+    module = _get_module(algorithm)
     public_key, private_key = module.derive_keypair(decoded_seed, validator)
     signature = module.sign(_VERIFICATION_MESSAGE, private_key)
     if not module.is_valid_message(_VERIFICATION_MESSAGE, signature, public_key):
@@ -142,7 +146,19 @@ def is_valid_message(message: bytes, signature: bytes, public_key: str) -> bool:
     )
 
 
+def _get_module(algorithm: CryptoAlgorithm) -> Type[CryptoImplementation]:
+    module = _ALGORITHM_TO_MODULE_MAP.get(algorithm)
+    if module is None:
+        module_name, class_name = _ALGORITHM_TO_MODULE_NAME_MAP[algorithm]
+        module = cast(
+            Type[CryptoImplementation],
+            getattr(import_module(module_name), class_name),
+        )
+        _ALGORITHM_TO_MODULE_MAP[algorithm] = module
+    return module
+
+
 def _get_module_from_key(key: str) -> Type[CryptoImplementation]:
-    if key.startswith(ED_PREFIX):
-        return ED25519
-    return SECP256K1
+    if key.startswith(_ED_PREFIX):
+        return _get_module(CryptoAlgorithm.ED25519)
+    return _get_module(CryptoAlgorithm.SECP256K1)
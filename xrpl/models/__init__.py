@@ -1,17 +1,34 @@
 """Top-level exports for the models package."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from xrpl.models import amounts, currencies, requests, transactions
 from xrpl.models.amounts import *  # noqa: F401, F403
 from xrpl.models.auth_account import AuthAccount
 from xrpl.models.currencies import *  # noqa: F401, F403
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.path import Path, PathStep
-from xrpl.models.requests import *  # noqa: F401, F403
-from xrpl.models.response import Response
-from xrpl.models.transactions import *  # noqa: F401, F403
-from xrpl.models.transactions.pseudo_transactions import *  # noqa: F401, F403
 from xrpl.models.xchain_bridge import XChainBridge
 
+if TYPE_CHECKING:
+    from xrpl.models.requests import *  # noqa: F401, F403
+    from xrpl.models.response import Response
+    from xrpl.models.transactions import *  # noqa: F401, F403
+    from xrpl.models.transactions.pseudo_transactions import *  # noqa: F401, F403
+
+# Request, response and transaction models are imported on first access (PEP 562),
+# mostly through the lazy exports of their packages.
+_RESPONSE = "xrpl.models.response"
+_PSEUDO_TRANSACTIONS = "xrpl.models.transactions.pseudo_transactions"
+_PSEUDO_TRANSACTION_NAMES = (
+    "EnableAmendment",
+    "EnableAmendmentFlag",
+    "SetFee",
+    "UNLModify",
+    "EnableAmendmentFlagInterface",
+)
+
 __all__ = [
     "XRPLModelException",
     "amounts",
@@ -23,9 +40,28 @@ __all__ = [
     *requests.__all__,
     "transactions",
     *transactions.__all__,
-    *transactions.pseudo_transactions.__all__,
+    *_PSEUDO_TRANSACTION_NAMES,
     "Path",
     "PathStep",
     "Response",
     "XChainBridge",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in requests.__all__:
+        value = getattr(requests, name)
+    elif name in transactions.__all__:
+        value = getattr(transactions, name)
+    elif name == "Response":
+        value = getattr(import_module(_RESPONSE), name)
+    elif name in _PSEUDO_TRANSACTION_NAMES:
+        value = getattr(import_module(_PSEUDO_TRANSACTIONS), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -5,9 +5,24 @@ from __future__ import annotations
 import json
 import re
 from abc import ABC
-from dataclasses import dataclass, fields
+from dataclasses import MISSING, dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Pattern, Type, Union, cast, get_type_hints
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    get_type_hints,
+)
 
 from typing_extensions import Final, Literal, Self, get_args, get_origin
 
@@ -53,6 +68,13 @@ ABBREVIATIONS: Final[Dict[str, str]] = {
 EXCLUDED_KEYS = {"mpt_issuance_id"}
 
 
+# Maps each camelCase or PascalCase key seen by `from_xrpl`, such as "Account" or
+# "ledger_index", to its snake_case form. Every key of every nested dict is
+# converted, but the keys are XRPL field, request and response names, so the dict
+# stays at a few hundred entries without eviction.
+_JSON_KEYS: Dict[str, str] = {}
+
+
 def _key_to_json(field: str) -> str:
     """
     Transforms camelCase or PascalCase to snake_case. For example:
@@ -65,6 +87,14 @@ def _key_to_json(field: str) -> str:
     Raises:
         XRPLModelException: If the input is invalid
     """
+    json_key = _JSON_KEYS.get(field)
+    if json_key is None:
+        json_key = _JSON_KEYS[field] = _compute_key_to_json(field)
+    return json_key
+
+
+def _compute_key_to_json(field: str) -> str:
+    """Uncached `_key_to_json`."""
     if field in EXCLUDED_KEYS:
         return field
 
@@ -83,12 +113,231 @@ def _key_to_json(field: str) -> str:
 
 def _value_to_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     if isinstance(value, dict):
-        return {_key_to_json(k): _value_to_json(v) for (k, v) in value.items()}
+        return {
+            _JSON_KEYS.get(k) or _key_to_json(k): _value_to_json(v)
+            for (k, v) in value.items()
+        }
     if isinstance(value, list):
         return [_value_to_json(sub_value) for sub_value in value]
     return value
 
 
+def _is_any(_value: Any) -> bool:  # noqa: ANN401
+    return True
+
+
+def _is_member_of(members: FrozenSet[Any]) -> Callable[[Any], bool]:
+    def is_member(value: Any) -> bool:  # noqa: ANN401
+        try:
+            return value in members
+        except TypeError:
+            # unhashable values are never members
+            return False
+
+    return is_member
+
+
+def _compile_type_check(expected_type: Type[Any]) -> Callable[[Any], bool]:
+    """
+    Compiles a predicate that returns True if a value has the expected type.
+
+    The predicate only answers the common case quickly. When it returns False,
+    `BaseModel._check_type` works out the errors, so it must never return True for
+    a value that `_check_type` would reject.
+    """
+    expected_type_origin = get_origin(expected_type)
+    if expected_type_origin is Union:
+        # plain classes are checked with one isinstance call
+        classes: List[type] = []
+        option_checks = []
+        for option in get_args(expected_type):
+            if (
+                isinstance(option, type)
+                and get_origin(option) is None
+                and option is not Any  # type: ignore[comparison-overlap]
+                and not issubclass(option, Enum)
+            ):
+                classes.append(option)
+                if issubclass(option, BaseModel):
+                    classes.append(dict)
+            else:
+                option_checks.append(_compile_type_check(option))
+        class_tuple = tuple(classes)
+        if not option_checks:
+            return lambda value: isinstance(value, class_tuple)
+        return lambda value: isinstance(value, class_tuple) or any(
+            is_valid(value) for is_valid in option_checks
+        )
+
+    # unsure what the problem with mypy is here
+    if expected_type is Any:  # type: ignore[comparison-overlap]
+        return _is_any
+
+    if expected_type_origin is list:
+        is_valid_element = _compile_type_check(get_args(expected_type)[0])
+        return lambda value: isinstance(value, list) and all(
+            is_valid_element(element) for element in value
+        )
+
+    if expected_type_origin is dict:
+        return lambda value: isinstance(value, dict)
+
+    if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+        members = list(expected_type)
+        # mixed-in enums (e.g. str enums) are equal to their values
+        return _is_member_of(
+            frozenset(
+                [
+                    *members,
+                    *[member.value for member in members if member == member.value],
+                ]
+            )
+        )
+
+    if expected_type_origin is Literal:
+        return _is_member_of(frozenset(get_args(expected_type)))
+
+    if not isinstance(expected_type, type):
+        return lambda value: False
+
+    if issubclass(expected_type, BaseModel):
+        return lambda value: isinstance(value, (expected_type, dict))
+
+    return lambda value: isinstance(value, expected_type)
+
+
+def _compile_trusted_conversion(
+    model_class: Type[BaseModel], param: str, param_type: Type[Any]
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Compiles a function that converts a trusted JSON value of a param to the value
+    `BaseModel.from_dict` would give it, or returns None if the JSON value is used as
+    it is.
+
+    Dicts become the model they represent, built with `BaseModel.construct`, and
+    lists are converted element by element. Values that don't match the expected
+    type fall back to `BaseModel._from_dict_single_param`.
+    """
+    options = get_args(param_type) if get_origin(param_type) is Union else (param_type,)
+    models = [
+        option
+        for option in options
+        if isinstance(option, type)
+        and get_origin(option) is None
+        and issubclass(option, BaseModel)
+    ]
+    lists = [option for option in options if get_origin(option) is list]
+
+    def fallback(value: Any) -> Any:  # noqa: ANN401
+        return model_class._from_dict_single_param(param, param_type, value)
+
+    convert_dict: Optional[Callable[[Dict[str, Any]], Any]] = None
+    if len(models) == 1:
+        model = models[0]
+        convert_dict = lambda value: model.from_dict(value, trusted=True)  # noqa: E731
+    elif len(models) > 1:
+        # the first model that has all of the keys and all of its required fields,
+        # as `from_dict` would try them in order
+        def convert_dict(value: Dict[str, Any]) -> Any:  # noqa: ANN401
+            for model in models:
+                model_info = _get_model_info(model)
+                if model_info.class_types.keys() >= value.keys() and (
+                    model_info.required_fields <= value.keys()
+                ):
+                    return model.from_dict(value, trusted=True)
+            return fallback(value)
+
+    convert_list: Optional[Callable[[List[Any]], Any]] = None
+    if len(lists) == 1:
+        convert_element = _compile_trusted_conversion(
+            model_class, param, get_args(lists[0])[0]
+        )
+        if convert_element is not None:
+            convert_list = lambda value: [  # noqa: E731
+                convert_element(element) for element in value
+            ]
+    elif len(lists) > 1:
+        convert_list = fallback
+
+    if convert_dict is None and convert_list is None:
+        return None
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        if convert_dict is not None and isinstance(value, dict):
+            return convert_dict(value)
+        if convert_list is not None and isinstance(value, list):
+            return convert_list(value)
+        return value
+
+    return convert
+
+
+class _ModelInfo(NamedTuple):
+    """The type information of a model class, resolved once per class."""
+
+    class_types: Dict[str, Type[Any]]
+    """The type hints of the class."""
+
+    required_params: Tuple[str, ...]
+    """The params that must be set."""
+
+    type_checks: Dict[str, Callable[[Any], bool]]
+    """A compiled type check for each param, see `_compile_type_check`."""
+
+    trusted_conversions: Dict[str, Optional[Callable[[Any], Any]]]
+    """A compiled conversion for each param, see `_compile_trusted_conversion`."""
+
+    init_params: FrozenSet[str]
+    """The params that can be passed to the constructor."""
+
+    required_fields: FrozenSet[str]
+    """The fields that default to REQUIRED."""
+
+    defaults: Dict[str, Any]
+    """The default value of each init param that has one."""
+
+    default_factories: Tuple[Tuple[str, Callable[[], Any]], ...]
+    """The default factory of each field that has one."""
+
+
+@lru_cache(maxsize=None)
+def _get_model_info(cls: Type[BaseModel]) -> _ModelInfo:
+    # resolving type hints is slow and models are validated on every
+    # construction, so this is done once per class
+    class_types = get_type_hints(cls)
+    dataclass_fields = fields(cls)
+    return _ModelInfo(
+        class_types=class_types,
+        required_params=tuple(
+            attr for attr, value in class_types.items() if value is REQUIRED
+        ),
+        type_checks={
+            attr: _compile_type_check(expected_type)
+            for attr, expected_type in class_types.items()
+        },
+        trusted_conversions={
+            attr: _compile_trusted_conversion(cls, attr, expected_type)
+            for attr, expected_type in class_types.items()
+        },
+        init_params=frozenset(field.name for field in dataclass_fields if field.init),
+        required_fields=frozenset(
+            field.name for field in dataclass_fields if field.default is REQUIRED
+        ),
+        # fields that can't be passed to the constructor read their default from
+        # the class, like dataclasses do
+        defaults={
+            field.name: field.default
+            for field in dataclass_fields
+            if field.init and field.default is not MISSING
+        },
+        default_factories=tuple(
+            (field.name, field.default_factory)
+            for field in dataclass_fields
+            if field.default_factory is not MISSING
+        ),
+    )
+
+
 @dataclass(frozen=True)
 class BaseModel(ABC):
     """The base class for all model types."""
@@ -111,25 +360,50 @@ class BaseModel(ABC):
             True if dictionary is a ``dict`` representation of an instance of this
             class; False if not.
         """
-        return (
-            isinstance(dictionary, dict)
-            and set(get_type_hints(cls).keys()).issuperset(set(dictionary.keys()))
-            and all(
-                [
-                    attr in dictionary
-                    for attr, value in get_type_hints(cls).items()
-                    if value is REQUIRED
-                ]
-            )
+        if not isinstance(dictionary, dict):
+            return False
+        model_info = _get_model_info(cls)
+        return model_info.class_types.keys() >= dictionary.keys() and all(
+            attr in dictionary for attr in model_info.required_params
         )
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, XRPL_VALUE_TYPE]) -> Self:
+    def construct(cls: Type[Self], **kwargs: Any) -> Self:  # noqa: ANN401
+        """
+        Construct a new BaseModel without validating it.
+
+        Only use this for values that are already known to be valid, such as data
+        returned by a rippled node you trust. Nothing is checked or converted, so
+        nested models must already be model objects, and an invalid model may only
+        fail when it is serialized or submitted.
+
+        Args:
+            kwargs: The fields of the model. Fields that aren't given are set to their
+                defaults.
+
+        Returns:
+            A new BaseModel object with the given fields.
+        """
+        model_info = _get_model_info(cls)
+        model = cls.__new__(cls)
+        model.__dict__.update(model_info.defaults)
+        for name, default_factory in model_info.default_factories:
+            model.__dict__[name] = default_factory()
+        model.__dict__.update(kwargs)
+        return model
+
+    @classmethod
+    def from_dict(
+        cls: Type[Self], value: Dict[str, XRPL_VALUE_TYPE], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new BaseModel from a dictionary of parameters.
 
         Args:
             value: The value to construct the BaseModel from.
+            trusted: Whether value comes from a trusted source, such as a rippled node
+                you run. If so, the model and its nested models are built with
+                `construct`, without being validated. Defaults to False.
 
         Returns:
             A new BaseModel object, constructed using the given parameters.
@@ -137,8 +411,11 @@ class BaseModel(ABC):
         Raises:
             XRPLModelException: If the dictionary provided is invalid.
         """
+        if trusted:
+            return cls._from_trusted_dict(value)
+
         # returns a dictionary mapping class params to their types
-        class_types = get_type_hints(cls)
+        class_types = _get_model_info(cls).class_types
 
         args = {}
         for param in value:
@@ -154,6 +431,23 @@ class BaseModel(ABC):
         init = cls._get_only_init_args(args)
         return cls(**init)
 
+    @classmethod
+    def _from_trusted_dict(cls: Type[Self], value: Dict[str, XRPL_VALUE_TYPE]) -> Self:
+        """`from_dict` for trusted values."""
+        model_info = _get_model_info(cls)
+        conversions = model_info.trusted_conversions
+        init_params = model_info.init_params
+        args = {}
+        for param, param_value in value.items():
+            if param not in conversions:
+                raise XRPLModelException(
+                    f"{param} not a valid parameter for {cls.__name__}"
+                )
+            if param in init_params:
+                convert = conversions[param]
+                args[param] = param_value if convert is None else convert(param_value)
+        return cls.construct(**args)
+
     @classmethod
     def _from_dict_single_param(
         cls: Type[Self],
@@ -248,7 +542,7 @@ class BaseModel(ABC):
             value = json.loads(value)
 
         formatted_dict = {
-            _key_to_json(k): _value_to_json(v)
+            _JSON_KEYS.get(k) or _key_to_json(k): _value_to_json(v)
             for (k, v) in cast(Dict[str, XRPL_VALUE_TYPE], value).items()
         }
 
@@ -256,12 +550,14 @@ class BaseModel(ABC):
 
     @classmethod
     def _get_only_init_args(cls: Type[Self], args: Dict[str, Any]) -> Dict[str, Any]:
-        init_keys = {field.name for field in fields(cls) if field.init is True}
+        init_keys = _get_model_info(cls).init_params
         valid_args = {key: value for key, value in args.items() if key in init_keys}
         return valid_args
 
     @classmethod
-    def from_xrpl(cls: Type[Self], value: Union[str, Dict[str, Any]]) -> Self:
+    def from_xrpl(
+        cls: Type[Self], value: Union[str, Dict[str, Any]], *, trusted: bool = False
+    ) -> Self:
         """
         Creates a BaseModel object based on a JSON-like dictionary of keys in the JSON
         format used by the binary codec, or an actual JSON string representing the same
@@ -269,13 +565,16 @@ class BaseModel(ABC):
 
         Args:
             value: The dictionary or JSON string to be instantiated.
+            trusted: Whether value comes from a trusted source, such as a rippled node
+                you run. If so, the model is not validated, see `from_dict`. Defaults
+                to False.
 
         Returns:
             A BaseModel object instantiated from the input.
         """
         formatted_dict = cls._process_xrpl_json(value)
 
-        return cls.from_dict(formatted_dict)
+        return cls.from_dict(formatted_dict, trusted=trusted)
 
     def __post_init__(self: Self) -> None:
         """Called by dataclasses immediately after __init__."""
@@ -369,13 +668,16 @@ class BaseModel(ABC):
         Returns:
             Dictionary of any errors found on self.
         """
-        class_types = get_type_hints(self.__class__)
+        model_info = _get_model_info(self.__class__)
+        type_checks = model_info.type_checks
         result: Dict[str, str] = {}
         for attr, value in self.__dict__.items():
             if value is REQUIRED:
                 result[attr] = f"{attr} is not set"
-            else:
-                result.update(self._check_type(attr, value, class_types[attr]))
+            elif not type_checks[attr](value):
+                result.update(
+                    self._check_type(attr, value, model_info.class_types[attr])
+                )
         return result
 
     def to_dict(self: Self) -> Dict[str, Any]:
@@ -38,12 +38,16 @@ class XRP(BaseModel):
     currency: str = field(default="XRP", init=False)
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new XRP from a dictionary of parameters.
 
         Args:
             value: The value to construct the XRP from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new XRP object, constructed using the given parameters.
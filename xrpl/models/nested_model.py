@@ -45,12 +45,16 @@ class NestedModel(BaseModel):
         )
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new NestedModel from a dictionary of parameters.
 
         Args:
             value: The value to construct the NestedModel from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new NestedModel object, constructed using the given parameters.
@@ -59,8 +63,8 @@ class NestedModel(BaseModel):
             XRPLModelException: If the dictionary provided is invalid.
         """
         if _get_nested_name(cls) not in value:
-            return super().from_dict(value)
-        return super().from_dict(value[_get_nested_name(cls)])
+            return super().from_dict(value, trusted=trusted)
+        return super().from_dict(value[_get_nested_name(cls)], trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
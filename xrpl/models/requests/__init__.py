@@ -1,56 +1,124 @@
 """Request models."""
 
-from xrpl.models.auth_account import AuthAccount
-from xrpl.models.path import PathStep
-from xrpl.models.requests.account_channels import AccountChannels
-from xrpl.models.requests.account_currencies import AccountCurrencies
-from xrpl.models.requests.account_info import AccountInfo
-from xrpl.models.requests.account_lines import AccountLines
-from xrpl.models.requests.account_nfts import AccountNFTs
-from xrpl.models.requests.account_objects import AccountObjects, AccountObjectType
-from xrpl.models.requests.account_offers import AccountOffers
-from xrpl.models.requests.account_tx import AccountTx
-from xrpl.models.requests.amm_info import AMMInfo
-from xrpl.models.requests.book_offers import BookOffers
-from xrpl.models.requests.channel_authorize import ChannelAuthorize
-from xrpl.models.requests.channel_verify import ChannelVerify
-from xrpl.models.requests.deposit_authorized import DepositAuthorized
-from xrpl.models.requests.feature import Feature
-from xrpl.models.requests.fee import Fee
-from xrpl.models.requests.gateway_balances import GatewayBalances
-from xrpl.models.requests.generic_request import GenericRequest
-from xrpl.models.requests.get_aggregate_price import GetAggregatePrice
-from xrpl.models.requests.ledger import Ledger
-from xrpl.models.requests.ledger_closed import LedgerClosed
-from xrpl.models.requests.ledger_current import LedgerCurrent
-from xrpl.models.requests.ledger_data import LedgerData
-from xrpl.models.requests.ledger_entry import LedgerEntry, LedgerEntryType
-from xrpl.models.requests.manifest import Manifest
-from xrpl.models.requests.nft_buy_offers import NFTBuyOffers
-from xrpl.models.requests.nft_history import NFTHistory
-from xrpl.models.requests.nft_info import NFTInfo
-from xrpl.models.requests.nft_sell_offers import NFTSellOffers
-from xrpl.models.requests.nfts_by_issuer import NFTsByIssuer
-from xrpl.models.requests.no_ripple_check import NoRippleCheck, NoRippleCheckRole
-from xrpl.models.requests.path_find import PathFind, PathFindSubcommand
-from xrpl.models.requests.ping import Ping
-from xrpl.models.requests.random import Random
-from xrpl.models.requests.request import Request
-from xrpl.models.requests.ripple_path_find import RipplePathFind
-from xrpl.models.requests.server_definitions import ServerDefinitions
-from xrpl.models.requests.server_info import ServerInfo
-from xrpl.models.requests.server_state import ServerState
-from xrpl.models.requests.sign import Sign
-from xrpl.models.requests.sign_and_submit import SignAndSubmit
-from xrpl.models.requests.sign_for import SignFor
-from xrpl.models.requests.simulate import Simulate
-from xrpl.models.requests.submit import Submit
-from xrpl.models.requests.submit_multisigned import SubmitMultisigned
-from xrpl.models.requests.submit_only import SubmitOnly
-from xrpl.models.requests.subscribe import StreamParameter, Subscribe, SubscribeBook
-from xrpl.models.requests.transaction_entry import TransactionEntry
-from xrpl.models.requests.tx import Tx
-from xrpl.models.requests.unsubscribe import Unsubscribe
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from typing_extensions import Final
+
+if TYPE_CHECKING:
+    from xrpl.models.auth_account import AuthAccount
+    from xrpl.models.path import PathStep
+    from xrpl.models.requests.account_channels import AccountChannels
+    from xrpl.models.requests.account_currencies import AccountCurrencies
+    from xrpl.models.requests.account_info import AccountInfo
+    from xrpl.models.requests.account_lines import AccountLines
+    from xrpl.models.requests.account_nfts import AccountNFTs
+    from xrpl.models.requests.account_objects import AccountObjects, AccountObjectType
+    from xrpl.models.requests.account_offers import AccountOffers
+    from xrpl.models.requests.account_tx import AccountTx
+    from xrpl.models.requests.amm_info import AMMInfo
+    from xrpl.models.requests.book_offers import BookOffers
+    from xrpl.models.requests.channel_authorize import ChannelAuthorize
+    from xrpl.models.requests.channel_verify import ChannelVerify
+    from xrpl.models.requests.deposit_authorized import DepositAuthorized
+    from xrpl.models.requests.feature import Feature
+    from xrpl.models.requests.fee import Fee
+    from xrpl.models.requests.gateway_balances import GatewayBalances
+    from xrpl.models.requests.generic_request import GenericRequest
+    from xrpl.models.requests.get_aggregate_price import GetAggregatePrice
+    from xrpl.models.requests.ledger import Ledger
+    from xrpl.models.requests.ledger_closed import LedgerClosed
+    from xrpl.models.requests.ledger_current import LedgerCurrent
+    from xrpl.models.requests.ledger_data import LedgerData
+    from xrpl.models.requests.ledger_entry import LedgerEntry, LedgerEntryType
+    from xrpl.models.requests.manifest import Manifest
+    from xrpl.models.requests.nft_buy_offers import NFTBuyOffers
+    from xrpl.models.requests.nft_history import NFTHistory
+    from xrpl.models.requests.nft_info import NFTInfo
+    from xrpl.models.requests.nft_sell_offers import NFTSellOffers
+    from xrpl.models.requests.nfts_by_issuer import NFTsByIssuer
+    from xrpl.models.requests.no_ripple_check import NoRippleCheck, NoRippleCheckRole
+    from xrpl.models.requests.path_find import PathFind, PathFindSubcommand
+    from xrpl.models.requests.ping import Ping
+    from xrpl.models.requests.random import Random
+    from xrpl.models.requests.request import Request
+    from xrpl.models.requests.ripple_path_find import RipplePathFind
+    from xrpl.models.requests.server_definitions import ServerDefinitions
+    from xrpl.models.requests.server_info import ServerInfo
+    from xrpl.models.requests.server_state import ServerState
+    from xrpl.models.requests.sign import Sign
+    from xrpl.models.requests.sign_and_submit import SignAndSubmit
+    from xrpl.models.requests.sign_for import SignFor
+    from xrpl.models.requests.simulate import Simulate
+    from xrpl.models.requests.submit import Submit
+    from xrpl.models.requests.submit_multisigned import SubmitMultisigned
+    from xrpl.models.requests.submit_only import SubmitOnly
+    from xrpl.models.requests.subscribe import StreamParameter, Subscribe, SubscribeBook
+    from xrpl.models.requests.transaction_entry import TransactionEntry
+    from xrpl.models.requests.tx import Tx
+    from xrpl.models.requests.unsubscribe import Unsubscribe
+
+# Models are imported on first access (PEP 562), since importing every model takes
+# most of the time of importing xrpl.
+_LAZY_IMPORTS: Final[Dict[str, str]] = {
+    "AccountChannels": ".account_channels",
+    "AccountCurrencies": ".account_currencies",
+    "AccountInfo": ".account_info",
+    "AccountLines": ".account_lines",
+    "AccountNFTs": ".account_nfts",
+    "AccountObjects": ".account_objects",
+    "AccountObjectType": ".account_objects",
+    "AccountOffers": ".account_offers",
+    "AccountTx": ".account_tx",
+    "AMMInfo": ".amm_info",
+    "AuthAccount": "xrpl.models.auth_account",
+    "BookOffers": ".book_offers",
+    "ChannelAuthorize": ".channel_authorize",
+    "ChannelVerify": ".channel_verify",
+    "DepositAuthorized": ".deposit_authorized",
+    "Feature": ".feature",
+    "Fee": ".fee",
+    "GatewayBalances": ".gateway_balances",
+    "GenericRequest": ".generic_request",
+    "GetAggregatePrice": ".get_aggregate_price",
+    "Ledger": ".ledger",
+    "LedgerClosed": ".ledger_closed",
+    "LedgerCurrent": ".ledger_current",
+    "LedgerData": ".ledger_data",
+    "LedgerEntry": ".ledger_entry",
+    "LedgerEntryType": ".ledger_entry",
+    "Manifest": ".manifest",
+    "NFTBuyOffers": ".nft_buy_offers",
+    "NFTHistory": ".nft_history",
+    "NFTInfo": ".nft_info",
+    "NFTsByIssuer": ".nfts_by_issuer",
+    "NFTSellOffers": ".nft_sell_offers",
+    "NoRippleCheck": ".no_ripple_check",
+    "NoRippleCheckRole": ".no_ripple_check",
+    "PathFind": ".path_find",
+    "PathFindSubcommand": ".path_find",
+    "PathStep": "xrpl.models.path",
+    "Ping": ".ping",
+    "Random": ".random",
+    "Request": ".request",
+    "RipplePathFind": ".ripple_path_find",
+    "ServerDefinitions": ".server_definitions",
+    "ServerInfo": ".server_info",
+    "ServerState": ".server_state",
+    "Sign": ".sign",
+    "SignAndSubmit": ".sign_and_submit",
+    "SignFor": ".sign_for",
+    "Simulate": ".simulate",
+    "StreamParameter": ".subscribe",
+    "Submit": ".submit",
+    "SubmitMultisigned": ".submit_multisigned",
+    "SubmitOnly": ".submit_only",
+    "Subscribe": ".subscribe",
+    "SubscribeBook": ".subscribe",
+    "TransactionEntry": ".transaction_entry",
+    "Tx": ".tx",
+    "Unsubscribe": ".unsubscribe",
+}
 
 __all__ = [
     "AccountChannels",
@@ -111,3 +179,21 @@ __all__ = [
     "Tx",
     "Unsubscribe",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        # only a missing submodule means a missing attribute, not a failing import
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -45,13 +45,17 @@ class GenericRequest(Request):
             object.__setattr__(self, key, value)
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new GenericRequest from a dictionary of parameters. Also converts
         from JSON and WS formatting.
 
         Args:
             value: The value to construct the GenericRequest from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new GenericRequest object, constructed using the given parameters.
@@ -119,12 +119,16 @@ class Request(BaseModel):
     """
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Request from a dictionary of parameters.
 
         Args:
             value: The value to construct the Request from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Request object, constructed using the given parameters.
@@ -138,7 +142,7 @@ class Request(BaseModel):
             if "method" not in value:
                 raise XRPLModelException("Request does not include method.")
             correct_type = cls.get_method(value["method"])
-            return correct_type.from_dict(value)  # type: ignore
+            return correct_type.from_dict(value, trusted=trusted)  # type: ignore
 
         if "method" in value:
             method = value["method"]
@@ -157,7 +161,7 @@ class Request(BaseModel):
             value = {**value}
             del value["method"]
 
-        return super(Request, cls).from_dict(value)
+        return super(Request, cls).from_dict(value, trusted=trusted)
 
     @classmethod
     def get_method(cls: Type[Self], method: str) -> Type[Request]:
@@ -68,12 +68,16 @@ class Sign(Request):
     fee_div_max: int = 1
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Sign from a dictionary of parameters.
 
         Args:
             value: The value to construct the Sign from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Sign object, constructed using the given parameters.
@@ -86,7 +90,7 @@ class Sign(Request):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super(Sign, cls).from_dict(fixed_value)
+        return super(Sign, cls).from_dict(fixed_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
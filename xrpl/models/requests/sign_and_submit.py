@@ -77,12 +77,16 @@ class SignAndSubmit(Submit):
     fee_div_max: int = 1
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new SignAndSubmit from a dictionary of parameters.
 
         Args:
             value: The value to construct the SignAndSubmit from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new SignAndSubmit object, constructed using the given parameters.
@@ -95,7 +99,7 @@ class SignAndSubmit(Submit):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super().from_dict(fixed_value)
+        return super().from_dict(fixed_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
@@ -59,12 +59,16 @@ class SignFor(Request):
     key_type: Optional[CryptoAlgorithm] = None
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new SignFor from a dictionary of parameters.
 
         Args:
             value: The value to construct the SignFor from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new SignFor object, constructed using the given parameters.
@@ -77,7 +81,7 @@ class SignFor(Request):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super().from_dict(fixed_value)
+        return super().from_dict(fixed_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
@@ -59,12 +59,16 @@ class Simulate(Request):
         return errors
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Simulate from a dictionary of parameters.
 
         Args:
             value: The value to construct the Simulate from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Simulate object, constructed using the given parameters.
@@ -84,7 +88,7 @@ class Simulate(Request):
             del fixed_value["tx_json"]
         else:
             fixed_value = value
-        return super().from_dict(fixed_value)
+        return super().from_dict(fixed_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
@@ -62,12 +62,16 @@ class Submit(Request):
     method: RequestMethod = field(default=RequestMethod.SUBMIT, init=False)
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Submit from a dictionary of parameters.
 
         Args:
             value: The value to construct the Submit from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Submit object, constructed using the given parameters.
@@ -79,6 +83,6 @@ class Submit(Request):
 
         if cls.__name__ == "Submit":
             if "tx_blob" in value:
-                return SubmitOnly.from_dict(value)  # type: ignore
-            return SignAndSubmit.from_dict(value)  # type: ignore
-        return super(Submit, cls).from_dict(value)
+                return SubmitOnly.from_dict(value, trusted=trusted)  # type: ignore
+            return SignAndSubmit.from_dict(value, trusted=trusted)  # type: ignore
+        return super(Submit, cls).from_dict(value, trusted=trusted)
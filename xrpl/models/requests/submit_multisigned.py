@@ -45,12 +45,16 @@ class SubmitMultisigned(Request):
     fail_hard: bool = False
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new SubmitMultisigned object from a dictionary of parameters.
 
         Args:
             value: The value to construct the SubmitMultisigned from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new SubmitMultisigned object, constructed using the given parameters.
@@ -58,7 +62,7 @@ class SubmitMultisigned(Request):
         fixed_value = {**value}
         if "TransactionType" in fixed_value["tx_json"]:  # xrpl format
             fixed_value["tx_json"] = Transaction.from_xrpl(fixed_value["tx_json"])
-        return super().from_dict(fixed_value)
+        return super().from_dict(fixed_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
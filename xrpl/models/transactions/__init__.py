@@ -3,125 +3,236 @@ Model objects for specific `types of Transactions
 <https://xrpl.org/transaction-types.html>`_ in the XRP Ledger.
 """
 
-from xrpl.models.transactions.account_delete import AccountDelete
-from xrpl.models.transactions.account_set import (
-    AccountSet,
-    AccountSetAsfFlag,
-    AccountSetFlag,
-    AccountSetFlagInterface,
-)
-from xrpl.models.transactions.amm_bid import AMMBid, AuthAccount
-from xrpl.models.transactions.amm_clawback import AMMClawback
-from xrpl.models.transactions.amm_create import AMMCreate
-from xrpl.models.transactions.amm_delete import AMMDelete
-from xrpl.models.transactions.amm_deposit import (
-    AMMDeposit,
-    AMMDepositFlag,
-    AMMDepositFlagInterface,
-)
-from xrpl.models.transactions.amm_vote import AMMVote
-from xrpl.models.transactions.amm_withdraw import (
-    AMMWithdraw,
-    AMMWithdrawFlag,
-    AMMWithdrawFlagInterface,
-)
-from xrpl.models.transactions.batch import Batch, BatchFlag, BatchFlagInterface
-from xrpl.models.transactions.check_cancel import CheckCancel
-from xrpl.models.transactions.check_cash import CheckCash
-from xrpl.models.transactions.check_create import CheckCreate
-from xrpl.models.transactions.clawback import Clawback
-from xrpl.models.transactions.credential_accept import CredentialAccept
-from xrpl.models.transactions.credential_create import CredentialCreate
-from xrpl.models.transactions.credential_delete import CredentialDelete
-from xrpl.models.transactions.delegate_set import DelegateSet, GranularPermission
-from xrpl.models.transactions.deposit_preauth import DepositPreauth
-from xrpl.models.transactions.did_delete import DIDDelete
-from xrpl.models.transactions.did_set import DIDSet
-from xrpl.models.transactions.escrow_cancel import EscrowCancel
-from xrpl.models.transactions.escrow_create import EscrowCreate
-from xrpl.models.transactions.escrow_finish import EscrowFinish
-from xrpl.models.transactions.metadata import TransactionMetadata
-from xrpl.models.transactions.mptoken_authorize import (
-    MPTokenAuthorize,
-    MPTokenAuthorizeFlag,
-    MPTokenAuthorizeFlagInterface,
-)
-from xrpl.models.transactions.mptoken_issuance_create import (
-    MPTokenIssuanceCreate,
-    MPTokenIssuanceCreateFlag,
-    MPTokenIssuanceCreateFlagInterface,
-)
-from xrpl.models.transactions.mptoken_issuance_destroy import MPTokenIssuanceDestroy
-from xrpl.models.transactions.mptoken_issuance_set import (
-    MPTokenIssuanceSet,
-    MPTokenIssuanceSetFlag,
-    MPTokenIssuanceSetFlagInterface,
-)
-from xrpl.models.transactions.nftoken_accept_offer import NFTokenAcceptOffer
-from xrpl.models.transactions.nftoken_burn import NFTokenBurn
-from xrpl.models.transactions.nftoken_cancel_offer import NFTokenCancelOffer
-from xrpl.models.transactions.nftoken_create_offer import (
-    NFTokenCreateOffer,
-    NFTokenCreateOfferFlag,
-    NFTokenCreateOfferFlagInterface,
-)
-from xrpl.models.transactions.nftoken_mint import (
-    NFTokenMint,
-    NFTokenMintFlag,
-    NFTokenMintFlagInterface,
-)
-from xrpl.models.transactions.nftoken_modify import NFTokenModify
-from xrpl.models.transactions.offer_cancel import OfferCancel
-from xrpl.models.transactions.offer_create import (
-    OfferCreate,
-    OfferCreateFlag,
-    OfferCreateFlagInterface,
-)
-from xrpl.models.transactions.oracle_delete import OracleDelete
-from xrpl.models.transactions.oracle_set import OracleSet
-from xrpl.models.transactions.payment import Payment, PaymentFlag, PaymentFlagInterface
-from xrpl.models.transactions.payment_channel_claim import (
-    PaymentChannelClaim,
-    PaymentChannelClaimFlag,
-    PaymentChannelClaimFlagInterface,
-)
-from xrpl.models.transactions.payment_channel_create import PaymentChannelCreate
-from xrpl.models.transactions.payment_channel_fund import PaymentChannelFund
-from xrpl.models.transactions.permissioned_domain_delete import PermissionedDomainDelete
-from xrpl.models.transactions.permissioned_domain_set import PermissionedDomainSet
-from xrpl.models.transactions.set_regular_key import SetRegularKey
-from xrpl.models.transactions.signer_list_set import SignerEntry, SignerListSet
-from xrpl.models.transactions.ticket_create import TicketCreate
-from xrpl.models.transactions.transaction import (
-    Memo,
-    Signer,
-    Transaction,
-    TransactionFlag,
-    TransactionFlagInterface,
-)
-from xrpl.models.transactions.trust_set import (
-    TrustSet,
-    TrustSetFlag,
-    TrustSetFlagInterface,
-)
-from xrpl.models.transactions.xchain_account_create_commit import (
-    XChainAccountCreateCommit,
-)
-from xrpl.models.transactions.xchain_add_account_create_attestation import (
-    XChainAddAccountCreateAttestation,
-)
-from xrpl.models.transactions.xchain_add_claim_attestation import (
-    XChainAddClaimAttestation,
-)
-from xrpl.models.transactions.xchain_claim import XChainClaim
-from xrpl.models.transactions.xchain_commit import XChainCommit
-from xrpl.models.transactions.xchain_create_bridge import XChainCreateBridge
-from xrpl.models.transactions.xchain_create_claim_id import XChainCreateClaimID
-from xrpl.models.transactions.xchain_modify_bridge import (
-    XChainModifyBridge,
-    XChainModifyBridgeFlag,
-    XChainModifyBridgeFlagInterface,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from typing_extensions import Final
+
+if TYPE_CHECKING:
+    from xrpl.models.transactions.account_delete import AccountDelete
+    from xrpl.models.transactions.account_set import (
+        AccountSet,
+        AccountSetAsfFlag,
+        AccountSetFlag,
+        AccountSetFlagInterface,
+    )
+    from xrpl.models.transactions.amm_bid import AMMBid, AuthAccount
+    from xrpl.models.transactions.amm_clawback import AMMClawback
+    from xrpl.models.transactions.amm_create import AMMCreate
+    from xrpl.models.transactions.amm_delete import AMMDelete
+    from xrpl.models.transactions.amm_deposit import (
+        AMMDeposit,
+        AMMDepositFlag,
+        AMMDepositFlagInterface,
+    )
+    from xrpl.models.transactions.amm_vote import AMMVote
+    from xrpl.models.transactions.amm_withdraw import (
+        AMMWithdraw,
+        AMMWithdrawFlag,
+        AMMWithdrawFlagInterface,
+    )
+    from xrpl.models.transactions.batch import Batch, BatchFlag, BatchFlagInterface
+    from xrpl.models.transactions.check_cancel import CheckCancel
+    from xrpl.models.transactions.check_cash import CheckCash
+    from xrpl.models.transactions.check_create import CheckCreate
+    from xrpl.models.transactions.clawback import Clawback
+    from xrpl.models.transactions.credential_accept import CredentialAccept
+    from xrpl.models.transactions.credential_create import CredentialCreate
+    from xrpl.models.transactions.credential_delete import CredentialDelete
+    from xrpl.models.transactions.delegate_set import DelegateSet, GranularPermission
+    from xrpl.models.transactions.deposit_preauth import DepositPreauth
+    from xrpl.models.transactions.did_delete import DIDDelete
+    from xrpl.models.transactions.did_set import DIDSet
+    from xrpl.models.transactions.escrow_cancel import EscrowCancel
+    from xrpl.models.transactions.escrow_create import EscrowCreate
+    from xrpl.models.transactions.escrow_finish import EscrowFinish
+    from xrpl.models.transactions.metadata import TransactionMetadata
+    from xrpl.models.transactions.mptoken_authorize import (
+        MPTokenAuthorize,
+        MPTokenAuthorizeFlag,
+        MPTokenAuthorizeFlagInterface,
+    )
+    from xrpl.models.transactions.mptoken_issuance_create import (
+        MPTokenIssuanceCreate,
+        MPTokenIssuanceCreateFlag,
+        MPTokenIssuanceCreateFlagInterface,
+    )
+    from xrpl.models.transactions.mptoken_issuance_destroy import MPTokenIssuanceDestroy
+    from xrpl.models.transactions.mptoken_issuance_set import (
+        MPTokenIssuanceSet,
+        MPTokenIssuanceSetFlag,
+        MPTokenIssuanceSetFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_accept_offer import NFTokenAcceptOffer
+    from xrpl.models.transactions.nftoken_burn import NFTokenBurn
+    from xrpl.models.transactions.nftoken_cancel_offer import NFTokenCancelOffer
+    from xrpl.models.transactions.nftoken_create_offer import (
+        NFTokenCreateOffer,
+        NFTokenCreateOfferFlag,
+        NFTokenCreateOfferFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_mint import (
+        NFTokenMint,
+        NFTokenMintFlag,
+        NFTokenMintFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_modify import NFTokenModify
+    from xrpl.models.transactions.offer_cancel import OfferCancel
+    from xrpl.models.transactions.offer_create import (
+        OfferCreate,
+        OfferCreateFlag,
+        OfferCreateFlagInterface,
+    )
+    from xrpl.models.transactions.oracle_delete import OracleDelete
+    from xrpl.models.transactions.oracle_set import OracleSet
+    from xrpl.models.transactions.payment import (
+        Payment,
+        PaymentFlag,
+        PaymentFlagInterface,
+    )
+    from xrpl.models.transactions.payment_channel_claim import (
+        PaymentChannelClaim,
+        PaymentChannelClaimFlag,
+        PaymentChannelClaimFlagInterface,
+    )
+    from xrpl.models.transactions.payment_channel_create import PaymentChannelCreate
+    from xrpl.models.transactions.payment_channel_fund import PaymentChannelFund
+    from xrpl.models.transactions.permissioned_domain_delete import (
+        PermissionedDomainDelete,
+    )
+    from xrpl.models.transactions.permissioned_domain_set import PermissionedDomainSet
+    from xrpl.models.transactions.set_regular_key import SetRegularKey
+    from xrpl.models.transactions.signer_list_set import SignerEntry, SignerListSet
+    from xrpl.models.transactions.ticket_create import TicketCreate
+    from xrpl.models.transactions.transaction import (
+        Memo,
+        Signer,
+        Transaction,
+        TransactionFlag,
+        TransactionFlagInterface,
+    )
+    from xrpl.models.transactions.trust_set import (
+        TrustSet,
+        TrustSetFlag,
+        TrustSetFlagInterface,
+    )
+    from xrpl.models.transactions.xchain_account_create_commit import (
+        XChainAccountCreateCommit,
+    )
+    from xrpl.models.transactions.xchain_add_account_create_attestation import (
+        XChainAddAccountCreateAttestation,
+    )
+    from xrpl.models.transactions.xchain_add_claim_attestation import (
+        XChainAddClaimAttestation,
+    )
+    from xrpl.models.transactions.xchain_claim import XChainClaim
+    from xrpl.models.transactions.xchain_commit import XChainCommit
+    from xrpl.models.transactions.xchain_create_bridge import XChainCreateBridge
+    from xrpl.models.transactions.xchain_create_claim_id import XChainCreateClaimID
+    from xrpl.models.transactions.xchain_modify_bridge import (
+        XChainModifyBridge,
+        XChainModifyBridgeFlag,
+        XChainModifyBridgeFlagInterface,
+    )
+
+# Models are imported on first access (PEP 562), since importing every model takes
+# most of the time of importing xrpl.
+_LAZY_IMPORTS: Final[Dict[str, str]] = {
+    "AccountDelete": ".account_delete",
+    "AccountSet": ".account_set",
+    "AccountSetAsfFlag": ".account_set",
+    "AccountSetFlag": ".account_set",
+    "AccountSetFlagInterface": ".account_set",
+    "AMMBid": ".amm_bid",
+    "AMMClawback": ".amm_clawback",
+    "AMMCreate": ".amm_create",
+    "AMMDelete": ".amm_delete",
+    "AMMDeposit": ".amm_deposit",
+    "AMMDepositFlag": ".amm_deposit",
+    "AMMDepositFlagInterface": ".amm_deposit",
+    "AMMVote": ".amm_vote",
+    "AMMWithdraw": ".amm_withdraw",
+    "AMMWithdrawFlag": ".amm_withdraw",
+    "AMMWithdrawFlagInterface": ".amm_withdraw",
+    "AuthAccount": ".amm_bid",
+    "Batch": ".batch",
+    "BatchFlag": ".batch",
+    "BatchFlagInterface": ".batch",
+    "CheckCancel": ".check_cancel",
+    "CheckCash": ".check_cash",
+    "CheckCreate": ".check_create",
+    "Clawback": ".clawback",
+    "CredentialAccept": ".credential_accept",
+    "CredentialCreate": ".credential_create",
+    "CredentialDelete": ".credential_delete",
+    "DelegateSet": ".delegate_set",
+    "DepositPreauth": ".deposit_preauth",
+    "DIDDelete": ".did_delete",
+    "DIDSet": ".did_set",
+    "EscrowCancel": ".escrow_cancel",
+    "EscrowCreate": ".escrow_create",
+    "EscrowFinish": ".escrow_finish",
+    "GranularPermission": ".delegate_set",
+    "Memo": ".transaction",
+    "MPTokenAuthorize": ".mptoken_authorize",
+    "MPTokenAuthorizeFlag": ".mptoken_authorize",
+    "MPTokenAuthorizeFlagInterface": ".mptoken_authorize",
+    "MPTokenIssuanceCreate": ".mptoken_issuance_create",
+    "MPTokenIssuanceCreateFlag": ".mptoken_issuance_create",
+    "MPTokenIssuanceCreateFlagInterface": ".mptoken_issuance_create",
+    "MPTokenIssuanceDestroy": ".mptoken_issuance_destroy",
+    "MPTokenIssuanceSet": ".mptoken_issuance_set",
+    "MPTokenIssuanceSetFlag": ".mptoken_issuance_set",
+    "MPTokenIssuanceSetFlagInterface": ".mptoken_issuance_set",
+    "NFTokenAcceptOffer": ".nftoken_accept_offer",
+    "NFTokenBurn": ".nftoken_burn",
+    "NFTokenCancelOffer": ".nftoken_cancel_offer",
+    "NFTokenCreateOffer": ".nftoken_create_offer",
+    "NFTokenCreateOfferFlag": ".nftoken_create_offer",
+    "NFTokenCreateOfferFlagInterface": ".nftoken_create_offer",
+    "NFTokenMint": ".nftoken_mint",
+    "NFTokenMintFlag": ".nftoken_mint",
+    "NFTokenMintFlagInterface": ".nftoken_mint",
+    "NFTokenModify": ".nftoken_modify",
+    "OfferCancel": ".offer_cancel",
+    "OfferCreate": ".offer_create",
+    "OfferCreateFlag": ".offer_create",
+    "OfferCreateFlagInterface": ".offer_create",
+    "OracleDelete": ".oracle_delete",
+    "OracleSet": ".oracle_set",
+    "Payment": ".payment",
+    "PaymentChannelClaim": ".payment_channel_claim",
+    "PaymentChannelClaimFlag": ".payment_channel_claim",
+    "PaymentChannelClaimFlagInterface": ".payment_channel_claim",
+    "PaymentChannelCreate": ".payment_channel_create",
+    "PaymentChannelFund": ".payment_channel_fund",
+    "PaymentFlag": ".payment",
+    "PaymentFlagInterface": ".payment",
+    "PermissionedDomainDelete": ".permissioned_domain_delete",
+    "PermissionedDomainSet": ".permissioned_domain_set",
+    "SetRegularKey": ".set_regular_key",
+    "Signer": ".transaction",
+    "SignerEntry": ".signer_list_set",
+    "SignerListSet": ".signer_list_set",
+    "TicketCreate": ".ticket_create",
+    "Transaction": ".transaction",
+    "TransactionFlag": ".transaction",
+    "TransactionFlagInterface": ".transaction",
+    "TransactionMetadata": ".metadata",
+    "TrustSet": ".trust_set",
+    "TrustSetFlag": ".trust_set",
+    "TrustSetFlagInterface": ".trust_set",
+    "XChainAccountCreateCommit": ".xchain_account_create_commit",
+    "XChainAddAccountCreateAttestation": ".xchain_add_account_create_attestation",
+    "XChainAddClaimAttestation": ".xchain_add_claim_attestation",
+    "XChainClaim": ".xchain_claim",
+    "XChainCommit": ".xchain_commit",
+    "XChainCreateBridge": ".xchain_create_bridge",
+    "XChainCreateClaimID": ".xchain_create_claim_id",
+    "XChainModifyBridge": ".xchain_modify_bridge",
+    "XChainModifyBridgeFlag": ".xchain_modify_bridge",
+    "XChainModifyBridgeFlagInterface": ".xchain_modify_bridge",
+}
 
 __all__ = [
     "AccountDelete",
@@ -219,3 +330,21 @@ __all__ = [
     "XChainModifyBridgeFlag",
     "XChainModifyBridgeFlagInterface",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        # only a missing submodule means a missing attribute, not a failing import
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -120,12 +120,16 @@ class Batch(Transaction):
         return errors
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Batch from a dictionary of parameters.
 
         Args:
             value: The value to construct the Batch from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Batch object, constructed using the given parameters.
@@ -142,7 +146,7 @@ class Batch(Transaction):
             )
             for tx in value["raw_transactions"]
         ]
-        return super(Transaction, cls).from_dict(new_value)
+        return super(Transaction, cls).from_dict(new_value, trusted=trusted)
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
@@ -5,11 +5,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from hashlib import sha512
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 
 from typing_extensions import Final, Self
 
-from xrpl.core.binarycodec import decode, encode
+from xrpl.core.binarycodec import decode, encode, encode_bytes
 from xrpl.models.amounts import IssuedCurrencyAmount
 from xrpl.models.amounts.mpt_amount import MPTAmount
 from xrpl.models.base_model import ABBREVIATIONS, BaseModel
@@ -26,7 +36,16 @@ from xrpl.models.transactions.types import PseudoTransactionType, TransactionTyp
 from xrpl.models.types import XRPL_VALUE_TYPE
 from xrpl.models.utils import KW_ONLY_DATACLASS, require_kwargs_on_init
 
+if TYPE_CHECKING:
+    from xrpl.core.binarycodec import Definitions
+
 _TRANSACTION_HASH_PREFIX: Final[int] = 0x54584E00
+_TRANSACTION_TYPE_NAMES: Final[FrozenSet[str]] = frozenset(
+    transaction_type.value for transaction_type in TransactionType
+)
+_PSEUDO_TRANSACTION_TYPE_NAMES: Final[FrozenSet[str]] = frozenset(
+    transaction_type.value for transaction_type in PseudoTransactionType
+)
 
 
 def transaction_json_to_binary_codec_form(
@@ -44,11 +63,31 @@ def transaction_json_to_binary_codec_form(
     """
     # This method should be made private when it is removed from `xrpl.transactions`
     return {
-        _key_to_tx_json(key): _value_to_tx_json(value)
+        _TX_JSON_KEYS.get(key) or _key_to_tx_json(key): _value_to_tx_json(value)
         for (key, value) in dictionary.items()
     }
 
 
+def get_hash_from_bytes(tx_bytes: bytes) -> str:
+    """
+    Hashes an encoded transaction as the ledger does.
+
+    Args:
+        tx_bytes: The signed transaction, encoded in the XRPL's binary format.
+
+    Returns:
+        The hash of the transaction.
+    """
+    prefix = _TRANSACTION_HASH_PREFIX.to_bytes(4, byteorder="big")
+    return sha512(prefix + tx_bytes).digest().hex().upper()[:64]
+
+
+# Maps each snake_case model field name to its PascalCase XRPL field name, such as
+# "destination_tag" to "DestinationTag", for `to_xrpl`. The keys are limited to the
+# fields declared on the models, so the dict never needs eviction.
+_TX_JSON_KEYS: Dict[str, str] = {}
+
+
 def _key_to_tx_json(key: str) -> str:
     """
     Transforms snake_case to PascalCase. For example:
@@ -57,6 +96,14 @@ def _key_to_tx_json(key: str) -> str:
 
     Known abbreviations (example 2 above) need to be enumerated in ABBREVIATIONS.
     """
+    tx_json_key = _TX_JSON_KEYS.get(key)
+    if tx_json_key is None:
+        tx_json_key = _TX_JSON_KEYS[key] = _compute_key_to_tx_json(key)
+    return tx_json_key
+
+
+def _compute_key_to_tx_json(key: str) -> str:
+    """Uncached `_key_to_tx_json`."""
     return "".join(
         [
             ABBREVIATIONS[word] if word in ABBREVIATIONS else word.capitalize()
@@ -349,22 +396,31 @@ class Transaction(BaseModel):
         """
         return transaction_json_to_binary_codec_form(self.to_dict())
 
-    def blob(self: Self) -> str:
+    def blob(self: Self, definitions: Optional[Definitions] = None) -> str:
         """
         Creates the canonical binary format of the Transaction object.
 
+        Args:
+            definitions: The definitions to encode with, such as those of a network
+                with amendments that xrpl-py doesn't know about yet. Defaults to the
+                definitions bundled with xrpl-py.
+
         Returns:
             The binary-encoded object, as a hexadecimal string.
         """
-        return encode(self.to_xrpl())
+        return encode(self.to_xrpl(), definitions)
 
     @classmethod
-    def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
+    def from_dict(
+        cls: Type[Self], value: Dict[str, Any], *, trusted: bool = False
+    ) -> Self:
         """
         Construct a new Transaction from a dictionary of parameters.
 
         Args:
             value: The value to construct the Transaction from.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A new Transaction object, constructed using the given parameters.
@@ -379,7 +435,7 @@ class Transaction(BaseModel):
                     "Transaction does not include transaction_type."
                 )
             correct_type = cls.get_transaction_type(value["transaction_type"])
-            return correct_type.from_dict(value)  # type: ignore
+            return correct_type.from_dict(value, trusted=trusted)  # type: ignore
         else:
             if "transaction_type" in value:
                 if value["transaction_type"] != cls.__name__:
@@ -390,7 +446,7 @@ class Transaction(BaseModel):
                     )
                 value = {**value}
                 del value["transaction_type"]
-            return super().from_dict(value)
+            return super().from_dict(value, trusted=trusted)
 
     def has_flag(self: Self, flag: int) -> bool:
         """
@@ -457,9 +513,7 @@ class Transaction(BaseModel):
             raise XRPLModelException(
                 "Cannot get the hash from an unsigned Transaction."
             )
-        prefix = hex(_TRANSACTION_HASH_PREFIX)[2:].upper()
-        encoded_str = bytes.fromhex(prefix + encode(self.to_xrpl()))
-        return sha512(encoded_str).digest().hex().upper()[:64]
+        return get_hash_from_bytes(encode_bytes(self.to_xrpl()))
 
     @classmethod
     def get_transaction_type(
@@ -480,19 +534,17 @@ class Transaction(BaseModel):
         import xrpl.models.transactions as transaction_models
         import xrpl.models.transactions.pseudo_transactions as pseudo_transaction_models
 
-        transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(transaction_models, t)
-            for t in transaction_models.types.TransactionType
-        }
-        if transaction_type in transaction_types:
-            return transaction_types[transaction_type]
-
-        pseudo_transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(pseudo_transaction_models, t)
-            for t in transaction_models.types.PseudoTransactionType
-        }
-        if transaction_type in pseudo_transaction_types:
-            return pseudo_transaction_types[transaction_type]
+        # only the model of the requested type is imported, since the models are
+        # imported lazily
+        if transaction_type in _TRANSACTION_TYPE_NAMES:
+            return cast(
+                Type[Transaction], getattr(transaction_models, transaction_type)
+            )
+        if transaction_type in _PSEUDO_TRANSACTION_TYPE_NAMES:
+            return cast(
+                Type[Transaction],
+                getattr(pseudo_transaction_models, transaction_type),
+            )
 
         raise XRPLModelException(f"{transaction_type} is not a valid Transaction type")
 
@@ -510,7 +562,9 @@ class Transaction(BaseModel):
         return Transaction.from_xrpl(decode(tx_blob))
 
     @classmethod
-    def from_xrpl(cls: Type[Self], value: Union[str, Dict[str, Any]]) -> Self:
+    def from_xrpl(
+        cls: Type[Self], value: Union[str, Dict[str, Any]], *, trusted: bool = False
+    ) -> Self:
         """
         Creates a Transaction object based on a JSON or JSON-string representation of
         data
@@ -519,6 +573,8 @@ class Transaction(BaseModel):
 
         Args:
             value: The dictionary or JSON string to be instantiated.
+            trusted: Whether value comes from a trusted source, and is not
+                validated. See `BaseModel.from_dict`.
 
         Returns:
             A Transaction object instantiated from the input.
@@ -548,4 +604,4 @@ class Transaction(BaseModel):
             # nor is it supported in the serialization operations.
             del processed_value["deliver_max"]
 
-        return cls.from_dict(processed_value)
+        return cls.from_dict(processed_value, trusted=trusted)
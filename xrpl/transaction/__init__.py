@@ -1,6 +1,7 @@
 """Methods for working with transactions on the XRP Ledger."""
 
 from xrpl.asyncio.transaction import (
+    SignedTransaction,
     XRPLReliableSubmissionException,
     transaction_json_to_binary_codec_form,
 )
@@ -12,24 +13,31 @@ from xrpl.transaction.main import (
     autofill,
     autofill_and_sign,
     sign,
+    sign_and_encode,
     sign_and_submit,
     simulate,
     submit,
 )
-from xrpl.transaction.multisign import multisign
+from xrpl.transaction.multisign import multisign, sign_for_signers
 from xrpl.transaction.reliable_submission import submit_and_wait
+from xrpl.transaction.template import RenderedTransaction, TransactionTemplate
 
 __all__ = [
     "autofill",
     "autofill_and_sign",
     "combine_batch_signers",
     "multisign",
+    "RenderedTransaction",
     "sign",
+    "sign_and_encode",
     "sign_and_submit",
+    "sign_for_signers",
     "sign_multiaccount_batch",
     "simulate",
     "submit",
     "submit_and_wait",
+    "SignedTransaction",
+    "TransactionTemplate",
     "transaction_json_to_binary_codec_form",
     "XRPLReliableSubmissionException",
 ]
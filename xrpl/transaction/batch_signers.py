@@ -4,7 +4,7 @@ from typing import List, Union, cast
 
 from xrpl.constants import XRPLException
 from xrpl.core.addresscodec.codec import decode_classic_address
-from xrpl.core.binarycodec import encode, encode_for_signing_batch
+from xrpl.core.binarycodec import encode, encode_bytes_for_signing_batch
 from xrpl.core.binarycodec.main import BatchSigningDict
 from xrpl.core.keypairs import sign
 from xrpl.models.transactions import Batch, Signer, Transaction
@@ -43,7 +43,7 @@ def sign_multiaccount_batch(
             account=wallet.address,
             signing_pub_key=wallet.public_key,
             txn_signature=sign(
-                encode_for_signing_batch(fields_to_sign), wallet.private_key
+                encode_bytes_for_signing_batch(fields_to_sign), wallet.private_key
             ),
         )
         batch_signer = BatchSigner(account=wallet.address, signers=[signer])
@@ -52,7 +52,7 @@ def sign_multiaccount_batch(
             account=wallet.address,
             signing_pub_key=wallet.public_key,
             txn_signature=sign(
-                encode_for_signing_batch(fields_to_sign), wallet.private_key
+                encode_bytes_for_signing_batch(fields_to_sign), wallet.private_key
             ),
         )
 
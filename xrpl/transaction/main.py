@@ -79,6 +79,7 @@ def submit(
 
 
 sign = main.sign
+sign_and_encode = main.sign_and_encode
 
 
 def autofill_and_sign(
@@ -1,12 +1,18 @@
 """Multisign transaction methods with XRPL transactions."""
 
-from typing import List
+from typing import Any, Dict, List, Sequence, Union
 
+from xrpl.asyncio.transaction.main import _prepare_transaction
 from xrpl.core.addresscodec import decode_classic_address
+from xrpl.core.binarycodec import encode_bytes_for_multisigning_many
+from xrpl.core.keypairs import sign
 from xrpl.models.transactions.transaction import Signer, Transaction
+from xrpl.wallet import Wallet
 
 
-def multisign(transaction: Transaction, tx_list: List[Transaction]) -> Transaction:
+def multisign(
+    transaction: Transaction, tx_list: Sequence[Union[Transaction, Signer]]
+) -> Transaction:
     """
     Takes several transactions with Signer fields and creates a
     single transaction with all Signers that then gets signed and returned.
@@ -14,22 +20,71 @@ def multisign(transaction: Transaction, tx_list: List[Transaction]) -> Transacti
     Args:
         transaction: the transaction to be multisigned.
         tx_list: a list of signed transactions to combine into a single multisigned
-            transaction.
+            transaction. Signers, such as those returned by `sign_for_signers`, can
+            be passed instead of transactions.
 
     Returns:
         The multisigned transaction.
     """
-    decoded_tx_signers = [tx.to_xrpl()["Signers"][0]["Signer"] for tx in tx_list]
+    signers = [
+        tx if isinstance(tx, Signer) else _get_signer(tx.to_xrpl()["Signers"][0])
+        for tx in tx_list
+    ]
 
     tx_dict = transaction.to_dict()
-    tx_dict["signers"] = [
+    tx_dict["signers"] = sorted(
+        signers, key=lambda signer: decode_classic_address(signer.account)
+    )
+
+    return Transaction.from_dict(tx_dict)
+
+
+def sign_for_signers(
+    transaction: Transaction, wallets: Sequence[Wallet], *, workers: int = 0
+) -> List[Signer]:
+    """
+    Signs a transaction for a multisignature transaction with several wallets at
+    once. The transaction is only encoded once for all of the wallets.
+
+    Args:
+        transaction: the transaction to be signed.
+        wallets: the wallets with which to sign the transaction.
+        workers: if greater than 0, compute the signatures in parallel in this many
+            worker processes. Defaults to 0 (sign in this process).
+
+    Returns:
+        The Signers, sorted in the order required by the XRPL, ready to be passed to
+        `multisign`.
+    """
+    signing_payloads = encode_bytes_for_multisigning_many(
+        _prepare_transaction(transaction), [wallet.address for wallet in wallets]
+    )
+    private_keys = [wallet.private_key for wallet in wallets]
+    if workers > 0:
+        # imported here since multiprocessing is slow to import and rarely needed
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            signatures = list(executor.map(sign, signing_payloads, private_keys))
+    else:
+        signatures = list(map(sign, signing_payloads, private_keys))
+
+    signers = [
         Signer(
-            account=decoded_tx_signer["Account"],
-            txn_signature=decoded_tx_signer["TxnSignature"],
-            signing_pub_key=decoded_tx_signer["SigningPubKey"],
+            account=wallet.address,
+            txn_signature=signature,
+            signing_pub_key=wallet.public_key,
         )
-        for decoded_tx_signer in decoded_tx_signers
+        for wallet, signature in zip(wallets, signatures)
     ]
-    tx_dict["signers"].sort(key=lambda signer: decode_classic_address(signer.account))
+    signers.sort(key=lambda signer: decode_classic_address(signer.account))
+    return signers
 
-    return Transaction.from_dict(tx_dict)
+
+def _get_signer(signer_json: Dict[str, Any]) -> Signer:
+    decoded_tx_signer = signer_json["Signer"]
+    return Signer(
+        account=decoded_tx_signer["Account"],
+        txn_signature=decoded_tx_signer["TxnSignature"],
+        signing_pub_key=decoded_tx_signer["SigningPubKey"],
+    )
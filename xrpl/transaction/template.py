@@ -0,0 +1,199 @@
+"""Templates for quickly signing many transactions that differ in a few fields."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Tuple
+
+from typing_extensions import Final, Self
+
+from xrpl.asyncio.transaction.main import _prepare_transaction
+from xrpl.constants import XRPLException
+from xrpl.core.addresscodec import is_valid_xaddress
+from xrpl.core.binarycodec import encode_bytes
+from xrpl.core.binarycodec.binary_wrappers import BinaryParser
+from xrpl.core.binarycodec.definitions import FieldInstance, get_field_instance
+from xrpl.core.binarycodec.main import _TRANSACTION_SIGNATURE_PREFIX
+from xrpl.core.binarycodec.types import STObject
+from xrpl.core.keypairs import sign
+from xrpl.models.base_model import BaseModel
+from xrpl.models.transactions.transaction import (
+    Transaction,
+    get_hash_from_bytes,
+    transaction_json_to_binary_codec_form,
+)
+from xrpl.wallet import Wallet
+
+# fields that identify the transaction and its signer, so can't be rendered
+_FIXED_FIELDS: Final[Tuple[str, ...]] = (
+    "transaction_type",
+    "account",
+    "signing_pub_key",
+    "txn_signature",
+    "signers",
+)
+_TXN_SIGNATURE: Final[FieldInstance] = get_field_instance("TxnSignature")
+
+# a patch replaces the bytes between two offsets of the template's encoding with
+# the encoding of a field, given by its ordinal
+_Patch = Tuple[int, int, int, bytes]
+
+
+@dataclass(frozen=True)
+class RenderedTransaction:
+    """A transaction rendered and signed from a `TransactionTemplate`."""
+
+    signing_payload: bytes
+    """The bytes that were signed."""
+
+    tx_blob: str
+    """The signed transaction in the XRPL's binary format, ready to submit."""
+
+    hash: str
+    """The hash of the signed transaction, which identifies it on the ledger."""
+
+
+class TransactionTemplate:
+    """
+    A transaction encoded once, whose fields can then be changed without
+    re-encoding the fields that stay the same. This is useful to sign many
+    transactions that only differ in a few fields, such as `sequence`, `amount`,
+    `destination_tag`, `last_ledger_sequence` or `fee`.
+
+    The transaction is validated when the template is created. The values passed
+    to `render` are only checked by the binary codec.
+    """
+
+    def __init__(self: Self, transaction: Transaction, wallet: Wallet) -> None:
+        """
+        Create a template from a transaction.
+
+        Args:
+            transaction: The transaction to build the template from.
+            wallet: The wallet with which rendered transactions are signed.
+
+        Raises:
+            XRPLException: If the transaction has fields that aren't signed, such as
+                `signers` or `batch_signers`.
+        """
+        transaction_json = _prepare_transaction(transaction)
+        transaction_json["SigningPubKey"] = wallet.public_key
+        for field_name in transaction_json:
+            if not get_field_instance(field_name).is_signing:
+                raise XRPLException(
+                    f"Cannot create a template from a transaction with {field_name}."
+                )
+
+        self._wallet = wallet
+        self._model_fields = {
+            field.name for field in fields(transaction) if field.init
+        }.difference(_FIXED_FIELDS)
+        self._encoded = encode_bytes(transaction_json)
+
+        # the canonical order and byte offsets of the encoded fields
+        self._ordinals: List[int] = []
+        self._offsets: Dict[int, Tuple[int, int]] = {}
+        parser = BinaryParser.from_bytes(self._encoded)
+        total_length = len(parser)
+        while not parser.is_end():
+            start = total_length - len(parser)
+            field = parser.read_field()
+            parser.skip_field_value(field)
+            self._ordinals.append(field.ordinal)
+            self._offsets[field.ordinal] = (start, total_length - len(parser))
+
+    def render(self: Self, **field_values: Any) -> RenderedTransaction:  # noqa: ANN401
+        """
+        Render and sign a transaction from this template.
+
+        Args:
+            field_values: The fields to change, named as in the transaction model,
+                such as ``sequence=5`` or ``amount="1000"``. Fields not in the
+                template are added, and fields set to None are removed. Addresses
+                must be classic addresses and flags must be integers.
+
+        Returns:
+            The signing payload, the signed blob and the hash of the transaction.
+
+        Raises:
+            XRPLException: If a field can't be changed, such as `account`, or is
+                given an X-Address.
+        """
+        patches = [
+            self._patch_field(field_name, value)
+            for field_name, value in field_values.items()
+        ]
+        signing_payload = _TRANSACTION_SIGNATURE_PREFIX + self._apply(patches)
+        signature = sign(signing_payload, self._wallet.private_key)
+
+        signature_bytes = bytearray()
+        STObject.write_from_value(signature_bytes, {_TXN_SIGNATURE.name: signature})
+        signature_offset = self._insertion_offset(_TXN_SIGNATURE.ordinal)
+        tx_bytes = self._apply(
+            [
+                *patches,
+                (
+                    signature_offset,
+                    signature_offset,
+                    _TXN_SIGNATURE.ordinal,
+                    bytes(signature_bytes),
+                ),
+            ]
+        )
+        return RenderedTransaction(
+            signing_payload=signing_payload,
+            tx_blob=tx_bytes.hex().upper(),
+            hash=get_hash_from_bytes(tx_bytes),
+        )
+
+    def _patch_field(self: Self, field_name: str, value: Any) -> _Patch:  # noqa: ANN401
+        if field_name not in self._model_fields:
+            raise XRPLException(f"Cannot render the `{field_name}` field.")
+        if isinstance(value, str) and is_valid_xaddress(value):
+            raise XRPLException("Rendered fields must use classic addresses.")
+        value = _to_dict_value(value)
+        ((xrpl_field_name, xrpl_value),) = transaction_json_to_binary_codec_form(
+            {field_name: value}
+        ).items()
+        field = get_field_instance(xrpl_field_name)
+
+        if field.ordinal in self._offsets:
+            start, end = self._offsets[field.ordinal]
+        else:
+            start = end = self._insertion_offset(field.ordinal)
+        if value is None:
+            return start, end, field.ordinal, b""
+        field_bytes = bytearray()
+        STObject.write_from_value(field_bytes, {xrpl_field_name: xrpl_value})
+        return start, end, field.ordinal, bytes(field_bytes)
+
+    def _insertion_offset(self: Self, ordinal: int) -> int:
+        index = bisect_left(self._ordinals, ordinal)
+        if index == len(self._ordinals):
+            return len(self._encoded)
+        return self._offsets[self._ordinals[index]][0]
+
+    def _apply(self: Self, patches: List[_Patch]) -> bytes:
+        encoded = self._encoded
+        sink = bytearray()
+        position = 0
+        # fields added at the same offset are written in canonical order, before
+        # the field they are inserted in front of
+        for start, end, _, field_bytes in sorted(
+            patches, key=lambda patch: (patch[0], patch[2])
+        ):
+            sink += encoded[position:start]
+            sink += field_bytes
+            position = end
+        sink += encoded[position:]
+        return bytes(sink)
+
+
+# models can be nested in lists at any depth, e.g. the PathSteps of `paths`
+def _to_dict_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict_value(item) for item in value]
+    return value
@@ -1,7 +1,29 @@
 """Methods for working with XRPL wallets."""
 
-from xrpl.asyncio.wallet import XRPLFaucetException
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from xrpl.wallet.main import Wallet
-from xrpl.wallet.wallet_generation import generate_faucet_wallet
+
+if TYPE_CHECKING:
+    from xrpl.asyncio.wallet import XRPLFaucetException  # noqa: F401
+    from xrpl.wallet.wallet_generation import generate_faucet_wallet  # noqa: F401
+
+# The faucet helpers need the network clients, so they're imported on first access
+# (PEP 562) to keep `Wallet` quick to import.
+_LAZY_IMPORTS = {
+    "XRPLFaucetException": "xrpl.asyncio.wallet",
+    "generate_faucet_wallet": "xrpl.wallet.wallet_generation",
+}
 
 __all__ = ["Wallet", "generate_faucet_wallet", "XRPLFaucetException"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})